@@ -1,3 +1,11 @@
-from django.contrib import admin
+from src.apps.common.paginators import EstimatedCountPaginator
 
-# Register your models here.
+
+class LargeTableAdminMixin:
+    """
+    Changelist settings for tables with millions of rows: estimated counts,
+    no second unfiltered ``COUNT(*)`` and a date hierarchy built from MIN/MAX.
+    """
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    change_list_template = 'admin/large_table/change_list.html'
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CommonConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'src.apps.common'
+
+    def ready(self):
+        from src.apps.common import checks  # noqa: F401
@@ -0,0 +1,36 @@
+from rest_framework_simplejwt import authentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+
+_jwt_authentication = authentication.JWTAuthentication()
+
+
+def validated_token(request):
+    """
+    The valid JWT sent with ``request`` (a Django ``HttpRequest``), or
+    ``None`` when there is none or it does not validate. The token is only
+    validated once per request, however many middlewares ask.
+    """
+    if not hasattr(request, '_validated_jwt'):
+        token = None
+        header = _jwt_authentication.get_header(request)
+        raw_token = None if header is None else _jwt_authentication.get_raw_token(header)
+        if raw_token is not None:
+            try:
+                token = _jwt_authentication.get_validated_token(raw_token)
+            except (InvalidToken, TokenError):
+                pass
+        request._validated_jwt = token
+    return request._validated_jwt
+
+
+class JWTAuthentication(authentication.JWTAuthentication):
+    """
+    simplejwt's authentication reusing a token the middlewares have already
+    validated; requests without one are authenticated, or rejected, as usual.
+    """
+
+    def authenticate(self, request):
+        token = getattr(request._request, '_validated_jwt', None)
+        if token is None:
+            return super().authenticate(request)
+        return self.get_user(token), token
@@ -0,0 +1,30 @@
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+
+from src.apps.common.routers import replica_aliases
+
+PROCESS_LOCAL_CACHES = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+@register(Tags.caches, Tags.database)
+def check_sticky_primary_cache(app_configs, **kwargs):
+    """
+    With replicas, a JWT client's read-after-write window lives in
+    ``DATABASE_STICKY_PRIMARY_CACHE``; a cache of one process only keeps it
+    on the worker that handled the write.
+    """
+    if not replica_aliases():
+        return []
+    alias = settings.DATABASE_STICKY_PRIMARY_CACHE
+    backend = settings.CACHES.get(alias, {}).get('BACKEND')
+    if backend is None or backend in PROCESS_LOCAL_CACHES:
+        return [Error(
+            f'DATABASE_STICKY_PRIMARY_CACHE ({alias!r}) must be a cache shared by all workers '
+            f'when read replicas are configured.',
+            hint='Point it at a Redis or Memcached cache in CACHES.',
+            id='common.E001',
+        )]
+    return []
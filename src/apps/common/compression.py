@@ -0,0 +1,144 @@
+import zlib
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+
+class Codec:
+    name: str = None
+    default_level: int = None
+
+    @property
+    def available(self):
+        return True
+
+    def compress(self, data: bytes, level: int = None) -> bytes:
+        compressor = self.compressor(level)
+        return compressor.compress(data) + compressor.finish()
+
+    def compressor(self, level: int = None):
+        raise NotImplementedError
+
+
+class GzipCompressor:
+    def __init__(self, level):
+        # wbits=31 selects the gzip container
+        self._compressobj = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, chunk):
+        return self._compressobj.compress(chunk)
+
+    def flush(self):
+        return self._compressobj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self._compressobj.flush(zlib.Z_FINISH)
+
+
+class GzipCodec(Codec):
+    name = 'gzip'
+    default_level = 6
+
+    def compressor(self, level=None):
+        return GzipCompressor(self.default_level if level is None else level)
+
+
+class BrotliCompressor:
+    def __init__(self, level):
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, chunk):
+        return self._compressor.process(chunk)
+
+    def flush(self):
+        return self._compressor.flush()
+
+    def finish(self):
+        return self._compressor.finish()
+
+
+class BrotliCodec(Codec):
+    name = 'br'
+    default_level = 4  # the high levels are far too slow for dynamic responses
+
+    @property
+    def available(self):
+        return brotli is not None
+
+    def compressor(self, level=None):
+        return BrotliCompressor(self.default_level if level is None else level)
+
+
+class ZstdCompressor:
+    def __init__(self, level):
+        self._compressobj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, chunk):
+        return self._compressobj.compress(chunk)
+
+    def flush(self):
+        return self._compressobj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self):
+        return self._compressobj.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+class ZstdCodec(Codec):
+    name = 'zstd'
+    default_level = 3
+
+    @property
+    def available(self):
+        return zstandard is not None
+
+    def compressor(self, level=None):
+        return ZstdCompressor(self.default_level if level is None else level)
+
+
+CODECS = {codec.name: codec for codec in (ZstdCodec(), BrotliCodec(), GzipCodec())}
+
+
+def parse_accept_encoding(header: str) -> dict:
+    """Map each coding in an ``Accept-Encoding`` header to its q-value."""
+    accepted = {}
+    for item in header.split(','):
+        coding, _, params = item.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(';'):
+            key, _, value = param.strip().partition('=')
+            if key.strip() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding] = quality
+    return accepted
+
+
+def negotiate(header: str, preference) -> Codec:
+    """
+    Pick the codec for a request: highest client q-value first, server
+    ``preference`` order to break ties. ``None`` means send it uncompressed.
+    """
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get('*', 0.0)
+
+    best, best_quality = None, 0.0
+    for name in preference:
+        codec = CODECS.get(name)
+        if codec is None or not codec.available:
+            continue
+        quality = accepted.get(name, wildcard)
+        if quality > best_quality:
+            best, best_quality = codec, quality
+    return best
@@ -0,0 +1,107 @@
+import hashlib
+import zlib
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.http import HttpResponse
+from django.utils import timezone
+
+from src.apps.common.models import IdempotencyKey
+
+
+def request_fingerprint(request):
+    """Hash of what makes two requests "the same": method, full path and body."""
+    digest = hashlib.sha256()
+    digest.update(request.method.encode())
+    digest.update(b'\0')
+    digest.update(request.get_full_path().encode())
+    digest.update(b'\0')
+    if request.content_type == 'multipart/form-data':
+        # uploads are not buffered into memory just to be hashed
+        digest.update(request.META.get('CONTENT_LENGTH', '').encode())
+    else:
+        digest.update(request.body)
+    return digest.hexdigest()
+
+
+def claim(scope, key, fingerprint):
+    """
+    Insert an in-progress record for ``(scope, key)``. Returns ``(record,
+    True)`` if this request should run, or the existing ``(record, False)``
+    when another request got there first. Expired records and records left
+    behind by a crashed request are replaced; a record that disappears
+    between the insert and the lookup (released by the request that owned
+    it) is claimed again.
+    """
+    while True:
+        now = timezone.now()
+        try:
+            with transaction.atomic():
+                record = IdempotencyKey.objects.create(
+                    scope=scope,
+                    key=key,
+                    fingerprint=fingerprint,
+                    created_at=now,
+                    expires_at=now + settings.IDEMPOTENCY_KEY_TTL,
+                )
+            return record, True
+        except IntegrityError:
+            pass
+
+        record = IdempotencyKey.objects.filter(scope=scope, key=key).first()
+        if record is None:
+            continue
+        stale = record.status_code is None and record.created_at <= now - settings.IDEMPOTENCY_LOCK_TIMEOUT
+        if record.expires_at > now and not stale:
+            return record, False
+        IdempotencyKey.objects.filter(pk=record.pk, created_at=record.created_at).delete()
+
+
+def store(record, response):
+    """
+    Keep ``response`` for replay. Streams, server errors and transient answers
+    (timeouts, conflicts, throttling) release the key so a retry runs again.
+    """
+    if (
+        response.streaming
+        or response.status_code >= 500
+        or response.status_code in settings.IDEMPOTENCY_RETRYABLE_STATUS_CODES
+    ):
+        release(record)
+        return
+
+    IdempotencyKey.objects.filter(pk=record.pk).update(
+        status_code=response.status_code,
+        content_type=response.get('Content-Type', ''),
+        location=response.get('Location', ''),
+        body=zlib.compress(response.content) if response.content else b'',
+    )
+
+
+def release(record):
+    IdempotencyKey.objects.filter(pk=record.pk, status_code__isnull=True).delete()
+
+
+def replay(record):
+    body = bytes(record.body)
+    response = HttpResponse(
+        zlib.decompress(body) if body else b'',
+        status=record.status_code,
+        content_type=record.content_type or None,
+    )
+    if record.location:
+        response['Location'] = record.location
+    response['Idempotent-Replayed'] = 'true'
+    return response
+
+
+def prune(batch_size=1000):
+    """Delete expired records in batches; returns how many were removed."""
+    removed = 0
+    while True:
+        ids = list(
+            IdempotencyKey.objects.filter(expires_at__lte=timezone.now()).values_list('pk', flat=True)[:batch_size]
+        )
+        if not ids:
+            return removed
+        removed += IdempotencyKey.objects.filter(pk__in=ids).delete()[0]
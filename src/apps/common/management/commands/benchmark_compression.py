@@ -0,0 +1,98 @@
+import json
+import random
+import time
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from src.apps.common.compression import CODECS
+from src.apps.common.middleware import StreamCompressor
+
+
+def room_payload(count, rng):
+    amenities = [
+        {'id': i, 'name': name, 'icon': None, 'description': f'{name} in the room'}
+        for i, name in enumerate(['Wi-Fi', 'TV', 'Balcony', 'Bathtub', 'Air Conditioning', 'Pet friendly'], 1)
+    ]
+    return [
+        {
+            'id': i,
+            'title': f'Room {i}',
+            'description': f'This is room number {i} on floor {i // 20 + 1}',
+            'price_per_night': str(Decimal(rng.randint(5000, 30000)) / 100),
+            'status': rng.choice(['free', 'busy', 'operated']),
+            'category': {'id': i % 5 + 1, 'name': 'Deluxe', 'description': 'Spacious room with additional amenities'},
+            'amenities': rng.sample(amenities, rng.randint(1, len(amenities))),
+            'images': [{'id': i * 2, 'image': f'http://localhost:8000/media/room_images/room{i}.jpg'}],
+        }
+        for i in range(count)
+    ]
+
+
+class Command(BaseCommand):
+    help = 'Measure CPU cost against bytes saved for every available response codec.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='5,100,2000', help='Comma-separated room counts per payload.')
+        parser.add_argument('--repeat', type=int, default=20)
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        repeat = options['repeat']
+
+        self.stdout.write(
+            f'{"payload":>10} {"codec":>6} {"level":>5} {"ratio":>6} {"saved":>10} '
+            f'{"ms/op":>8} {"MB/s":>8} {"us/KB saved":>12}'
+        )
+
+        for count in map(int, options['sizes'].split(',')):
+            body = json.dumps(room_payload(count, rng)).encode()
+
+            for codec in CODECS.values():
+                if not codec.available:
+                    self.stdout.write(f'{len(body):>10} {codec.name:>6} not installed')
+                    continue
+
+                level = settings.COMPRESSION_LEVELS.get(codec.name, codec.default_level)
+                for candidate in sorted({1, level, codec.default_level}):
+                    self.report(body, codec, candidate, repeat)
+
+            self.report_stream(body, repeat)
+
+    def report(self, body, codec, level, repeat):
+        started = time.process_time()
+        for _ in range(repeat):
+            compressed = codec.compress(body, level)
+        elapsed = (time.process_time() - started) / repeat
+
+        saved = len(body) - len(compressed)
+        self.stdout.write(
+            f'{len(body):>10} {codec.name:>6} {level:>5} {len(body) / len(compressed):>6.2f} {saved:>10} '
+            f'{elapsed * 1000:>8.3f} {len(body) / elapsed / 2 ** 20:>8.1f} '
+            f'{elapsed * 1e6 / max(saved / 1024, 1e-9):>12.2f}'
+        )
+
+    def report_stream(self, body, repeat):
+        """Compare chunked streaming output with whole-body output for the default codec."""
+        lines = [line + b'\n' for line in body.split(b'}, {')]
+        for name in settings.COMPRESSION_ENCODINGS:
+            codec = CODECS[name]
+            if codec.available:
+                break
+        else:
+            return
+
+        level = settings.COMPRESSION_LEVELS.get(codec.name)
+        started = time.process_time()
+        for _ in range(repeat):
+            stream = StreamCompressor(codec, level)
+            size = sum(len(stream.compress(line)) for line in lines) + len(stream.finish())
+        elapsed = (time.process_time() - started) / repeat
+
+        self.stdout.write(
+            f'{len(body):>10} {codec.name + "~":>6} {level:>5} {len(body) / size:>6.2f} {len(body) - size:>10} '
+            f'{elapsed * 1000:>8.3f} {len(body) / elapsed / 2 ** 20:>8.1f}   '
+            f'(streamed in {len(lines)} chunks)'
+        )
@@ -0,0 +1,62 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# a cold worker: import the WSGI application, then serve one request through it
+FIRST_REQUEST_SCRIPT = '''
+import json, sys, time
+started = time.perf_counter()
+from src.config.wsgi import application
+from django.conf import settings
+booted = time.perf_counter()
+
+from wsgiref.util import setup_testing_defaults
+environ = {'PATH_INFO': sys.argv[1], 'HTTP_HOST': (settings.ALLOWED_HOSTS or ['localhost'])[0]}
+setup_testing_defaults(environ)
+status = []
+body = b''.join(application(environ, lambda value, headers, exc_info=None: status.append(value)))
+done = time.perf_counter()
+print(json.dumps({'status': status[0], 'boot': booted - started, 'request': done - booted}))
+'''
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure cold start: start a fresh interpreter, load the WSGI '
+        'application and serve its first request, several times over.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=10)
+        parser.add_argument('--path', default='/api/v1/rooms/', help='Path of the first request.')
+
+    def handle(self, *args, **options):
+        runs = []
+        for _ in range(options['runs']):
+            started = time.perf_counter()
+            completed = subprocess.run(
+                [sys.executable, '-c', FIRST_REQUEST_SCRIPT, options['path']],
+                cwd=settings.BASE_DIR, env=os.environ.copy(), capture_output=True, text=True,
+            )
+            total = time.perf_counter() - started
+            if completed.returncode:
+                self.stderr.write(completed.stderr)
+                return
+            result = json.loads(completed.stdout.strip().splitlines()[-1])
+            runs.append((total, result['boot'], result['request']))
+
+        self.stdout.write(f'{options["runs"]} cold starts of GET {options["path"]} ({result["status"]})')
+        self.stdout.write(f'{"":>22} {"median ms":>10} {"min ms":>8} {"max ms":>8}')
+        for label, values in zip(
+            ('time to first response', 'wsgi application load', 'first request'), zip(*runs),
+        ):
+            self.stdout.write(
+                f'{label:>22} {statistics.median(values) * 1000:>10.1f} '
+                f'{min(values) * 1000:>8.1f} {max(values) * 1000:>8.1f}'
+            )
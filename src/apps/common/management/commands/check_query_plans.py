@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from src.apps.common.query_plans import discover_hot_queries, explain, full_scans
+
+
+class Command(BaseCommand):
+    help = (
+        'Run EXPLAIN for every registered hot query and fail if any of them '
+        'falls back to a full table scan.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('names', nargs='*', help='Only check these hot queries.')
+        parser.add_argument('--show-plans', action='store_true', help='Print every plan, not only failing ones.')
+
+    def handle(self, *args, **options):
+        queries = discover_hot_queries()
+        names = options['names'] or sorted(queries)
+
+        unknown = set(names) - set(queries)
+        if unknown:
+            raise CommandError(f'Unknown hot queries: {", ".join(sorted(unknown))}')
+
+        failures = []
+        for name in names:
+            plan = explain(queries[name]())
+            scans = full_scans(plan)
+
+            if scans:
+                failures.append(name)
+                self.stdout.write(self.style.ERROR(f'{name}: full scan of {", ".join(scans)}'))
+            else:
+                self.stdout.write(self.style.SUCCESS(f'{name}: ok'))
+
+            if scans or options['show_plans']:
+                for line in plan:
+                    self.stdout.write(f'    {line}')
+
+        if failures:
+            raise CommandError(f'{len(failures)} hot queries fall back to a full scan: {", ".join(failures)}')
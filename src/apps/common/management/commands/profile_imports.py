@@ -0,0 +1,60 @@
+import os
+import re
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# what a worker imports before it can serve: settings, apps, URLconf and so every view
+BOOT_SCRIPT = '''
+import django
+from django.conf import settings
+from django.urls import get_resolver
+django.setup()
+get_resolver(settings.ROOT_URLCONF).url_patterns
+'''
+
+LINE_RE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+class Command(BaseCommand):
+    help = (
+        'Boot the project in a fresh interpreter under "python -X importtime" '
+        'and list the imports that cost the most.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, default=25)
+        parser.add_argument(
+            '--sort', choices=['cumulative', 'self'], default='cumulative',
+            help='Cumulative time includes the imports a module triggers.',
+        )
+        parser.add_argument('--top-level', action='store_true', help='Only list modules imported at top level.')
+
+    def handle(self, *args, **options):
+        completed = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', BOOT_SCRIPT],
+            cwd=settings.BASE_DIR, env=os.environ.copy(), capture_output=True, text=True,
+        )
+        if completed.returncode:
+            self.stderr.write(completed.stderr)
+            return
+
+        imports = []
+        for line in completed.stderr.splitlines():
+            match = LINE_RE.match(line)
+            if match:
+                own, cumulative, indent, module = match.groups()
+                imports.append((int(own), int(cumulative), (len(indent) - 1) // 2, module))
+
+        total = sum(own for own, _, _, _ in imports)
+        if options['top_level']:
+            imports = [item for item in imports if item[2] == 0]
+        key = 0 if options['sort'] == 'self' else 1
+        imports.sort(key=lambda item: item[key], reverse=True)
+
+        self.stdout.write(f'{"self ms":>9} {"cumul ms":>9}  module')
+        for own, cumulative, depth, module in imports[:options['top']]:
+            self.stdout.write(f'{own / 1000:>9.1f} {cumulative / 1000:>9.1f}  {"  " * depth}{module}')
+        self.stdout.write(f'{len(imports)} modules, {total / 1000:.1f} ms importing in total.')
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from src.apps.common.idempotency import prune
+
+
+class Command(BaseCommand):
+    help = 'Delete stored Idempotency-Key responses past IDEMPOTENCY_KEY_TTL. Run it from cron.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        removed = prune(batch_size=options['batch_size'])
+        self.stdout.write(f'Removed {removed} expired idempotency keys.')
@@ -0,0 +1,41 @@
+import mimetypes
+import os
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponse
+from django.utils.cache import patch_cache_control
+from django.utils.http import content_disposition_header
+
+
+def protected_file_response(file, as_attachment=False):
+    """
+    Response for a media file the caller has already been authorized to read.
+
+    Behind nginx or Apache the transfer is handed to the web server through
+    ``X-Accel-Redirect``/``X-Sendfile`` so no worker copies file bytes; without
+    ``PROTECTED_MEDIA_SERVER`` (development) Django streams the file itself.
+    """
+    filename = os.path.basename(file.name)
+    server = settings.PROTECTED_MEDIA_SERVER
+
+    if server == 'nginx':
+        response = HttpResponse()
+        response['X-Accel-Redirect'] = settings.PROTECTED_MEDIA_INTERNAL_URL + quote(file.name)
+    elif server == 'apache':
+        response = HttpResponse()
+        response['X-Sendfile'] = file.path
+    else:
+        try:
+            handle = file.open('rb')
+        except FileNotFoundError:
+            raise Http404('File not found.')
+        response = FileResponse(handle, as_attachment=as_attachment, filename=filename)
+
+    if server:
+        content_type, _ = mimetypes.guess_type(filename)
+        response['Content-Type'] = content_type or 'application/octet-stream'
+        response['Content-Disposition'] = content_disposition_header(as_attachment, filename)
+
+    patch_cache_control(response, private=True, max_age=settings.PROTECTED_MEDIA_MAX_AGE)
+    return response
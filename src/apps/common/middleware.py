@@ -0,0 +1,256 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.http import JsonResponse
+from django.utils.cache import patch_vary_headers
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from src.apps.common import idempotency, routers
+from src.apps.common.authentication import validated_token
+from src.apps.common.compression import negotiate
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with the best of zstd, brotli or gzip that the client
+    accepts. Small bodies and media types that are already compressed are
+    sent as is; streaming responses are compressed and flushed chunk by chunk
+    so consumers still receive data as it is produced.
+
+    Responses under ``COMPRESSION_EXCLUDED_PATHS`` are never compressed: they
+    carry credentials, and compressing a secret next to attacker-influenced
+    input leaks it through the compressed length (BREACH).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        return self.process_response(request, response)
+
+    def process_response(self, request, response):
+        if response.has_header('Content-Encoding'):
+            return response
+
+        if request.path.startswith(tuple(settings.COMPRESSION_EXCLUDED_PATHS)):
+            return response
+
+        if not self.is_compressible(response):
+            return response
+
+        if not response.streaming and len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        codec = negotiate(request.META.get('HTTP_ACCEPT_ENCODING', ''), settings.COMPRESSION_ENCODINGS)
+        if codec is None:
+            return response
+
+        level = settings.COMPRESSION_LEVELS.get(codec.name)
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = self.compress_async_stream(response.streaming_content, codec, level)
+            else:
+                response.streaming_content = self.compress_stream(response.streaming_content, codec, level)
+            del response.headers['Content-Length']
+        else:
+            compressed = codec.compress(response.content, level)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers['Content-Length'] = str(len(compressed))
+
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = codec.name
+
+        return response
+
+    @staticmethod
+    def is_compressible(response):
+        content_type = response.get('Content-Type', '').split(';')[0].strip().lower()
+        if not content_type:
+            return False
+        return any(
+            content_type == allowed or (allowed.endswith('/') and content_type.startswith(allowed))
+            for allowed in settings.COMPRESSION_CONTENT_TYPES
+        )
+
+    @staticmethod
+    def compress_stream(chunks, codec, level):
+        stream = StreamCompressor(codec, level)
+        for chunk in chunks:
+            data = stream.compress(chunk)
+            if data:
+                yield data
+        yield stream.finish()
+
+    @staticmethod
+    async def compress_async_stream(chunks, codec, level):
+        stream = StreamCompressor(codec, level)
+        async for chunk in chunks:
+            data = stream.compress(chunk)
+            if data:
+                yield data
+        yield stream.finish()
+
+
+class StreamCompressor:
+    """
+    Feed chunks to a codec and flush a compressed block once
+    ``COMPRESSION_STREAM_FLUSH_SIZE`` input bytes are pending, trading a little
+    latency for a ratio close to whole-body compression on many tiny chunks.
+    """
+
+    def __init__(self, codec, level):
+        self.compressor = codec.compressor(level)
+        self.flush_size = settings.COMPRESSION_STREAM_FLUSH_SIZE
+        self.pending = 0
+
+    def compress(self, chunk):
+        data = self.compressor.compress(chunk)
+        self.pending += len(chunk)
+        if self.pending >= self.flush_size:
+            self.pending = 0
+            data += self.compressor.flush()
+        return data
+
+    def finish(self):
+        return self.compressor.finish()
+
+
+class IdempotencyMiddleware:
+    """
+    Make unsafe requests carrying an ``Idempotency-Key`` header run at most
+    once per user and key.
+
+    The first request claims the key and its response is stored; retries get
+    that response replayed with ``Idempotent-Replayed: true``. A duplicate
+    arriving while the first is still running gets 409 at once, so it holds
+    no worker while it waits. Reusing a key for a different request is
+    rejected with 422. Server errors and 408, 409 and 429 answers are not
+    stored so they can be retried. Anonymous requests pass through: they have
+    no user to scope keys to, and open endpoints such as ``auth/token/`` must
+    not have their responses stored.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.header = 'HTTP_' + settings.IDEMPOTENCY_KEY_HEADER.upper().replace('-', '_')
+
+    def __call__(self, request):
+        key = request.META.get(self.header)
+        if not key or request.method not in settings.IDEMPOTENCY_METHODS:
+            return self.get_response(request)
+
+        if len(key) > 255:
+            return JsonResponse({'detail': f'{settings.IDEMPOTENCY_KEY_HEADER} is too long.'}, status=400)
+
+        scope = self.get_scope(request)
+        if scope is None:
+            # anonymous or invalid credentials: the view runs or rejects it as usual
+            return self.get_response(request)
+
+        fingerprint = idempotency.request_fingerprint(request)
+        record, claimed = idempotency.claim(scope, key, fingerprint)
+
+        if not claimed:
+            if record.fingerprint != fingerprint:
+                return JsonResponse(
+                    {'detail': f'{settings.IDEMPOTENCY_KEY_HEADER} was already used for a different request.'},
+                    status=422,
+                )
+            if record.status_code is None:
+                response = JsonResponse(
+                    {'detail': 'A request with this key is still being processed.'},
+                    status=409,
+                )
+                response['Retry-After'] = '1'
+                return response
+            return idempotency.replay(record)
+
+        try:
+            response = self.get_response(request)
+        except BaseException:
+            idempotency.release(record)
+            raise
+
+        idempotency.store(record, response)
+        return response
+
+    def get_scope(self, request):
+        """Key namespace: the JWT's user id or the session user; ``None`` for anonymous requests."""
+        if jwt_settings.AUTH_HEADER_NAME in request.META:
+            token = validated_token(request)
+            return None if token is None else f'user:{token[jwt_settings.USER_ID_CLAIM]}'
+
+        user = getattr(request, 'user', None)
+        if user is not None and user.is_authenticated:
+            return f'user:{user.pk}'
+        return None
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Let safe requests read from replicas. Unsafe requests stay on the primary
+    and keep the user's reads there too for ``DATABASE_STICKY_PRIMARY_WINDOW``,
+    until replicas have caught up with what they just wrote.
+
+    JWT clients often do not send cookies back, so the window is a cache
+    entry keyed by the token's user id, shared by every client of that user;
+    the ``common.E001`` check requires that cache to be shared by all
+    workers. A signed cookie also marks the client, for anonymous and session
+    requests.
+    """
+    safe_methods = ('GET', 'HEAD', 'OPTIONS')
+    salt = 'replica-routing'
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.window = int(settings.DATABASE_STICKY_PRIMARY_WINDOW.total_seconds())
+
+    def __call__(self, request):
+        if request.method not in self.safe_methods:
+            response = self.get_response(request)
+            user_id = self.get_user_id(request)
+            if user_id is not None:
+                self.cache.set(self.sticky_key(user_id), True, self.window)
+            response.set_signed_cookie(
+                settings.DATABASE_STICKY_PRIMARY_COOKIE, '1',
+                salt=self.salt, max_age=self.window, httponly=True, samesite='Lax',
+            )
+            return response
+
+        if self.is_sticky(request):
+            return self.get_response(request)
+
+        token = routers.allow_replica_reads()
+        try:
+            return self.get_response(request)
+        finally:
+            routers.reset(token)
+
+    @property
+    def cache(self):
+        return caches[settings.DATABASE_STICKY_PRIMARY_CACHE]
+
+    @staticmethod
+    def sticky_key(user_id):
+        return f'sticky:{user_id}'
+
+    @staticmethod
+    def get_user_id(request):
+        """User id of a valid JWT on ``request``, or ``None``."""
+        token = validated_token(request)
+        return None if token is None else token.get(jwt_settings.USER_ID_CLAIM)
+
+    def is_sticky(self, request):
+        if request.get_signed_cookie(
+            settings.DATABASE_STICKY_PRIMARY_COOKIE, default=None, salt=self.salt, max_age=self.window,
+        ) is not None:
+            return True
+        user_id = self.get_user_id(request)
+        return user_id is not None and self.cache.get(self.sticky_key(user_id)) is not None
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.1 on 2026-10-19 18:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IdempotencyKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(max_length=64, verbose_name='Scope')),
+                ('key', models.CharField(max_length=255, verbose_name='Key')),
+                ('fingerprint', models.CharField(max_length=64, verbose_name='Request fingerprint')),
+                ('status_code', models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='Status code')),
+                ('content_type', models.CharField(blank=True, max_length=255, verbose_name='Content type')),
+                ('location', models.CharField(blank=True, max_length=2048, verbose_name='Location')),
+                ('body', models.BinaryField(blank=True, verbose_name='Body')),
+                ('created_at', models.DateTimeField(verbose_name='Created at')),
+                ('expires_at', models.DateTimeField(verbose_name='Expires at')),
+            ],
+            options={
+                'verbose_name': 'Idempotency key',
+                'verbose_name_plural': 'Idempotency keys',
+                'indexes': [models.Index(fields=['expires_at'], name='idempotency_expires_at_idx')],
+                'constraints': [models.UniqueConstraint(fields=('scope', 'key'), name='unique_idempotency_scope_key')],
+            },
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.1 on 2026-10-19 19:20
+
+from django.db import migrations
+
+
+def drop_anonymous_keys(apps, schema_editor):
+    # stored responses of open endpoints, which include issued tokens
+    IdempotencyKey = apps.get_model('common', 'IdempotencyKey')
+    IdempotencyKey.objects.filter(scope='anonymous').delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0001_idempotency_keys'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_anonymous_keys, migrations.RunPython.noop),
+    ]
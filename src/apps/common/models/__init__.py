@@ -1,2 +1,3 @@
 from .models import *
-from .fields import *
\ No newline at end of file
+from .fields import *
+from .idempotency import *
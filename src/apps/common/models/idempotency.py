@@ -0,0 +1,65 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class IdempotencyKey(models.Model):
+    """
+    First response to an unsafe request sent with an ``Idempotency-Key``.
+    ``status_code`` stays empty while the original request is still running.
+    """
+    scope = models.CharField(
+        verbose_name=_('Scope'),
+        max_length=64,
+    )
+    key = models.CharField(
+        verbose_name=_('Key'),
+        max_length=255,
+    )
+    fingerprint = models.CharField(
+        verbose_name=_('Request fingerprint'),
+        max_length=64,
+    )
+    status_code = models.PositiveSmallIntegerField(
+        verbose_name=_('Status code'),
+        null=True,
+        blank=True,
+    )
+    content_type = models.CharField(
+        verbose_name=_('Content type'),
+        max_length=255,
+        blank=True,
+    )
+    location = models.CharField(
+        verbose_name=_('Location'),
+        max_length=2048,
+        blank=True,
+    )
+    body = models.BinaryField(
+        verbose_name=_('Body'),
+        blank=True,
+    )
+    created_at = models.DateTimeField(
+        verbose_name=_('Created at'),
+    )
+    expires_at = models.DateTimeField(
+        verbose_name=_('Expires at'),
+    )
+
+    def __str__(self):
+        return f'{self.scope}:{self.key}'
+
+    class Meta:
+        verbose_name = _('Idempotency key')
+        verbose_name_plural = _('Idempotency keys')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['scope', 'key'],
+                name='unique_idempotency_scope_key',
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=['expires_at'],
+                name='idempotency_expires_at_idx',
+            ),
+        ]
@@ -0,0 +1,63 @@
+import re
+from typing import Callable, Dict, List
+
+from django.db import connections, transaction
+from django.db.models import QuerySet
+from django.utils.module_loading import autodiscover_modules
+
+
+HotQuery = Callable[[], QuerySet]
+
+registry: Dict[str, HotQuery] = {}
+
+# SQLite reports a table scan as "SCAN <table>" and an index walk as
+# "SCAN <table> USING [COVERING] INDEX <name>"; PostgreSQL as "Seq Scan on <table>".
+SQLITE_FULL_SCAN_RE = re.compile(r'^SCAN (?P<table>\S+)$')
+POSTGRES_FULL_SCAN_RE = re.compile(r'Seq Scan on (?P<table>\S+)')
+
+
+def hot_query(name: str):
+    """
+    Register a function returning a queryset that must always be answered from
+    an index. Apps declare these in their ``hot_queries`` module.
+    """
+    def decorator(func: HotQuery) -> HotQuery:
+        registry[name] = func
+        return func
+    return decorator
+
+
+def discover_hot_queries() -> Dict[str, HotQuery]:
+    autodiscover_modules('hot_queries')
+    return registry
+
+
+def explain(queryset: QuerySet) -> List[str]:
+    connection = connections[queryset.db]
+    sql, params = queryset.query.sql_with_params()
+
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+            return [row[3] for row in cursor.fetchall()]
+
+        if connection.vendor == 'postgresql':
+            # Small or freshly created tables make a sequential scan the cheapest
+            # plan; disabling it for this transaction only asks the planner
+            # whether a usable index exists at all.
+            with transaction.atomic(using=queryset.db):
+                cursor.execute('SET LOCAL enable_seqscan = off')
+                cursor.execute(f'EXPLAIN {sql}', params)
+                return [row[0] for row in cursor.fetchall()]
+
+        cursor.execute(f'EXPLAIN {sql}', params)
+        return [' '.join(map(str, row)) for row in cursor.fetchall()]
+
+
+def full_scans(plan: List[str]) -> List[str]:
+    scans = []
+    for line in plan:
+        match = SQLITE_FULL_SCAN_RE.match(line.strip()) or POSTGRES_FULL_SCAN_RE.search(line)
+        if match:
+            scans.append(match.group('table'))
+    return scans
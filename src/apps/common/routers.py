@@ -0,0 +1,59 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+# reads go to the primary unless a request explicitly allowed replicas, so
+# management commands, workers and shells always see their own writes
+_use_primary = ContextVar('use_primary', default=True)
+
+
+def allow_replica_reads():
+    """Let reads in the current context go to a replica; returns a token for ``reset``."""
+    return _use_primary.set(False)
+
+
+def reset(token):
+    _use_primary.reset(token)
+
+
+@contextmanager
+def use_primary():
+    """Send every read inside the block to the primary, e.g. right before a dependent write."""
+    token = _use_primary.set(True)
+    try:
+        yield
+    finally:
+        _use_primary.reset(token)
+
+
+def replica_aliases():
+    return [alias for alias in settings.DATABASES if alias != DEFAULT_DB_ALIAS]
+
+
+class PrimaryReplicaRouter:
+    """
+    Writes go to the primary (``default``); reads go to a random replica
+    when the context allows it. The first write in a context pins its later
+    reads to the primary as well, so a request reads its own writes.
+    """
+
+    def db_for_read(self, model, **hints):
+        if _use_primary.get():
+            return DEFAULT_DB_ALIAS
+        replicas = replica_aliases()
+        return random.choice(replicas) if replicas else DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        _use_primary.set(True)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # replicas hold the same data as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # replicas receive schema changes through replication
+        return db == DEFAULT_DB_ALIAS
@@ -0,0 +1,123 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+
+class DynamicFieldsMixin:
+    """
+    ``?fields=`` and ``?expand=`` support for model serializers.
+
+    ``fields`` keeps only the listed top-level fields. ``expand`` lists which
+    relations declared in ``Meta.expandable_fields`` are rendered nested; the
+    rest collapse to primary keys. Without ``expand`` every relation stays
+    nested, as before. Both only apply to the root serializer of safe requests.
+
+    ``Meta.expandable_fields`` maps a field name to a spec with optional
+    ``source``, ``many``, ``select_related`` and ``prefetch_related`` keys, used
+    by ``optimize_queryset`` to load exactly what will be rendered.
+    """
+    fields_param = 'fields'
+    expand_param = 'expand'
+
+    def get_fields(self):
+        fields = super().get_fields()
+
+        request = self.get_sparse_request()
+        if request is None:
+            return fields
+
+        requested = self.get_param_set(request, self.fields_param)
+        if requested is not None:
+            fields = {
+                name: field for name, field in fields.items()
+                if name in requested or field.write_only
+            }
+
+        expand = self.get_param_set(request, self.expand_param)
+        if expand is not None:
+            for name, spec in self.get_expandable_fields().items():
+                if name in fields and name not in expand:
+                    fields[name] = self.build_collapsed_field(name, spec)
+
+        return fields
+
+    def optimize_queryset(self, queryset):
+        """
+        Trim ``queryset`` to the columns and relations the response will use:
+        ``only()`` for sparse fieldsets, joins and prefetches for expanded
+        relations, and primary-key-only prefetches for collapsed ones.
+        """
+        request = self.get_sparse_request()
+        if request is None:
+            return queryset
+
+        model = self.Meta.model
+        expand = self.get_param_set(request, self.expand_param)
+        expandable = self.get_expandable_fields()
+        columns = {'pk'}
+
+        for name, field in self.fields.items():
+            if field.write_only:
+                continue
+
+            spec = expandable.get(name)
+            if spec is not None:
+                source = spec.get('source', name)
+                if expand is None or name in expand:
+                    queryset = queryset.select_related(*spec.get('select_related', ()))
+                    queryset = queryset.prefetch_related(*spec.get('prefetch_related', ()))
+                elif spec.get('many'):
+                    relation = model._meta.get_field(source)
+                    only = ['pk']
+                    if relation.one_to_many:
+                        # reverse foreign keys are matched to their parent by this column
+                        only.append(relation.field.name)
+                    queryset = queryset.prefetch_related(
+                        Prefetch(source, queryset=relation.related_model._default_manager.only(*only))
+                    )
+                if not spec.get('many'):
+                    columns.add(source)
+                continue
+
+            try:
+                model_field = model._meta.get_field(field.source)
+            except FieldDoesNotExist:
+                continue
+            if model_field.concrete:
+                columns.add(model_field.name)
+
+        if self.get_param_set(request, self.fields_param) is not None:
+            queryset = queryset.only(*columns)
+
+        return queryset
+
+    def get_sparse_request(self):
+        request = self.context.get('request')
+        if request is None or request.method not in SAFE_METHODS:
+            return None
+
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        if parent is not None:
+            return None
+
+        return request
+
+    def get_expandable_fields(self):
+        return getattr(self.Meta, 'expandable_fields', {})
+
+    @staticmethod
+    def build_collapsed_field(name, spec):
+        kwargs = {'read_only': True, 'many': spec.get('many', False)}
+        if spec.get('source', name) != name:
+            kwargs['source'] = spec['source']
+        return serializers.PrimaryKeyRelatedField(**kwargs)
+
+    @staticmethod
+    def get_param_set(request, param):
+        value = request.query_params.get(param)
+        if value is None:
+            return None
+        return {item.strip() for item in value.split(',') if item.strip()}
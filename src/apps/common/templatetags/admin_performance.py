@@ -0,0 +1,73 @@
+import datetime
+
+from django import template
+from django.contrib.admin.templatetags.admin_list import date_hierarchy
+from django.contrib.admin.templatetags.base import InclusionAdminNode
+from django.db import models
+from django.utils import timezone
+
+register = template.Library()
+
+
+class DateRangeQuerySet:
+    """
+    Stand-in for the changelist queryset that answers the ``dates()`` and
+    ``datetimes()`` drill-down calls from a single MIN/MAX aggregate instead of
+    a ``SELECT DISTINCT`` over every row. Periods without rows may be listed.
+    """
+
+    def __init__(self, queryset):
+        self.queryset = queryset
+
+    def aggregate(self, *args, **kwargs):
+        return self.queryset.aggregate(*args, **kwargs)
+
+    def dates(self, field_name, kind):
+        date_range = self.queryset.aggregate(first=models.Min(field_name), last=models.Max(field_name))
+        first, last = date_range['first'], date_range['last']
+        if first is None or last is None:
+            return []
+
+        if isinstance(first, datetime.datetime):
+            if timezone.is_aware(first):
+                first, last = timezone.localtime(first), timezone.localtime(last)
+            first, last = first.date(), last.date()
+
+        if kind == 'year':
+            return [datetime.date(year, 1, 1) for year in range(first.year, last.year + 1)]
+
+        if kind == 'month':
+            months = []
+            month = first.replace(day=1)
+            while month <= last:
+                months.append(month)
+                month = (month + datetime.timedelta(days=32)).replace(day=1)
+            return months
+
+        return [first + datetime.timedelta(days=offset) for offset in range((last - first).days + 1)]
+
+    datetimes = dates
+
+
+class DateRangeChangeList:
+    def __init__(self, cl):
+        self._cl = cl
+        self.queryset = DateRangeQuerySet(cl.queryset)
+
+    def __getattr__(self, name):
+        return getattr(self._cl, name)
+
+
+def range_date_hierarchy(cl):
+    return date_hierarchy(DateRangeChangeList(cl))
+
+
+@register.tag(name='range_date_hierarchy')
+def range_date_hierarchy_tag(parser, token):
+    return InclusionAdminNode(
+        parser,
+        token,
+        func=range_date_hierarchy,
+        template_name='date_hierarchy.html',
+        takes_context=False,
+    )
@@ -1,21 +1,27 @@
+import re
+
 from django.core.exceptions import ValidationError
 from django.utils.deconstruct import deconstructible
+from django.utils.functional import SimpleLazyObject
 from django.utils.regex_helper import _lazy_re_compile
 from django.utils.translation import gettext_lazy as _
 
 from django.conf import settings
 
-import phonenumbers
+
+def _compile_e164_format_regex():
+    # phonenumbers is imported on the first validation, not when models load
+    import phonenumbers
+
+    country_codes_pattern = '|'.join(map(str, phonenumbers.COUNTRY_CODE_TO_REGION_CODE.keys()))
+    return re.compile(rf'^\+({country_codes_pattern})\d{{4,14}}$')
 
 
 @deconstructible
 class PhoneNumberValidator:
     message = _('Enter a valid phone number.')
     code = 'invalid'
-    country_codes_pattern = '|'.join(map(str, phonenumbers.COUNTRY_CODE_TO_REGION_CODE.keys()))
-    E164_format_regex = _lazy_re_compile(
-        rf'^\+({country_codes_pattern})\d{{4,14}}$'
-    )
+    E164_format_regex = SimpleLazyObject(_compile_e164_format_regex)
     basic_format_regex = _lazy_re_compile(
         r'^\+?\d{1,4}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}$'
     )
@@ -36,6 +42,8 @@ class PhoneNumberValidator:
         error = ValidationError(self.message, code=self.code, params={'value': value})
 
         if settings.USE_E164:
+            import phonenumbers
+
             if not value or value[0] != '+' or len(value) > 15:
                 raise error
 
@@ -0,0 +1,15 @@
+from src.apps.common.serializers import DynamicFieldsMixin
+
+
+class SparseFieldsetMixin:
+    """
+    Let the serializer trim the queryset to the fields and expansions requested
+    through ``?fields=`` and ``?expand=``.
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        serializer = self.get_serializer()
+        if isinstance(serializer, DynamicFieldsMixin):
+            queryset = serializer.optimize_queryset(queryset)
+        return queryset
@@ -1,9 +1,11 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+from rest_framework_simplejwt.views import TokenBlacklistView, TokenRefreshView
 
-from apps.hotel.views import RoomViewSet, CategoryViewSet, AmenityViewSet, BookingViewSet
-from apps.users.views import UserViewSet
+from apps.hotel.views import (
+    RoomViewSet, CategoryViewSet, AmenityViewSet, BookingViewSet, ChangeFeedView, QRCodeImageView, QRCodeVerifyView
+)
+from apps.users.views import TokenObtainPairView, UserViewSet
 
 router = DefaultRouter()
 
@@ -17,8 +19,12 @@ router.register(r'bookings', BookingViewSet, basename='booking')
 auth_urls = [
     path('token/', TokenObtainPairView.as_view(), name='token_obtain'),
     path('token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
+    path('token/revoke/', TokenBlacklistView.as_view(), name='token_revoke'),
 ]
 
 urlpatterns = [
     path('auth/', include(auth_urls)),
+    path('qr-codes/verify/', QRCodeVerifyView.as_view(), name='qr_code_verify'),
+    path('qr-codes/<int:pk>/image/', QRCodeImageView.as_view(), name='qr_code_image'),
+    path('changes/', ChangeFeedView.as_view(), name='change_feed'),
 ] + router.urls
@@ -1,8 +1,10 @@
 from django.contrib import admin
+from src.apps.common.admin import LargeTableAdminMixin
 from src.apps.hotel.models import (
     Category, Amenity, Room, RoomImage, RoomAmenity,
     Booking, BookingCustomer, BookingPayment, QRCode, Review
 )
+from src.apps.hotel.revocation import blacklist_qr_codes
 
 class RoomImageInline(admin.TabularInline):
     model = RoomImage
@@ -11,10 +13,12 @@ class RoomImageInline(admin.TabularInline):
 class RoomAmenityInline(admin.TabularInline):
     model = RoomAmenity
     extra = 1
+    autocomplete_fields = ('amenity',)
 
 class BookingCustomerInline(admin.TabularInline):
     model = BookingCustomer
     extra = 1
+    autocomplete_fields = ('customer',)
 
 class BookingPaymentInline(admin.TabularInline):
     model = BookingPayment
@@ -45,41 +49,61 @@ class AmenityAdmin(admin.ModelAdmin):
 class RoomAdmin(admin.ModelAdmin):
     list_display = ('title', 'price_per_night', 'status', 'category')
     list_filter = ('status', 'category')
+    list_select_related = ('category',)
     search_fields = ('title',)
+    autocomplete_fields = ('category',)
     inlines = [RoomImageInline, RoomAmenityInline]
 
 
 @admin.register(Booking)
-class BookingAdmin(admin.ModelAdmin):
+class BookingAdmin(LargeTableAdminMixin, admin.ModelAdmin):
     list_display = ('id', 'check_in', 'check_out', 'total_price', 'status', 'room')
     list_filter = ('status',)
-    search_fields = ('id',)
+    list_select_related = ('room',)
+    search_fields = ('=id',)
+    autocomplete_fields = ('room',)
     date_hierarchy = 'check_in'
     inlines = [BookingCustomerInline, BookingPaymentInline]
 
 
 @admin.register(BookingCustomer)
-class BookingCustomerAdmin(admin.ModelAdmin):
+class BookingCustomerAdmin(LargeTableAdminMixin, admin.ModelAdmin):
     list_display = ('customer', 'booking', 'is_owner')
     list_filter = ('is_owner',)
+    list_select_related = ('customer', 'booking__room')
+    search_fields = ('=booking__id', '^customer__email')
+    autocomplete_fields = ('customer', 'booking')
     inlines = [QRCodeInline, ReviewInline]
 
 
 @admin.register(BookingPayment)
-class BookingPaymentAdmin(admin.ModelAdmin):
-    list_display = ('amount', 'status', 'booking', 'created_at')
-    list_filter = ('status',)
+class BookingPaymentAdmin(LargeTableAdminMixin, admin.ModelAdmin):
+    list_display = ('amount', 'status', 'booking', 'provider', 'created_at', 'settled_at')
+    list_filter = ('status', 'provider')
+    list_select_related = ('booking__room',)
+    search_fields = ('=provider_reference',)
+    autocomplete_fields = ('booking',)
     date_hierarchy = 'created_at'
 
 
 @admin.register(QRCode)
-class QRCodeAdmin(admin.ModelAdmin):
+class QRCodeAdmin(LargeTableAdminMixin, admin.ModelAdmin):
     list_display = ('qr_code', 'status', 'created_at', 'booking_customer')
     list_filter = ('status',)
+    list_select_related = ('booking_customer__customer', 'booking_customer__booking__room')
+    autocomplete_fields = ('booking_customer',)
     date_hierarchy = 'created_at'
+    actions = ['blacklist']
+
+    @admin.action(description='Blacklist selected QR codes')
+    def blacklist(self, request, queryset):
+        updated = blacklist_qr_codes(queryset)
+        self.message_user(request, f'{updated} QR codes blacklisted.')
 
 
 @admin.register(Review)
-class ReviewAdmin(admin.ModelAdmin):
+class ReviewAdmin(LargeTableAdminMixin, admin.ModelAdmin):
     list_display = ('rating', 'content', 'booking_customer', 'created_at')
-    list_filter = ('rating',)
\ No newline at end of file
+    list_filter = ('rating',)
+    list_select_related = ('booking_customer__customer', 'booking_customer__booking__room')
+    autocomplete_fields = ('booking_customer',)
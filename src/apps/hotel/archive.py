@@ -0,0 +1,69 @@
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from src.apps.hotel import outbox
+from src.apps.hotel.models import (
+    ArchivedBooking, ArchivedBookingCustomer, ArchivedBookingPayment, ArchivedQRCode, ArchivedReview,
+    Booking, BookingCustomer, BookingPayment, ChangeEvent, QRCode, Review,
+)
+
+CLOSED_STATUSES = [Booking.BookingStatus.COMPLETED, Booking.BookingStatus.CANCELED]
+
+# hot model, archive model and the columns copied between them, parents first
+ARCHIVED_MODELS = [
+    (Booking, ArchivedBooking, 'id', [
+        'id', 'check_in', 'check_out', 'total_price', 'status', 'room_id', 'created_at', 'updated_at',
+    ]),
+    (BookingCustomer, ArchivedBookingCustomer, 'booking_id', [
+        'id', 'customer_id', 'booking_id', 'is_owner', 'check_in',
+    ]),
+    (BookingPayment, ArchivedBookingPayment, 'booking_id', [
+        'id', 'amount', 'status', 'booking_id', 'provider', 'provider_reference', 'created_at', 'settled_at',
+    ]),
+    (QRCode, ArchivedQRCode, 'booking_customer__booking_id', [
+        'id', 'qr_code', 'booking_customer_id', 'status', 'created_at',
+    ]),
+    (Review, ArchivedReview, 'booking_customer__booking_id', [
+        'id', 'title', 'rating', 'content', 'booking_customer_id', 'created_at', 'updated_at',
+    ]),
+]
+
+
+def archivable_bookings(cutoff):
+    return Booking.objects.filter(status__in=CLOSED_STATUSES, check_out__lt=cutoff)
+
+
+def archive_bookings(cutoff=None, batch_size=None):
+    """
+    Move closed bookings that checked out before ``cutoff``, with their
+    customers, payments, QR codes and reviews, into the archive tables.
+
+    Each batch is copied and removed in its own transaction, so the job can be
+    stopped at any point and the hot tables never lock for long. Rows are
+    removed child tables first through ``QuerySet.delete``. The change feed
+    gets one ``archived`` event per tracked row, with its last snapshot,
+    instead of the per-object deletion events. Returns the number of bookings
+    archived.
+    """
+    cutoff = cutoff or timezone.now() - settings.BOOKING_ARCHIVE_AFTER
+    batch_size = batch_size or settings.BOOKING_ARCHIVE_BATCH_SIZE
+    archived = 0
+
+    while True:
+        with transaction.atomic():
+            ids = list(archivable_bookings(cutoff).order_by('pk').values_list('pk', flat=True)[:batch_size])
+            if not ids:
+                return archived
+
+            for model, archive_model, booking_lookup, fields in ARCHIVED_MODELS:
+                rows = list(model.objects.filter(**{f'{booking_lookup}__in': ids}).values(*fields))
+                archive_model.objects.bulk_create([archive_model(**row) for row in rows], batch_size=batch_size)
+                if model in outbox.TRACKED_MODELS:
+                    outbox.record_changes(model, [row['id'] for row in rows], ChangeEvent.Action.ARCHIVED)
+
+            with outbox.suppressed():
+                for model, _, booking_lookup, _ in reversed(ARCHIVED_MODELS):
+                    model.objects.filter(**{f'{booking_lookup}__in': ids}).delete()
+
+        archived += len(ids)
@@ -0,0 +1,332 @@
+import csv
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.utils import timezone
+
+from src.apps.hotel import facets, search
+from src.apps.hotel.models import Amenity, Category, Room, RoomAmenity, RoomImage
+
+
+class CatalogError(Exception):
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__('\n'.join(errors))
+
+
+@dataclass
+class CatalogImportResult:
+    counts: dict = field(default_factory=dict)
+    copied_files: list = field(default_factory=list)
+
+    def add(self, key, value):
+        self.counts[key] = self.counts.get(key, 0) + value
+
+
+def split_list(value):
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [item.strip() for item in value.split('|') if item.strip()]
+    return [str(item).strip() for item in value if str(item).strip()]
+
+
+def load_manifest(path):
+    """
+    Read a catalog manifest into ``{'categories', 'amenities', 'rooms'}`` lists.
+
+    JSON manifests hold the three lists directly. CSV manifests have one room
+    per row (``title, description, price_per_night, status, category,
+    amenities, images``, lists separated by ``|``); categories and amenities
+    are taken from the names they mention.
+    """
+    path = Path(path)
+    if path.suffix.lower() == '.csv':
+        with path.open(newline='', encoding='utf-8') as file:
+            rooms = list(csv.DictReader(file))
+        return {'categories': [], 'amenities': [], 'rooms': rooms}
+
+    with path.open(encoding='utf-8') as file:
+        data = json.load(file)
+    return {
+        'categories': data.get('categories', []),
+        'amenities': data.get('amenities', []),
+        'rooms': data.get('rooms', []),
+    }
+
+
+def validate_manifest(manifest, base_dir):
+    errors = []
+    statuses = set(Room.RoomStatus.values)
+
+    for key in ('categories', 'amenities'):
+        for index, item in enumerate(manifest[key], 1):
+            if not (item.get('name') or '').strip():
+                errors.append(f'{key}[{index}]: name is required.')
+            icon = item.get('icon')
+            if icon and not (base_dir / icon).is_file():
+                errors.append(f'{key}[{index}]: icon file {icon!r} not found.')
+
+    seen = set()
+    for index, room in enumerate(manifest['rooms'], 1):
+        title = (room.get('title') or '').strip()
+        if not title:
+            errors.append(f'rooms[{index}]: title is required.')
+        elif title in seen:
+            errors.append(f'rooms[{index}]: duplicate title {title!r}.')
+        seen.add(title)
+
+        if not (room.get('category') or '').strip():
+            errors.append(f'rooms[{index}]: category is required.')
+
+        try:
+            price = Decimal(str(room.get('price_per_night')))
+            if not price.is_finite() or price < 0:
+                raise InvalidOperation
+        except InvalidOperation:
+            errors.append(f'rooms[{index}]: invalid price_per_night {room.get("price_per_night")!r}.')
+
+        status = room.get('status')
+        if status and status not in statuses:
+            errors.append(f'rooms[{index}]: unknown status {status!r}.')
+
+        for image in split_list(room.get('images')):
+            if not (base_dir / image).is_file():
+                errors.append(f'rooms[{index}]: image file {image!r} not found.')
+
+    if errors:
+        raise CatalogError(errors)
+
+
+def copy_files(files, base_dir, workers):
+    """
+    Copy ``(source, target)`` pairs into media storage concurrently and return
+    the stored names in order; storage may rename a target that is taken.
+    """
+    def copy(pair):
+        source, target = pair
+        with (base_dir / source).open('rb') as file:
+            return default_storage.save(target, File(file))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(copy, files))
+
+
+def upsert_by_name(model, items, fields, batch_size, result, key):
+    """
+    Create missing rows and update changed ones, matching on ``name``.
+    Returns a ``name -> pk`` map covering every name in ``items``.
+    """
+    existing = {obj.name: obj for obj in model.objects.filter(name__in=[item['name'] for item in items])}
+    to_create, to_update = [], []
+
+    for item in items:
+        obj = existing.get(item['name'])
+        if obj is None:
+            obj = model(**{name: item.get(name) for name in ('name', *fields)})
+            existing[item['name']] = obj
+            to_create.append(obj)
+        elif any(name in item and getattr(obj, name) != item[name] for name in fields):
+            for name in fields:
+                if name in item:
+                    setattr(obj, name, item[name])
+            to_update.append(obj)
+
+    model.objects.bulk_create(to_create, batch_size=batch_size)
+    if to_update and fields:
+        model.objects.bulk_update(to_update, fields, batch_size=batch_size)
+
+    result.add(f'{key}_created', len(to_create))
+    result.add(f'{key}_updated', len(to_update))
+    return {name: obj.pk for name, obj in existing.items()}
+
+
+def import_catalog(manifest, base_dir, batch_size=1000, workers=8, dry_run=False):
+    """
+    Upsert categories, amenities and rooms from ``manifest`` (see
+    ``load_manifest``), link rooms to exactly the listed amenities and attach
+    new images.
+
+    Categories and amenities are matched on ``name``, rooms on ``title`` and
+    images on their file name, so running the same manifest twice changes
+    nothing. All rows are written with batched ``bulk_create``/``bulk_update``
+    in one transaction, files are copied by a thread pool beforehand and
+    removed again if the transaction fails. ``dry_run`` validates the manifest
+    and reports what would change without writing rows or files.
+    """
+    base_dir = Path(base_dir)
+    validate_manifest(manifest, base_dir)
+    result = CatalogImportResult()
+
+    rooms = manifest['rooms']
+    categories = {item['name'].strip(): item for item in manifest['categories']}
+    amenities = {item['name'].strip(): item for item in manifest['amenities']}
+    for room in rooms:
+        categories.setdefault(room['category'].strip(), {'name': room['category'].strip()})
+        for name in split_list(room.get('amenities')):
+            amenities.setdefault(name, {'name': name})
+
+    try:
+        with transaction.atomic():
+            category_ids = upsert_by_name(
+                Category, [{**item, 'name': name} for name, item in categories.items()],
+                [name for name in ('description',) if any(name in item for item in categories.values())],
+                batch_size, result, 'categories',
+            )
+
+            amenity_items = [{**item, 'name': name} for name, item in amenities.items()]
+            current_icons = dict(
+                Amenity.objects.filter(name__in=list(amenities), icon__gt='').values_list('name', 'icon')
+            )
+            new_icons = []
+            for item in amenity_items:
+                if not item.get('icon'):
+                    continue
+                current = current_icons.get(item['name'])
+                if current and os.path.basename(current) == os.path.basename(item['icon']):
+                    item['icon'] = current
+                else:
+                    new_icons.append(item)
+            if new_icons and not dry_run:
+                names = copy_files(
+                    [(item['icon'], 'amenities/' + os.path.basename(item['icon'])) for item in new_icons],
+                    base_dir, workers,
+                )
+                result.copied_files.extend(names)
+                for item, name in zip(new_icons, names):
+                    item['icon'] = name
+            amenity_ids = upsert_by_name(
+                Amenity, amenity_items,
+                [name for name in ('description', 'icon') if any(name in item for item in amenity_items)],
+                batch_size, result, 'amenities',
+            )
+
+            room_ids = upsert_rooms(rooms, category_ids, batch_size, result)
+            sync_room_amenities(rooms, room_ids, amenity_ids, batch_size, result)
+            add_room_images(rooms, room_ids, base_dir, batch_size, workers, dry_run, result)
+            if not dry_run:
+                # bulk writes skip the signals
+                facets.assign_bits()
+                facets.refresh_amenity_masks(room_ids.values(), batch_size=batch_size)
+                search.index_rooms(room_ids.values(), batch_size=batch_size)
+
+            if dry_run:
+                transaction.set_rollback(True)
+    except BaseException:
+        for name in result.copied_files:
+            default_storage.delete(name)
+        raise
+
+    return result
+
+
+def upsert_rooms(rooms, category_ids, batch_size, result):
+    now = timezone.now()
+    existing = {}
+    titles = [room['title'].strip() for room in rooms]
+    for start in range(0, len(titles), batch_size):
+        for obj in Room.objects.filter(title__in=titles[start:start + batch_size]).order_by('-pk'):
+            existing[obj.title] = obj  # the oldest room wins if titles were duplicated by hand
+
+    to_create, to_update = [], []
+    for room in rooms:
+        title = room['title'].strip()
+        values = {
+            'description': room.get('description') or None,
+            'price_per_night': Decimal(str(room['price_per_night'])),
+            'category_id': category_ids[room['category'].strip()],
+        }
+        if room.get('status'):
+            values['status'] = room['status']
+
+        obj = existing.get(title)
+        if obj is None:
+            obj = Room(title=title, **values)
+            existing[title] = obj
+            to_create.append(obj)
+        elif any(getattr(obj, name) != value for name, value in values.items()):
+            for name, value in values.items():
+                setattr(obj, name, value)
+            obj.updated_at = now
+            to_update.append(obj)
+
+    Room.objects.bulk_create(to_create, batch_size=batch_size)
+    Room.objects.bulk_update(
+        to_update, ['description', 'price_per_night', 'category', 'status', 'updated_at'], batch_size=batch_size,
+    )
+
+    result.add('rooms_created', len(to_create))
+    result.add('rooms_updated', len(to_update))
+    return {title: obj.pk for title, obj in existing.items()}
+
+
+def sync_room_amenities(rooms, room_ids, amenity_ids, batch_size, result):
+    """Make each room listing an ``amenities`` column link to exactly those amenities."""
+    wanted = {
+        room_ids[room['title'].strip()]: {amenity_ids[name] for name in split_list(room.get('amenities'))}
+        for room in rooms if 'amenities' in room
+    }
+
+    current = {}
+    stale = []
+    ids = list(wanted)
+    for start in range(0, len(ids), batch_size):
+        links = RoomAmenity.objects.filter(room_id__in=ids[start:start + batch_size])
+        for pk, room_id, amenity_id in links.values_list('pk', 'room_id', 'amenity_id'):
+            if amenity_id in wanted[room_id]:
+                current.setdefault(room_id, set()).add(amenity_id)
+            else:
+                stale.append(pk)
+
+    new = [
+        RoomAmenity(room_id=room_id, amenity_id=amenity_id)
+        for room_id, wanted_ids in wanted.items()
+        for amenity_id in wanted_ids - current.get(room_id, set())
+    ]
+    RoomAmenity.objects.bulk_create(new, batch_size=batch_size, ignore_conflicts=True)
+    for start in range(0, len(stale), batch_size):
+        RoomAmenity.objects.filter(pk__in=stale[start:start + batch_size]).delete()
+
+    result.add('room_amenities_added', len(new))
+    result.add('room_amenities_removed', len(stale))
+
+
+def add_room_images(rooms, room_ids, base_dir, batch_size, workers, dry_run, result):
+    """Attach images whose file name the room does not have yet; existing images are kept."""
+    ids = [room_ids[room['title'].strip()] for room in rooms if room.get('images')]
+    existing = set()
+    for start in range(0, len(ids), batch_size):
+        images = RoomImage.objects.filter(room_id__in=ids[start:start + batch_size])
+        for room_id, name in images.values_list('room_id', 'image'):
+            existing.add((room_id, os.path.basename(name)))
+
+    pending = []
+    for room in rooms:
+        room_id = room_ids[room['title'].strip()]
+        for source in split_list(room.get('images')):
+            key = (room_id, os.path.basename(source))
+            if key not in existing:
+                existing.add(key)
+                pending.append((room_id, source))
+
+    result.add('room_images_added', len(pending))
+    if dry_run or not pending:
+        return
+
+    # one directory per room keeps file names, and therefore the dedup above, stable
+    names = copy_files(
+        [(source, f'room_images/{room_id}/{os.path.basename(source)}') for room_id, source in pending],
+        base_dir, workers,
+    )
+    result.copied_files.extend(names)
+    RoomImage.objects.bulk_create(
+        [RoomImage(room_id=room_id, image=name) for (room_id, _), name in zip(pending, names)],
+        batch_size=batch_size,
+    )
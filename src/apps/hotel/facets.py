@@ -0,0 +1,133 @@
+from django.db.models import Count, F, Max, Min, Q
+from django.db.models.lookups import Exact
+from django.utils import timezone
+
+from src.apps.hotel.models import Amenity, Category, Room, RoomAmenity
+
+# bits 0..62 of the signed 64-bit Room.amenity_mask
+MASK_BITS = 63
+
+
+def free_bit():
+    """Lowest bit not taken by an amenity, or ``None`` once all are taken."""
+    taken = set(Amenity.objects.filter(bit__isnull=False).values_list('bit', flat=True))
+    return next((bit for bit in range(MASK_BITS) if bit not in taken), None)
+
+
+def assign_bits():
+    """
+    Give amenities without a bit the free ones, oldest first; for amenities
+    written with ``bulk_create``. Returns the ids that got a bit.
+    """
+    taken = set(Amenity.objects.filter(bit__isnull=False).values_list('bit', flat=True))
+    free = iter([bit for bit in range(MASK_BITS) if bit not in taken])
+    assigned = []
+    for pk in Amenity.objects.filter(bit__isnull=True).order_by('pk').values_list('pk', flat=True):
+        bit = next(free, None)
+        if bit is None:
+            break
+        assigned.append(Amenity(pk=pk, bit=bit))
+    Amenity.objects.bulk_update(assigned, ['bit'])
+    return [amenity.pk for amenity in assigned]
+
+
+def refresh_amenity_masks(room_ids, batch_size=500):
+    """
+    Recompute ``Room.amenity_mask`` of ``room_ids`` from their ``RoomAmenity``
+    rows. Rooms whose mask changes also get a new ``updated_at``.
+    """
+    room_ids = list(room_ids)
+    now = timezone.now()
+    for start in range(0, len(room_ids), batch_size):
+        batch = room_ids[start:start + batch_size]
+        current = dict(Room.objects.filter(pk__in=batch).values_list('pk', 'amenity_mask'))
+        masks = dict.fromkeys(current, 0)
+        links = RoomAmenity.objects.filter(room_id__in=batch, amenity__bit__isnull=False)
+        for room_id, bit in links.values_list('room_id', 'amenity__bit'):
+            masks[room_id] |= 1 << bit
+        Room.objects.bulk_update(
+            [
+                Room(pk=room_id, amenity_mask=mask, updated_at=now)
+                for room_id, mask in masks.items() if mask != current[room_id]
+            ],
+            ['amenity_mask', 'updated_at'],
+        )
+
+
+def has_bits(mask):
+    return Q(Exact(F('amenity_mask').bitand(mask), mask))
+
+
+def amenities_condition(amenity_ids):
+    """
+    Condition for rooms having all of ``amenity_ids``: one bit test on
+    ``amenity_mask``, plus a ``RoomAmenity`` subquery for any amenity that
+    came after the bits ran out.
+    """
+    bits = dict(Amenity.objects.filter(pk__in=amenity_ids).values_list('pk', 'bit'))
+    mask = 0
+    condition = Q()
+    for amenity_id in amenity_ids:
+        bit = bits.get(amenity_id)
+        if bit is None:
+            condition &= Q(pk__in=RoomAmenity.objects.filter(amenity_id=amenity_id).values('room_id'))
+        else:
+            mask |= 1 << bit
+    if mask:
+        condition &= has_bits(mask)
+    return condition
+
+
+def room_facets(queryset, conditions):
+    """
+    Count rooms per category and per amenity, and the price range, in one
+    aggregate query over ``queryset``.
+
+    ``conditions`` maps ``category``, ``price`` and ``amenities`` to the
+    conditions the client filtered on. Each facet is counted with every
+    condition but its own, so picking another category or widening the price
+    range shows how many rooms it would add; amenity counts keep all
+    conditions, since amenities narrow the result together.
+    """
+    def without(name):
+        condition = Q()
+        for key, value in conditions.items():
+            if key != name:
+                condition &= value
+        return condition
+
+    categories = list(Category.objects.order_by('name', 'pk').values_list('pk', 'name'))
+    amenities = list(Amenity.objects.order_by('name', 'pk').values_list('pk', 'name', 'bit'))
+    every = without(None)
+    price_field = Room._meta.get_field('price_per_night')
+
+    aggregates = {
+        'count': Count('pk', filter=every),
+        'price_min': Min('price_per_night', filter=without('price'), output_field=price_field),
+        'price_max': Max('price_per_night', filter=without('price'), output_field=price_field),
+    }
+    for pk, _ in categories:
+        aggregates[f'category_{pk}'] = Count('pk', filter=without('category') & Q(category_id=pk))
+    for pk, _, bit in amenities:
+        if bit is None:
+            has_amenity = Q(pk__in=RoomAmenity.objects.filter(amenity_id=pk).values('room_id'))
+        else:
+            has_amenity = has_bits(1 << bit)
+        aggregates[f'amenity_{pk}'] = Count('pk', filter=every & has_amenity)
+
+    counts = queryset.order_by().aggregate(**aggregates)
+
+    def price(value):
+        # a string with fixed decimals, like the rooms' own price_per_night
+        return None if value is None else f'{value:.{price_field.decimal_places}f}'
+
+    return {
+        'count': counts['count'],
+        'price': {'min': price(counts['price_min']), 'max': price(counts['price_max'])},
+        'categories': [
+            {'id': pk, 'name': name, 'count': counts[f'category_{pk}']} for pk, name in categories
+        ],
+        'amenities': [
+            {'id': pk, 'name': name, 'count': counts[f'amenity_{pk}']} for pk, name, _ in amenities
+        ],
+    }
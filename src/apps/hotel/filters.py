@@ -0,0 +1,116 @@
+from decimal import Decimal, InvalidOperation
+
+from django.db.models import F, Q
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+from src.apps.hotel.facets import amenities_condition, room_facets
+from src.apps.hotel.models import Room
+from src.apps.hotel.search import search_rooms
+
+
+class RoomFilterBackend(BaseFilterBackend):
+    """
+    Filtering, search and ordering for the room list. ``status`` refers to the
+    occupancy derived by ``RoomQuerySet.with_occupancy``, not the stored column.
+    ``search`` matches title, category, amenities and description; its results
+    come best match first unless an explicit ``ordering`` is given.
+
+    ``category`` (any of the listed ids), ``min_price``/``max_price`` and
+    ``amenities`` (all of the listed ids) are the faceted filters; see
+    ``filter_with_facets`` for their counts.
+    """
+    search_param = 'search'
+    ordering_param = 'ordering'
+    ordering_fields = {
+        'relevance': F('search_rank'),
+        'status': F('occupancy_status'),
+        'price_per_night': F('price_per_night'),
+        'title': F('title'),
+    }
+
+    def filter_queryset(self, request, queryset, view):
+        return self.apply(request, self.filter_base(request, queryset), self.get_facet_conditions(request))
+
+    def filter_with_facets(self, request, queryset):
+        """Return the filtered rooms and the facet counts around them, see ``room_facets``."""
+        base = self.filter_base(request, queryset)
+        conditions = self.get_facet_conditions(request)
+        return self.apply(request, base, conditions), room_facets(base, conditions)
+
+    def apply(self, request, queryset, conditions):
+        params = request.query_params
+        search = params.get(self.search_param, '').strip()
+        for condition in conditions.values():
+            queryset = queryset.filter(condition)
+
+        ordering = params.get(self.ordering_param, '').strip()
+        if ordering:
+            if not search and 'relevance' in ordering:
+                raise ValidationError({self.ordering_param: 'Ordering by relevance requires a search.'})
+            queryset = queryset.order_by(*self.get_ordering(ordering))
+        elif search:
+            queryset = queryset.order_by(F('search_rank').desc(), F('id').asc())
+
+        return queryset
+
+    def filter_base(self, request, queryset):
+        params = request.query_params
+
+        statuses = [value for value in params.get('status', '').split(',') if value]
+        if statuses:
+            invalid = set(statuses) - set(Room.RoomStatus.values)
+            if invalid:
+                raise ValidationError({'status': f'Unknown status: {", ".join(sorted(invalid))}.'})
+            queryset = queryset.filter(occupancy_status__in=statuses)
+
+        search = params.get(self.search_param, '').strip()
+        if search:
+            queryset = search_rooms(queryset, search)
+        return queryset
+
+    def get_facet_conditions(self, request):
+        params = request.query_params
+        conditions = {}
+
+        categories = self.get_ids(params, 'category')
+        if categories:
+            conditions['category'] = Q(category_id__in=categories)
+
+        price = Q()
+        for param, lookup in (('min_price', 'gte'), ('max_price', 'lte')):
+            value = params.get(param, '').strip()
+            if value:
+                try:
+                    value = Decimal(value)
+                    if not value.is_finite():
+                        raise InvalidOperation
+                except InvalidOperation:
+                    raise ValidationError({param: 'A number is required.'})
+                price &= Q(**{f'price_per_night__{lookup}': value})
+        if price:
+            conditions['price'] = price
+
+        amenities = self.get_ids(params, 'amenities')
+        if amenities:
+            conditions['amenities'] = amenities_condition(amenities)
+        return conditions
+
+    @staticmethod
+    def get_ids(params, param):
+        try:
+            return sorted({int(value) for value in params.get(param, '').split(',') if value.strip()})
+        except ValueError:
+            raise ValidationError({param: 'A comma-separated list of ids is required.'})
+
+    def get_ordering(self, ordering):
+        result = []
+        for field in ordering.split(','):
+            field = field.strip()
+            descending = field.startswith('-')
+            expression = self.ordering_fields.get(field.lstrip('-'))
+            if expression is None:
+                raise ValidationError({self.ordering_param: f'Cannot order by "{field}".'})
+            result.append(expression.desc() if descending else expression.asc())
+        result.append(F('id').asc())
+        return result
@@ -0,0 +1,151 @@
+import base64
+import heapq
+from datetime import datetime, time, timedelta
+from itertools import islice
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+
+from src.apps.hotel.models import ArchivedBooking, ArchivedBookingCustomer, Booking, BookingCustomer
+
+UPCOMING = 'upcoming'
+PAST = 'past'
+
+PREFETCH = ('room__amenities', 'room__images', 'booking_customers__customer')
+
+
+def encode_cursor(check_in, booking_id):
+    raw = f'{check_in.isoformat()}|{booking_id}'.encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        check_in, booking_id = raw.split('|')
+        return datetime.fromisoformat(check_in), int(booking_id)
+    except ValueError:
+        raise ValidationError({'cursor': 'Invalid cursor.'})
+
+
+def parse_bound(params, name, end=False):
+    """
+    A datetime, or a date meaning the start of that day (of the next one for
+    an ``end`` bound, so the whole day is included), in the current time zone.
+    """
+    value = params.get(name, '').strip()
+    if not value:
+        return None
+    try:
+        moment = parse_datetime(value)
+        if moment is None:
+            day = parse_date(value)
+            if day is None:
+                raise ValueError
+            moment = datetime.combine(day + timedelta(days=end), time.min)
+    except ValueError:
+        raise ValidationError({name: 'A date or datetime is required.'})
+    return timezone.make_aware(moment) if timezone.is_naive(moment) else moment
+
+
+def history_params(params):
+    """
+    ``booking_history`` keyword arguments from the query parameters:
+    ``status`` (any of the listed statuses), ``when`` (``upcoming`` or
+    ``past``), ``check_in_from``/``check_in_to`` (dates or datetimes, the end
+    exclusive), ``cursor`` and ``page_size``.
+    """
+    statuses = [value for value in params.get('status', '').split(',') if value]
+    invalid = set(statuses) - set(Booking.BookingStatus.values)
+    if invalid:
+        raise ValidationError({'status': f'Unknown status: {", ".join(sorted(invalid))}.'})
+
+    when = params.get('when', '').strip() or None
+    if when not in (None, UPCOMING, PAST):
+        raise ValidationError({'when': f'Must be "{UPCOMING}" or "{PAST}".'})
+
+    size = params.get('page_size')
+    if size is None:
+        size = settings.BOOKING_HISTORY_PAGE_SIZE
+    else:
+        try:
+            size = int(size)
+        except ValueError:
+            raise ValidationError({'page_size': 'Must be an integer.'})
+        if size < 1:
+            raise ValidationError({'page_size': 'Must be positive.'})
+
+    cursor = params.get('cursor')
+    return {
+        'statuses': statuses,
+        'when': when,
+        'check_in_from': parse_bound(params, 'check_in_from'),
+        'check_in_to': parse_bound(params, 'check_in_to', end=True),
+        'after': decode_cursor(cursor) if cursor else None,
+        'size': min(size, settings.BOOKING_HISTORY_MAX_PAGE_SIZE),
+    }
+
+
+def booking_history(user, statuses=(), when=None, check_in_from=None, check_in_to=None, after=None, size=None):
+    """
+    One page of the bookings of ``user``, hot and archived together, and the
+    ``(check_in, booking id)`` key to pass as ``after`` for the next page, or
+    ``None`` on the last one.
+
+    Bookings come latest check-in first, or soonest first when ``when`` is
+    ``upcoming`` (not checked out yet). Pages are keyed on the check-in
+    copied to the customer rows, so each table is read as one range of its
+    ``(customer, check_in, booking)`` index, however long the history is.
+    Archived bookings keep their ids and check-in, so a booking archived
+    between two pages is neither skipped nor repeated.
+    """
+    size = size or settings.BOOKING_HISTORY_PAGE_SIZE
+    ascending = when == UPCOMING
+    now = timezone.now()
+
+    conditions = Q(customer=user)
+    if statuses:
+        conditions &= Q(booking__status__in=statuses)
+    if check_in_from is not None:
+        conditions &= Q(check_in__gte=check_in_from)
+    if check_in_to is not None:
+        conditions &= Q(check_in__lt=check_in_to)
+    if after is not None:
+        check_in, booking_id = after
+        lookup = 'gt' if ascending else 'lt'
+        conditions &= Q(**{f'check_in__{lookup}': check_in}) | Q(check_in=check_in, **{f'booking_id__{lookup}': booking_id})
+
+    hot = conditions
+    if when == UPCOMING:
+        hot &= Q(booking__check_out__gt=now)
+    elif when == PAST:
+        hot &= Q(booking__check_out__lte=now)
+    sources = [(BookingCustomer, Booking, hot)]
+    if when != UPCOMING:
+        # archived bookings checked out before the archive cutoff, so they are all past
+        sources.append((ArchivedBookingCustomer, ArchivedBooking, conditions))
+
+    order = ('check_in', 'booking_id') if ascending else ('-check_in', '-booking_id')
+    keys = [
+        [
+            (check_in, booking_id, model)
+            for check_in, booking_id in link_model.objects.filter(condition).order_by(*order).values_list(
+                'check_in', 'booking_id',
+            )[:size + 1]
+        ]
+        for link_model, model, condition in sources
+    ]
+    page = list(islice(heapq.merge(*keys, key=lambda key: key[:2], reverse=not ascending), size + 1))
+    next_key = page[size - 1][:2] if len(page) > size else None
+    page = page[:size]
+
+    bookings = {}
+    for _, model, _ in sources:
+        ids = [booking_id for _, booking_id, key_model in page if key_model is model]
+        if ids:
+            for booking in model.objects.filter(pk__in=ids).select_related('room').prefetch_related(*PREFETCH):
+                bookings[model, booking.pk] = booking
+    return [bookings[model, booking_id] for _, booking_id, model in page], next_key
@@ -0,0 +1,79 @@
+from datetime import timedelta
+
+from django.utils import timezone
+
+from src.apps.common.query_plans import hot_query
+from src.apps.hotel.models import ArchivedBookingCustomer, Booking, BookingCustomer, BookingPayment, QRCode, Room
+
+
+@hot_query('hotel.active_qr_code')
+def active_qr_code():
+    return QRCode.objects.filter(
+        booking_customer__customer=1,
+        booking_customer__booking=1,
+        status=QRCode.QRStatus.ACTIVE,
+    )
+
+
+@hot_query('hotel.blacklisted_qr_codes')
+def blacklisted_qr_codes():
+    return QRCode.objects.filter(status=QRCode.QRStatus.BLACKLISTED).values_list('id', flat=True)
+
+
+@hot_query('hotel.bookings_by_status_and_dates')
+def bookings_by_status_and_dates():
+    now = timezone.now()
+    return Booking.objects.filter(
+        status=Booking.BookingStatus.CREATED,
+        check_in__gte=now,
+        check_in__lt=now + timedelta(days=7),
+    )
+
+
+@hot_query('hotel.due_bookings')
+def due_bookings():
+    return Booking.objects.filter(status=Booking.BookingStatus.ACTIVE, check_out__lte=timezone.now())
+
+
+@hot_query('hotel.room_live_bookings')
+def room_live_bookings():
+    return Booking.objects.live().filter(room=1)
+
+
+@hot_query('hotel.customer_booking_links')
+def customer_booking_links():
+    return BookingCustomer.objects.filter(customer=1)
+
+
+@hot_query('hotel.customer_booking_history')
+def customer_booking_history():
+    return BookingCustomer.objects.filter(customer=1).order_by('-check_in', '-booking_id').values_list(
+        'check_in', 'booking_id',
+    )
+
+
+@hot_query('hotel.customer_archived_booking_history')
+def customer_archived_booking_history():
+    return ArchivedBookingCustomer.objects.filter(customer=1).order_by('-check_in', '-booking_id').values_list(
+        'check_in', 'booking_id',
+    )
+
+
+@hot_query('hotel.customer_bookings')
+def customer_bookings():
+    return Booking.objects.filter(customers=1)
+
+
+@hot_query('hotel.booking_owner')
+def booking_owner():
+    return BookingCustomer.objects.filter(booking=1, is_owner=True)
+
+
+@hot_query('hotel.pending_payments')
+def pending_payments():
+    return BookingPayment.objects.filter(status=BookingPayment.PaymentStatus.PENDING, pk__gt=0).order_by('pk')
+
+
+@hot_query('hotel.similar_rooms')
+def similar_rooms():
+    return Room.objects.filter(similar_to__room=1).order_by('similar_to__rank')
@@ -0,0 +1,59 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from src.apps.hotel import outbox
+from src.apps.hotel.models import Booking, Room
+
+
+def advance_bookings(now=None):
+    """
+    Move every due booking and room to its next status with one set-based
+    UPDATE per transition.
+
+    Each UPDATE only matches rows still in the source status, so the job is
+    idempotent and several nodes may run it at the same time: a row already
+    moved by another run simply no longer matches. Rooms marked as operated by
+    housekeeping are never touched. Bookings never activated before check-out
+    are cancelled only when ``BOOKING_CANCEL_NO_SHOWS`` is on.
+    """
+    now = now or timezone.now()
+    occupied = Exists(Booking.objects.live(now).filter(room=OuterRef('pk')))
+
+    with transaction.atomic():
+        # ids are read first so the outbox can record which bookings moved
+        completed = transition_bookings(
+            Booking.BookingStatus.ACTIVE, Booking.BookingStatus.COMPLETED, now,
+        )
+
+        canceled = 0
+        if settings.BOOKING_CANCEL_NO_SHOWS:
+            # never activated before check-out: a no-show
+            canceled = transition_bookings(
+                Booking.BookingStatus.CREATED, Booking.BookingStatus.CANCELED, now,
+            )
+
+        busy = Room.objects.filter(occupied, status=Room.RoomStatus.FREE).update(
+            status=Room.RoomStatus.BUSY, updated_at=now,
+        )
+        freed = Room.objects.filter(~occupied, status=Room.RoomStatus.BUSY).update(
+            status=Room.RoomStatus.FREE, updated_at=now,
+        )
+
+    return {
+        'bookings_completed': completed,
+        'bookings_canceled': canceled,
+        'rooms_busy': busy,
+        'rooms_freed': freed,
+    }
+
+
+def transition_bookings(source, target, now):
+    """Move bookings in ``source`` whose check-out has passed to ``target``."""
+    ids = list(
+        Booking.objects.filter(status=source, check_out__lte=now).values_list('pk', flat=True)
+    )
+    updated = Booking.objects.filter(pk__in=ids, status=source).update(status=target, updated_at=now)
+    outbox.record_changes(Booking, ids)
+    return updated
@@ -0,0 +1,312 @@
+import datetime
+import random
+from contextlib import contextmanager
+from decimal import Decimal
+from itertools import islice
+
+import phonenumbers
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.db import transaction
+
+from src.apps.common.validators import validate_phone_number
+from src.apps.hotel import facets, search
+from src.apps.hotel.models import (
+    Amenity, Booking, BookingCustomer, BookingPayment, Category, QRCode, Review, Room, RoomAmenity,
+)
+
+PHONE_REGIONS = ['UA', 'PL', 'DE', 'GB', 'US', 'FR', 'IT', 'ES', 'NL', 'CZ']
+FIRST_NAMES = [
+    'Olena', 'Andrii', 'Iryna', 'Taras', 'Anna', 'Piotr', 'Katarzyna', 'Jonas', 'Lena', 'Oliver',
+    'Amelia', 'James', 'Emma', 'Lucas', 'Chloe', 'Marco', 'Giulia', 'Pablo', 'Lucia', 'Jan',
+]
+LAST_NAMES = [
+    'Shevchenko', 'Kovalenko', 'Bondarenko', 'Nowak', 'Kowalski', 'Muller', 'Schmidt', 'Smith',
+    'Jones', 'Martin', 'Bernard', 'Rossi', 'Russo', 'Garcia', 'Lopez', 'de Vries', 'Novak', 'Dvorak',
+]
+CATEGORIES = ['Standard', 'Superior', 'Deluxe', 'Junior Suite', 'Suite', 'Family', 'Economy', 'Presidential']
+AMENITIES = [
+    'Wi-Fi', 'TV', 'Air Conditioning', 'Minibar', 'Balcony', 'Bathtub', 'Safe', 'Kettle',
+    'Sea View', 'Pet Friendly', 'Kitchenette', 'Work Desk',
+]
+REVIEW_TITLES = ['Great stay', 'Nice room', 'Would come back', 'Average', 'Too noisy', 'Perfect location']
+
+CHECK_IN_TIME = datetime.time(14)
+CHECK_OUT_TIME = datetime.time(12)
+MAX_NIGHTS = 14
+
+
+@contextmanager
+def historical_timestamps(*models):
+    """Let bulk inserts keep the ``auto_now``/``auto_now_add`` values set on generated rows."""
+    fields = [
+        field for model in models for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False)
+    ]
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class LoadDataGenerator:
+    """
+    Reproducible synthetic hotel history.
+
+    Every random choice comes from one ``random.Random(seed)``, so the same
+    seed, sizes and ``today`` always produce the same rows. Bookings are
+    generated lazily room by room and written in batches together with their
+    customers, payments, QR codes and reviews, so memory use is bounded by
+    ``batch_size`` rather than by the number of bookings.
+
+    Each room's history is split into equal slots, one booking per slot, with
+    check-in at 14:00 and check-out at 12:00, so bookings of a room never
+    overlap.
+    """
+
+    def __init__(self, seed=0, batch_size=5000, today=None, stdout=None):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.batch_size = batch_size
+        self.today = today or datetime.date.today()
+        self.tz = datetime.timezone.utc
+        # the moment statuses are derived from: midnight starting ``today``
+        self.now = datetime.datetime.combine(self.today, datetime.time(), self.tz)
+        self.stdout = stdout
+        self.counts = {}
+        self._phone_templates = [
+            phonenumbers.example_number_for_type(region, phonenumbers.PhoneNumberType.MOBILE)
+            for region in PHONE_REGIONS
+        ]
+
+    def log(self, key, value):
+        self.counts[key] = self.counts.get(key, 0) + value
+
+    def phone_number(self):
+        """A random mobile number of a random region that passes ``validate_phone_number``."""
+        template = self.rng.choice(self._phone_templates)
+        national = str(template.national_number)
+        for _ in range(20):
+            digits = ''.join(self.rng.choice('0123456789') for _ in range(6))
+            candidate = f'+{template.country_code}{national[:-6]}{digits}'
+            try:
+                validate_phone_number(candidate)
+            except ValidationError:
+                continue
+            return candidate
+        return f'+{template.country_code}{national}'
+
+    def generate_users(self, count, password):
+        User = get_user_model()
+        if User.objects.filter(email=self.email(0)).exists():
+            raise ValueError(f'Load data for seed {self.seed} already exists.')
+
+        password = make_password(password)  # hashing once keeps users cheap to generate
+        start = datetime.datetime.combine(self.today, datetime.time(), self.tz) - datetime.timedelta(days=5 * 365)
+
+        def users():
+            for index in range(count):
+                yield User(
+                    email=self.email(index),
+                    phone_number=self.phone_number(),
+                    first_name=self.rng.choice(FIRST_NAMES),
+                    last_name=self.rng.choice(LAST_NAMES),
+                    password=password,
+                    date_joined=start + datetime.timedelta(seconds=self.rng.randrange(5 * 365 * 86400)),
+                )
+
+        user_ids = []
+        with historical_timestamps(User):
+            for batch in batched(users(), self.batch_size):
+                user_ids.extend(user.pk for user in User.objects.bulk_create(batch))
+                self.log('users', len(batch))
+        return user_ids
+
+    def email(self, index):
+        return f'load{self.seed}.user{index}@example.com'
+
+    def generate_catalog(self, rooms, categories):
+        names = [
+            CATEGORIES[index % len(CATEGORIES)] + (f' {round_ + 1}' if round_ else '')
+            for round_, index in ((index // len(CATEGORIES), index) for index in range(categories))
+        ]
+        category_objects = self.get_or_create_named(Category, names, 'categories')
+        amenity_objects = self.get_or_create_named(Amenity, AMENITIES, 'amenities')
+        facets.assign_bits()
+
+        base_prices = {
+            category.pk: Decimal(self.rng.randrange(40, 400))
+            for category in category_objects
+        }
+        room_objects = []
+        for batch in batched(range(rooms), self.batch_size):
+            objects = []
+            for index in batch:
+                category = self.rng.choice(category_objects)
+                price = base_prices[category.pk] * Decimal(self.rng.randrange(90, 130)) / 100
+                objects.append(Room(
+                    title=f'Room {index + 1} (load {self.seed})',
+                    description=f'{category.name} room on floor {index // 20 + 1}',
+                    price_per_night=price.quantize(Decimal('0.01')),
+                    category=category,
+                ))
+            room_objects.extend(Room.objects.bulk_create(objects))
+
+            RoomAmenity.objects.bulk_create([
+                RoomAmenity(room=room, amenity=amenity)
+                for room in objects
+                for amenity in self.rng.sample(amenity_objects, self.rng.randint(2, 8))
+            ])
+            facets.refresh_amenity_masks([room.pk for room in objects])
+            search.index_rooms([room.pk for room in objects])
+            self.log('rooms', len(objects))
+        return [(room.pk, room.price_per_night) for room in room_objects]
+
+    def get_or_create_named(self, model, names, key):
+        existing = {obj.name: obj for obj in model.objects.filter(name__in=names).order_by('-pk')}
+        missing = [model(name=name, description=f'{name} (generated)') for name in names if name not in existing]
+        model.objects.bulk_create(missing)
+        existing.update((obj.name, obj) for obj in missing)
+        self.log(key, len(missing))
+        return [existing[name] for name in names]
+
+    def booking_plans(self, rooms, count, start, end):
+        """
+        Yield ``(room_id, check_in, check_out, total_price)`` for exactly
+        ``count`` bookings, one room at a time; the first ``count % len(rooms)``
+        rooms get one booking more than the others.
+        """
+        span = (end - start).days
+        base, extra = divmod(count, len(rooms))
+        for position, (room_id, price) in enumerate(rooms):
+            per_room = base + (position < extra)
+            if not per_room:
+                break
+            slot = span / per_room
+            for index in range(per_room):
+                slot_start = int(index * slot)
+                length = int((index + 1) * slot) - slot_start
+                nights = self.rng.randint(1, min(MAX_NIGHTS, length))
+                day = start + datetime.timedelta(days=slot_start + self.rng.randint(0, length - nights))
+                yield (
+                    room_id,
+                    datetime.datetime.combine(day, CHECK_IN_TIME, self.tz),
+                    datetime.datetime.combine(day + datetime.timedelta(days=nights), CHECK_OUT_TIME, self.tz),
+                    price * nights,
+                )
+
+    def booking_status(self, check_in, check_out, now):
+        if check_out <= now:
+            if self.rng.random() < 0.1:
+                return Booking.BookingStatus.CANCELED
+            return Booking.BookingStatus.COMPLETED
+        if check_in <= now:
+            return Booking.BookingStatus.ACTIVE
+        return Booking.BookingStatus.CREATED
+
+    def booking_window(self, rooms, count, years, future_days):
+        """Return ``(start, end, most bookings per room)``, or raise if the rooms cannot hold ``count`` bookings."""
+        start = self.today - datetime.timedelta(days=int(years * 365))
+        end = self.today + datetime.timedelta(days=future_days)
+        per_room = -(-count // rooms)
+        if (end - start).days < per_room:
+            raise ValueError(
+                f'{per_room} bookings per room do not fit in {(end - start).days} days; '
+                f'add rooms or years.'
+            )
+        return start, end, per_room
+
+    def generate_bookings(self, rooms, user_ids, count, years, future_days, review_rate):
+        start, end, _ = self.booking_window(len(rooms), count, years, future_days)
+
+        now = self.now
+        with historical_timestamps(Booking, BookingPayment, QRCode, Review):
+            for batch in batched(self.booking_plans(rooms, count, start, end), self.batch_size):
+                with transaction.atomic():
+                    self.write_bookings(batch, user_ids, now, review_rate)
+                if self.stdout:
+                    self.stdout.write(f'bookings: {self.counts["bookings"]}')
+
+    def write_bookings(self, plans, user_ids, now, review_rate):
+        bookings = []
+        for room_id, check_in, check_out, total_price in plans:
+            created_at = min(
+                check_in - datetime.timedelta(days=self.rng.randint(1, 90), minutes=self.rng.randrange(1440)),
+                now,
+            )
+            bookings.append(Booking(
+                room_id=room_id,
+                check_in=check_in,
+                check_out=check_out,
+                total_price=total_price,
+                status=self.booking_status(check_in, check_out, now),
+                created_at=created_at,
+                updated_at=min(check_out, now),
+            ))
+        Booking.objects.bulk_create(bookings)
+
+        customers = []
+        for booking in bookings:
+            group = self.rng.sample(user_ids, self.rng.choices((1, 2, 3), (5, 4, 1))[0])
+            for position, user_id in enumerate(group):
+                customers.append(BookingCustomer(
+                    booking=booking, customer_id=user_id, is_owner=position == 0, check_in=booking.check_in,
+                ))
+        BookingCustomer.objects.bulk_create(customers)
+
+        payment_status = {
+            Booking.BookingStatus.COMPLETED: BookingPayment.PaymentStatus.COMPLETED,
+            Booking.BookingStatus.ACTIVE: BookingPayment.PaymentStatus.COMPLETED,
+            Booking.BookingStatus.CANCELED: BookingPayment.PaymentStatus.CANCELED,
+            Booking.BookingStatus.CREATED: BookingPayment.PaymentStatus.PENDING,
+        }
+        BookingPayment.objects.bulk_create([
+            BookingPayment(
+                booking=booking,
+                amount=booking.total_price,
+                status=payment_status[booking.status],
+                created_at=booking.created_at + datetime.timedelta(minutes=self.rng.randint(1, 30)),
+            )
+            for booking in bookings
+        ])
+
+        qr_codes, reviews = [], []
+        for customer in customers:
+            booking = customer.booking
+            if booking.status in (Booking.BookingStatus.ACTIVE, Booking.BookingStatus.COMPLETED):
+                # codes exist from activation on; rows only, images are not rendered for generated data
+                qr_codes.append(QRCode(
+                    booking_customer=customer,
+                    qr_code=f'qr_codes/qr_code_{customer.pk}.png',
+                    created_at=booking.check_in,
+                ))
+            if booking.status == Booking.BookingStatus.COMPLETED and customer.is_owner \
+                    and self.rng.random() < review_rate:
+                written = booking.check_out + datetime.timedelta(days=self.rng.randint(0, 14))
+                reviews.append(Review(
+                    booking_customer=customer,
+                    title=self.rng.choice(REVIEW_TITLES),
+                    rating=self.rng.choices((1, 2, 3, 4, 5), (1, 1, 3, 8, 12))[0],
+                    content=None,
+                    created_at=written,
+                    updated_at=written,
+                ))
+        QRCode.objects.bulk_create(qr_codes)
+        Review.objects.bulk_create(reviews)
+
+        self.log('bookings', len(bookings))
+        self.log('booking_customers', len(customers))
+        self.log('payments', len(bookings))
+        self.log('qr_codes', len(qr_codes))
+        self.log('reviews', len(reviews))
@@ -0,0 +1,32 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from src.apps.hotel.lifecycle import advance_bookings
+
+
+class Command(BaseCommand):
+    help = (
+        'Complete finished bookings, cancel no-shows when BOOKING_CANCEL_NO_SHOWS '
+        'is on, and update room statuses with set-based updates. Safe to run '
+        'from cron on several nodes.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=0,
+            help='Keep running and advance bookings every N seconds instead of once.',
+        )
+
+    def handle(self, *args, **options):
+        interval = options['interval']
+
+        while True:
+            result = advance_bookings()
+            self.stdout.write(', '.join(f'{key}: {value}' for key, value in result.items()))
+
+            if not interval:
+                break
+            time.sleep(interval)
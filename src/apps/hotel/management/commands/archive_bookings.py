@@ -0,0 +1,29 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from src.apps.hotel.archive import archive_bookings
+
+
+class Command(BaseCommand):
+    help = (
+        'Move completed and canceled bookings, with their customers, payments, '
+        'QR codes and reviews, into the archive tables in batched transactions.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--older-than-days',
+            type=int,
+            help='Archive bookings that checked out this many days ago. Defaults to BOOKING_ARCHIVE_AFTER.',
+        )
+        parser.add_argument('--batch-size', type=int, help='Defaults to BOOKING_ARCHIVE_BATCH_SIZE.')
+
+    def handle(self, *args, **options):
+        cutoff = None
+        if options['older_than_days'] is not None:
+            cutoff = timezone.now() - timedelta(days=options['older_than_days'])
+
+        archived = archive_bookings(cutoff=cutoff, batch_size=options['batch_size'])
+        self.stdout.write(f'Archived {archived} bookings.')
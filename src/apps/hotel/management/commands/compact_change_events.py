@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from src.apps.hotel.outbox import compact
+
+
+class Command(BaseCommand):
+    help = (
+        'Apply the change feed retention policy: keep only the latest event per '
+        'object once older than OUTBOX_RETENTION and drop old deletion events.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, help='Defaults to OUTBOX_BATCH_SIZE.')
+
+    def handle(self, *args, **options):
+        removed = compact(batch_size=options['batch_size'])
+        self.stdout.write(f'Removed {removed} change events.')
@@ -0,0 +1,68 @@
+import datetime
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from src.apps.hotel.lifecycle import advance_bookings
+from src.apps.hotel.loadgen import LoadDataGenerator
+
+
+class Command(BaseCommand):
+    help = (
+        'Generate a reproducible synthetic hotel history for performance work: '
+        'users, categories, amenities, rooms, and non-overlapping bookings with '
+        'customers, payments, QR codes and reviews. Never run against production.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seed', type=int, default=0, help='Same seed and sizes give the same data.')
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--rooms', type=int, default=100)
+        parser.add_argument('--categories', type=int, default=5)
+        parser.add_argument('--bookings', type=int, default=10000, help='Spread evenly over the rooms.')
+        parser.add_argument('--years', type=float, default=3, help='Years of booking history before today.')
+        parser.add_argument('--future-days', type=int, default=90, help='Days of upcoming bookings after today.')
+        parser.add_argument('--review-rate', type=float, default=0.3, help='Share of completed bookings reviewed.')
+        parser.add_argument('--password', default='loadtest', help='Password of every generated user.')
+        parser.add_argument(
+            '--today',
+            type=datetime.date.fromisoformat,
+            help='Date the history is built around (YYYY-MM-DD), fix it for reproducible runs.',
+        )
+        parser.add_argument('--batch-size', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        if options['users'] < 3:
+            raise CommandError('At least 3 users are needed to fill bookings.')
+        if options['rooms'] < 1 or options['categories'] < 1:
+            raise CommandError('At least one room and one category are needed.')
+
+        generator = LoadDataGenerator(
+            seed=options['seed'],
+            batch_size=options['batch_size'],
+            today=options['today'],
+            stdout=self.stdout if options['verbosity'] > 1 else None,
+        )
+
+        started = time.monotonic()
+        try:
+            generator.booking_window(options['rooms'], options['bookings'], options['years'], options['future_days'])
+            user_ids = generator.generate_users(options['users'], options['password'])
+            rooms = generator.generate_catalog(options['rooms'], options['categories'])
+            generator.generate_bookings(
+                rooms,
+                user_ids,
+                count=options['bookings'],
+                years=options['years'],
+                future_days=options['future_days'],
+                review_rate=options['review_rate'],
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        # bring stored room statuses in line with the generated bookings, as of --today
+        advance_bookings(now=generator.now)
+
+        for key, value in generator.counts.items():
+            self.stdout.write(f'{key}: {value}')
+        self.stdout.write(self.style.SUCCESS(f'Generated in {time.monotonic() - started:.1f}s.'))
@@ -0,0 +1,59 @@
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from src.apps.hotel.catalog import CatalogError, import_catalog, load_manifest
+
+
+class Command(BaseCommand):
+    help = (
+        'Import categories, amenities, rooms, amenity links and room images from a '
+        'JSON or CSV manifest. Rows are upserted on their names and titles, so a '
+        'manifest can be re-imported after editing it.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('manifest', help='Path to a .json or .csv manifest.')
+        parser.add_argument(
+            '--files-dir',
+            help='Directory image and icon paths are relative to. Defaults to the manifest directory.',
+        )
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--workers', type=int, default=8, help='Threads copying image files.')
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Validate the manifest and report the changes without writing anything.',
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options['manifest'])
+        if not path.is_file():
+            raise CommandError(f'Manifest {path} does not exist.')
+
+        started = time.monotonic()
+        try:
+            manifest = load_manifest(path)
+            result = import_catalog(
+                manifest,
+                base_dir=options['files_dir'] or path.parent,
+                batch_size=options['batch_size'],
+                workers=options['workers'],
+                dry_run=options['dry_run'],
+            )
+        except CatalogError as e:
+            raise CommandError(f'Invalid manifest:\n{e}')
+        except (ValueError, KeyError) as e:
+            raise CommandError(f'Could not read manifest: {e}')
+
+        for key, value in result.counts.items():
+            self.stdout.write(f'{key}: {value}')
+
+        elapsed = time.monotonic() - started
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING(f'Dry run, nothing was written ({elapsed:.2f}s).'))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f'Imported {len(manifest["rooms"])} rooms in {elapsed:.2f}s.'
+            ))
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from src.apps.hotel.search import rebuild
+
+
+class Command(BaseCommand):
+    help = (
+        'Rebuild the room full-text search index from scratch, e.g. after rows '
+        'were changed with raw SQL or restored from a dump.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        indexed = rebuild(batch_size=options['batch_size'])
+        self.stdout.write(f'Indexed {indexed} rooms.')
@@ -0,0 +1,33 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from src.apps.hotel.payments import reconcile_payments
+
+
+class Command(BaseCommand):
+    help = (
+        'Fetch the provider status of every pending payment in bulk and settle '
+        'payments and unpaid bookings with set-based updates.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, help='Defaults to PAYMENT_RECONCILE_BATCH_SIZE.')
+        parser.add_argument('--concurrency', type=int, help='Defaults to PAYMENT_RECONCILE_CONCURRENCY.')
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=0,
+            help='Keep running and reconcile every N seconds instead of once.',
+        )
+
+    def handle(self, *args, **options):
+        interval = options['interval']
+
+        while True:
+            result = reconcile_payments(batch_size=options['batch_size'], concurrency=options['concurrency'])
+            self.stdout.write(', '.join(f'{key}: {value}' for key, value in result.items()))
+
+            if not interval:
+                break
+            time.sleep(interval)
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from src.apps.hotel.similarity import refresh_similar_rooms
+
+
+class Command(BaseCommand):
+    help = (
+        'Rank rooms by similarity of amenities, category, price and co-booking '
+        'history and store the top SIMILAR_ROOMS_TOP_K per room. Only rooms '
+        'changed since the last run are rescored unless --full is given.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--full', action='store_true', help='Rescore every pair of rooms.')
+        parser.add_argument('--top-k', type=int, help='Defaults to SIMILAR_ROOMS_TOP_K.')
+        parser.add_argument('--batch-size', type=int, help='Defaults to SIMILAR_ROOMS_BATCH_SIZE.')
+
+    def handle(self, *args, **options):
+        run = refresh_similar_rooms(
+            full=options['full'],
+            top_k_size=options['top_k'],
+            batch_size=options['batch_size'],
+        )
+        kind = 'full' if run.full else 'incremental'
+        self.stdout.write(f'Refreshed similar rooms of {run.rooms_refreshed} rooms ({kind} run).')
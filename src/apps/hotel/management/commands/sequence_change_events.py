@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from src.apps.hotel.outbox import sequence_events
+
+
+class Command(BaseCommand):
+    help = (
+        'Number committed change events that have no feed cursor yet. Writers do '
+        'this after their commit; run it periodically to catch events whose '
+        'process stopped before it could.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, help='Defaults to OUTBOX_BATCH_SIZE.')
+
+    def handle(self, *args, **options):
+        numbered = sequence_events(batch_size=options['batch_size'])
+        self.stdout.write(f'Numbered {numbered} change events.')
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.1 on 2026-10-19 18:17
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hotel', '0003_auto_20250514_0032'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='bookingcustomer',
+            name='customer',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='booking_customers', to=settings.AUTH_USER_MODEL, verbose_name='Customer'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['status', 'check_in'], name='booking_status_check_in_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bookingcustomer',
+            index=models.Index(condition=models.Q(('is_owner', True)), fields=['booking'], name='booking_customer_owner_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='qrcode',
+            index=models.Index(condition=models.Q(('status', 'active')), fields=['booking_customer'], name='qrcode_active_idx'),
+        ),
+    ]
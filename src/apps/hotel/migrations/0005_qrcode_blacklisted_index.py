@@ -0,0 +1,17 @@
+# Generated by Django 5.2.1 on 2026-10-19 18:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hotel', '0004_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='qrcode',
+            index=models.Index(condition=models.Q(('status', 'blacklisted')), fields=['id'], name='qrcode_blacklisted_idx'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.1 on 2026-10-19 18:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hotel', '0007_admin_date_hierarchy_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bookingpayment',
+            name='provider',
+            field=models.CharField(blank=True, max_length=50, verbose_name='Payment provider'),
+        ),
+        migrations.AddField(
+            model_name='bookingpayment',
+            name='provider_reference',
+            field=models.CharField(blank=True, max_length=255, verbose_name='Provider reference'),
+        ),
+        migrations.AddField(
+            model_name='bookingpayment',
+            name='settled_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Settled at'),
+        ),
+        migrations.AddIndex(
+            model_name='bookingpayment',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['id'], name='payment_pending_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='bookingpayment',
+            constraint=models.UniqueConstraint(condition=models.Q(('provider_reference', ''), _negated=True), fields=('provider', 'provider_reference'), name='unique_payment_provider_reference'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.1 on 2026-10-19 18:36
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hotel', '0008_booking_payment_provider'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChangeEvent',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('entity', models.CharField(max_length=30, verbose_name='Entity')),
+                ('object_id', models.BigIntegerField(verbose_name='Object id')),
+                ('action', models.CharField(choices=[('created', 'Created'), ('updated', 'Updated'), ('deleted', 'Deleted')], max_length=10, verbose_name='Action')),
+                ('data', models.JSONField(blank=True, encoder=django.core.serializers.json.DjangoJSONEncoder, null=True, verbose_name='Data')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created at')),
+            ],
+            options={
+                'verbose_name': 'Change event',
+                'verbose_name_plural': 'Change events',
+                'indexes': [models.Index(fields=['entity', 'object_id', 'id'], name='change_event_object_idx'), models.Index(fields=['created_at'], name='change_event_created_at_idx')],
+            },
+        ),
+    ]
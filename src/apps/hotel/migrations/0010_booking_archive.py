@@ -0,0 +1,104 @@
+# Generated by Django 5.2.1 on 2026-10-19 18:38
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hotel', '0009_change_events'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedBooking',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('check_in', models.DateTimeField(verbose_name='Check-in')),
+                ('check_out', models.DateTimeField(verbose_name='Check-out')),
+                ('total_price', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='Total price')),
+                ('status', models.CharField(choices=[('created', 'Created'), ('active', 'Active'), ('completed', 'Completed'), ('canceled', 'Canceled')], max_length=20, verbose_name='Booking status')),
+                ('created_at', models.DateTimeField(verbose_name='Created at')),
+                ('updated_at', models.DateTimeField(verbose_name='Updated at')),
+                ('archived_at', models.DateTimeField(auto_now_add=True, verbose_name='Archived at')),
+                ('room', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_bookings', to='hotel.room', verbose_name='Room')),
+            ],
+            options={
+                'verbose_name': 'Archived booking',
+                'verbose_name_plural': 'Archived bookings',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedBookingCustomer',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('is_owner', models.BooleanField(default=False, verbose_name='Is owner')),
+                ('booking', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='booking_customers', to='hotel.archivedbooking', verbose_name='Booking')),
+                ('customer', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='archived_booking_customers', to=settings.AUTH_USER_MODEL, verbose_name='Customer')),
+            ],
+            options={
+                'verbose_name': 'Archived booking customer',
+                'verbose_name_plural': 'Archived booking customers',
+            },
+        ),
+        migrations.AddField(
+            model_name='archivedbooking',
+            name='customers',
+            field=models.ManyToManyField(related_name='archived_bookings', through='hotel.ArchivedBookingCustomer', to=settings.AUTH_USER_MODEL, verbose_name='Customers'),
+        ),
+        migrations.CreateModel(
+            name='ArchivedBookingPayment',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='Amount')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('completed', 'Completed'), ('canceled', 'Canceled')], max_length=20, verbose_name='Payment status')),
+                ('provider', models.CharField(blank=True, max_length=50, verbose_name='Payment provider')),
+                ('provider_reference', models.CharField(blank=True, max_length=255, verbose_name='Provider reference')),
+                ('created_at', models.DateTimeField(verbose_name='Created at')),
+                ('settled_at', models.DateTimeField(blank=True, null=True, verbose_name='Settled at')),
+                ('booking', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='payments', to='hotel.archivedbooking', verbose_name='Booking')),
+            ],
+            options={
+                'verbose_name': 'Archived booking payment',
+                'verbose_name_plural': 'Archived booking payments',
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedQRCode',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('qr_code', models.CharField(blank=True, max_length=100, verbose_name='QR Code')),
+                ('status', models.CharField(choices=[('blacklisted', 'Blacklisted'), ('active', 'Active')], max_length=20, verbose_name='Status')),
+                ('created_at', models.DateTimeField(verbose_name='Created at')),
+                ('booking_customer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='qr_codes', to='hotel.archivedbookingcustomer', verbose_name='Booking customer')),
+            ],
+            options={
+                'verbose_name': 'Archived QR code',
+                'verbose_name_plural': 'Archived QR codes',
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedReview',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=254, verbose_name='Title')),
+                ('rating', models.PositiveIntegerField(verbose_name='Rating')),
+                ('content', models.TextField(null=True, verbose_name='Content')),
+                ('created_at', models.DateTimeField(verbose_name='Created at')),
+                ('updated_at', models.DateTimeField(verbose_name='Updated at')),
+                ('booking_customer', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='review', to='hotel.archivedbookingcustomer', verbose_name='Booking customer')),
+            ],
+            options={
+                'verbose_name': 'Archived review',
+                'verbose_name_plural': 'Archived reviews',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='archivedbookingcustomer',
+            index=models.Index(fields=['customer', 'booking'], name='archived_booking_customer_idx'),
+        ),
+    ]
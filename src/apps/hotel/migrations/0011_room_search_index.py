@@ -0,0 +1,68 @@
+from django.db import migrations
+
+SQLITE_CREATE = """
+CREATE VIRTUAL TABLE hotel_room_fts USING fts5(
+    title, category, amenities, description,
+    tokenize = 'unicode61 remove_diacritics 2'
+)
+"""
+
+SQLITE_FILL = """
+INSERT INTO hotel_room_fts (rowid, title, category, amenities, description)
+SELECT r.id, r.title, c.name,
+       COALESCE((SELECT group_concat(a.name, ' ')
+                 FROM hotel_roomamenity ra JOIN hotel_amenity a ON a.id = ra.amenity_id
+                 WHERE ra.room_id = r.id), ''),
+       COALESCE(r.description, '')
+FROM hotel_room r JOIN hotel_category c ON c.id = r.category_id
+"""
+
+POSTGRES_CREATE = """
+CREATE TABLE hotel_room_search (
+    room_id bigint PRIMARY KEY REFERENCES hotel_room (id) ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED,
+    document tsvector NOT NULL
+);
+CREATE INDEX hotel_room_search_document_idx ON hotel_room_search USING gin (document);
+"""
+
+POSTGRES_FILL = """
+INSERT INTO hotel_room_search (room_id, document)
+SELECT r.id,
+       setweight(to_tsvector('simple', r.title), 'A')
+       || setweight(to_tsvector('simple', c.name), 'B')
+       || setweight(to_tsvector('simple', COALESCE((SELECT string_agg(a.name, ' ')
+                                                     FROM hotel_roomamenity ra
+                                                     JOIN hotel_amenity a ON a.id = ra.amenity_id
+                                                     WHERE ra.room_id = r.id), '')), 'C')
+       || setweight(to_tsvector('simple', COALESCE(r.description, '')), 'D')
+FROM hotel_room r JOIN hotel_category c ON c.id = r.category_id
+"""
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        schema_editor.execute(SQLITE_CREATE)
+        schema_editor.execute(SQLITE_FILL)
+    elif vendor == 'postgresql':
+        schema_editor.execute(POSTGRES_CREATE)
+        schema_editor.execute(POSTGRES_FILL)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        schema_editor.execute('DROP TABLE hotel_room_fts')
+    elif vendor == 'postgresql':
+        schema_editor.execute('DROP TABLE hotel_room_search')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hotel', '0010_booking_archive'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.1 on 2026-10-19 18:43
+
+from django.db import migrations, models
+
+
+def fill_amenity_masks(apps, schema_editor):
+    Amenity = apps.get_model('hotel', 'Amenity')
+    Room = apps.get_model('hotel', 'Room')
+    RoomAmenity = apps.get_model('hotel', 'RoomAmenity')
+
+    amenities = list(Amenity.objects.order_by('pk')[:63])
+    for bit, amenity in enumerate(amenities):
+        amenity.bit = bit
+    Amenity.objects.bulk_update(amenities, ['bit'])
+
+    masks = {}
+    for room_id, bit in RoomAmenity.objects.filter(amenity__bit__isnull=False).values_list('room_id', 'amenity__bit'):
+        masks[room_id] = masks.get(room_id, 0) | 1 << bit
+    Room.objects.bulk_update(
+        [Room(pk=room_id, amenity_mask=mask) for room_id, mask in masks.items()],
+        ['amenity_mask'],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hotel', '0011_room_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='amenity',
+            name='bit',
+            field=models.PositiveSmallIntegerField(editable=False, null=True, unique=True, verbose_name='Bit'),
+        ),
+        migrations.AddField(
+            model_name='room',
+            name='amenity_mask',
+            field=models.BigIntegerField(default=0, editable=False, verbose_name='Amenity mask'),
+        ),
+        migrations.RunPython(fill_amenity_masks, migrations.RunPython.noop),
+    ]
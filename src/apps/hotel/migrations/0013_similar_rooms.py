@@ -0,0 +1,43 @@
+# Generated by Django 5.2.1 on 2026-10-19 18:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hotel', '0012_amenity_mask'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SimilarityRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('started_at', models.DateTimeField(verbose_name='Started at')),
+                ('last_booking_customer_id', models.BigIntegerField(default=0, verbose_name='Last booking customer id')),
+                ('full', models.BooleanField(verbose_name='Full run')),
+                ('rooms_refreshed', models.PositiveIntegerField(default=0, verbose_name='Rooms refreshed')),
+            ],
+            options={
+                'verbose_name': 'Similarity run',
+                'verbose_name_plural': 'Similarity runs',
+            },
+        ),
+        migrations.CreateModel(
+            name='SimilarRoom',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rank', models.PositiveSmallIntegerField(verbose_name='Rank')),
+                ('score', models.FloatField(verbose_name='Score')),
+                ('room', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='similar_rooms', to='hotel.room', verbose_name='Room')),
+                ('similar', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='similar_to', to='hotel.room', verbose_name='Similar room')),
+            ],
+            options={
+                'verbose_name': 'Similar room',
+                'verbose_name_plural': 'Similar rooms',
+                'constraints': [models.UniqueConstraint(fields=('room', 'rank'), name='unique_similar_room_rank')],
+            },
+        ),
+    ]
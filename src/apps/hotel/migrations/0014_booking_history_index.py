@@ -0,0 +1,55 @@
+# Generated by Django 5.2.1 on 2026-10-19 21:05
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def fill_check_in(apps, schema_editor):
+    for link_name, booking_name in (
+        ('BookingCustomer', 'Booking'),
+        ('ArchivedBookingCustomer', 'ArchivedBooking'),
+    ):
+        link = apps.get_model('hotel', link_name)
+        booking = apps.get_model('hotel', booking_name)
+        link.objects.update(
+            check_in=Subquery(booking.objects.filter(pk=OuterRef('booking_id')).values('check_in')[:1]),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hotel', '0013_similar_rooms'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivedbookingcustomer',
+            name='check_in',
+            field=models.DateTimeField(null=True, verbose_name='Check-in'),
+        ),
+        migrations.AddField(
+            model_name='bookingcustomer',
+            name='check_in',
+            field=models.DateTimeField(editable=False, null=True, verbose_name='Check-in'),
+        ),
+        migrations.RunPython(fill_check_in, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='archivedbookingcustomer',
+            name='check_in',
+            field=models.DateTimeField(verbose_name='Check-in'),
+        ),
+        migrations.AlterField(
+            model_name='bookingcustomer',
+            name='check_in',
+            field=models.DateTimeField(editable=False, verbose_name='Check-in'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedbookingcustomer',
+            index=models.Index(fields=['customer', 'check_in', 'booking'], name='archived_customer_history_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bookingcustomer',
+            index=models.Index(fields=['customer', 'check_in', 'booking'], name='booking_customer_history_idx'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.1 on 2026-10-19 19:05
+
+from django.db import migrations, models
+from django.db.models import F, Max
+
+
+def number_existing_events(apps, schema_editor):
+    # ids become the sequence, so cursors consumers already hold stay valid
+    ChangeEvent = apps.get_model('hotel', 'ChangeEvent')
+    ChangeSequence = apps.get_model('hotel', 'ChangeSequence')
+    ChangeEvent.objects.update(sequence=F('id'))
+    ChangeSequence.objects.create(pk=1, last=ChangeEvent.objects.aggregate(last=Max('id'))['last'] or 0)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hotel', '0014_booking_history_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChangeSequence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('last', models.BigIntegerField(default=0, verbose_name='Last sequence')),
+            ],
+            options={
+                'verbose_name': 'Change sequence',
+                'verbose_name_plural': 'Change sequence',
+            },
+        ),
+        migrations.AddField(
+            model_name='changeevent',
+            name='sequence',
+            field=models.BigIntegerField(editable=False, null=True, unique=True, verbose_name='Sequence'),
+        ),
+        migrations.AddIndex(
+            model_name='changeevent',
+            index=models.Index(condition=models.Q(('sequence__isnull', True)), fields=['id'], name='change_event_unsequenced_idx'),
+        ),
+        migrations.RunPython(number_existing_events, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,7 @@
 from django.contrib.auth import get_user_model
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from src.apps.common.models import TitledTimestampedBaseModel, TimestampedBaseModel
@@ -40,6 +42,13 @@ class Amenity(models.Model):
         verbose_name=_('Description'),
         null=True,
     )
+    # position in Room.amenity_mask, assigned on creation while bits are free
+    bit = models.PositiveSmallIntegerField(
+        verbose_name=_('Bit'),
+        null=True,
+        unique=True,
+        editable=False,
+    )
 
     def __str__(self):
         return self.name
@@ -49,6 +58,25 @@ class Amenity(models.Model):
         verbose_name_plural = _('Amenities')
 
 
+class RoomQuerySet(models.QuerySet):
+    def with_occupancy(self, at=None):
+        """
+        Annotate ``occupancy_status``: ``operated`` when housekeeping has taken
+        the room out of service, otherwise ``busy`` or ``free`` depending on
+        whether a live booking covers ``at``.
+        """
+        at = at or timezone.now()
+        occupied = models.Exists(Booking.objects.live(at).filter(room=models.OuterRef('pk')))
+        return self.annotate(
+            occupancy_status=models.Case(
+                models.When(status=Room.RoomStatus.OPERATED, then=models.Value(Room.RoomStatus.OPERATED)),
+                models.When(occupied, then=models.Value(Room.RoomStatus.BUSY)),
+                default=models.Value(Room.RoomStatus.FREE),
+                output_field=models.CharField(max_length=20),
+            )
+        )
+
+
 class Room(TitledTimestampedBaseModel):
     class RoomStatus(models.TextChoices):
         FREE = 'free', _('Free')
@@ -84,6 +112,14 @@ class Room(TitledTimestampedBaseModel):
         related_name='rooms',
         verbose_name=_('Amenities'),
     )
+    # bit set of the amenities' ``Amenity.bit``, kept in sync from RoomAmenity
+    amenity_mask = models.BigIntegerField(
+        verbose_name=_('Amenity mask'),
+        default=0,
+        editable=False,
+    )
+
+    objects = RoomQuerySet.as_manager()
 
     def __str__(self):
         return self.title
@@ -142,6 +178,83 @@ class RoomAmenity(models.Model):
         ]
 
 
+class SimilarRoom(models.Model):
+    """
+    One of the ``SIMILAR_ROOMS_TOP_K`` rooms most similar to ``room``, as
+    ranked offline by ``refresh_similar_rooms``; ``rank`` 1 is the closest.
+    """
+    room = models.ForeignKey(
+        Room,
+        on_delete=models.CASCADE,
+        related_name='similar_rooms',
+        verbose_name=_('Room'),
+    )
+    similar = models.ForeignKey(
+        Room,
+        on_delete=models.CASCADE,
+        related_name='similar_to',
+        verbose_name=_('Similar room'),
+    )
+    rank = models.PositiveSmallIntegerField(
+        verbose_name=_('Rank'),
+    )
+    score = models.FloatField(
+        verbose_name=_('Score'),
+    )
+
+    def __str__(self):
+        return f'{self.room_id} ~ {self.similar_id} ({self.rank})'
+
+    class Meta:
+        verbose_name = _('Similar room')
+        verbose_name_plural = _('Similar rooms')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['room', 'rank'],
+                name='unique_similar_room_rank',
+            )
+        ]
+
+
+class SimilarityRun(models.Model):
+    """
+    A ``refresh_similar_rooms`` run. The latest one tells the next
+    incremental run which rooms and booking customers it has already seen.
+    """
+    started_at = models.DateTimeField(
+        verbose_name=_('Started at'),
+    )
+    last_booking_customer_id = models.BigIntegerField(
+        verbose_name=_('Last booking customer id'),
+        default=0,
+    )
+    full = models.BooleanField(
+        verbose_name=_('Full run'),
+    )
+    rooms_refreshed = models.PositiveIntegerField(
+        verbose_name=_('Rooms refreshed'),
+        default=0,
+    )
+
+    def __str__(self):
+        return f'Similarity run {self.started_at:%Y-%m-%d %H:%M}'
+
+    class Meta:
+        verbose_name = _('Similarity run')
+        verbose_name_plural = _('Similarity runs')
+
+
+class BookingQuerySet(models.QuerySet):
+    def live(self, at=None):
+        """Bookings holding their room at ``at``."""
+        at = at or timezone.now()
+        return self.filter(
+            status__in=Booking.LIVE_STATUSES,
+            check_in__lte=at,
+            check_out__gt=at,
+        )
+
+
 class Booking(TimestampedBaseModel):
     class BookingStatus(models.TextChoices):
         CREATED = 'created', _('Created')
@@ -149,6 +262,9 @@ class Booking(TimestampedBaseModel):
         COMPLETED = 'completed', _('Completed')
         CANCELED = 'canceled', _('Canceled')
 
+    # statuses that hold the room for the whole check-in/check-out window
+    LIVE_STATUSES = [BookingStatus.CREATED, BookingStatus.ACTIVE]
+
     check_in = models.DateTimeField(
         verbose_name=_('Check-in'),
         null=False,
@@ -183,6 +299,8 @@ class Booking(TimestampedBaseModel):
         verbose_name=_('Customers'),
     )
 
+    objects = BookingQuerySet.as_manager()
+
     def __str__(self):
         return f'Booking for {self.room.title} from {self.check_in} to {self.check_out}'
 
@@ -199,6 +317,20 @@ class Booking(TimestampedBaseModel):
                 name='unique_booking_room_dates',
             )
         ]
+        indexes = [
+            models.Index(
+                fields=['status', 'check_in'],
+                name='booking_status_check_in_idx',
+            ),
+            models.Index(
+                fields=['status', 'check_out'],
+                name='booking_status_check_out_idx',
+            ),
+            models.Index(
+                fields=['check_in'],
+                name='booking_check_in_idx',
+            ),
+        ]
 
 
 class BookingCustomer(models.Model):
@@ -207,6 +339,7 @@ class BookingCustomer(models.Model):
         on_delete=models.CASCADE,
         related_name='booking_customers',
         verbose_name=_('Customer'),
+        db_index=False,  # covered by unique_booking_customer (customer, booking)
     )
     booking = models.ForeignKey(
         Booking,
@@ -218,6 +351,11 @@ class BookingCustomer(models.Model):
         verbose_name=_('Is owner'),
         default=False,
     )
+    # copy of booking.check_in, so a customer's history is one index range; kept in sync by signals
+    check_in = models.DateTimeField(
+        verbose_name=_('Check-in'),
+        editable=False,
+    )
 
     def __str__(self):
         return f'{self.customer.email} - {self.booking.room.title}'
@@ -231,6 +369,17 @@ class BookingCustomer(models.Model):
                 name='unique_booking_customer',
             )
         ]
+        indexes = [
+            models.Index(
+                fields=['booking'],
+                name='booking_customer_owner_idx',
+                condition=models.Q(is_owner=True),
+            ),
+            models.Index(
+                fields=['customer', 'check_in', 'booking'],
+                name='booking_customer_history_idx',
+            ),
+        ]
 
 
 class BookingPayment(models.Model):
@@ -263,6 +412,21 @@ class BookingPayment(models.Model):
         related_name='payments',
         verbose_name=_('Booking'),
     )
+    provider = models.CharField(
+        verbose_name=_('Payment provider'),
+        max_length=50,
+        blank=True,
+    )
+    provider_reference = models.CharField(
+        verbose_name=_('Provider reference'),
+        max_length=255,
+        blank=True,
+    )
+    settled_at = models.DateTimeField(
+        verbose_name=_('Settled at'),
+        null=True,
+        blank=True,
+    )
 
     def __str__(self):
         return f'Payment for {self.booking.room.title} - {self.amount}'
@@ -270,6 +434,20 @@ class BookingPayment(models.Model):
     class Meta:
         verbose_name = _('Booking Payment')
         verbose_name_plural = _('Booking Payments')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['provider', 'provider_reference'],
+                name='unique_payment_provider_reference',
+                condition=~models.Q(provider_reference=''),
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=['id'],
+                name='payment_pending_idx',
+                condition=models.Q(status='pending'),
+            ),
+        ]
 
 
 class QRCode(models.Model):
@@ -307,6 +485,22 @@ class QRCode(models.Model):
     class Meta:
         verbose_name = _('QR Code')
         verbose_name_plural = _('QR Codes')
+        indexes = [
+            models.Index(
+                fields=['booking_customer'],
+                name='qrcode_active_idx',
+                condition=models.Q(status='active'),
+            ),
+            models.Index(
+                fields=['created_at'],
+                name='qrcode_created_at_idx',
+            ),
+            models.Index(
+                fields=['id'],
+                name='qrcode_blacklisted_idx',
+                condition=models.Q(status='blacklisted'),
+            ),
+        ]
 
 
 class Review(TitledTimestampedBaseModel):
@@ -332,3 +526,289 @@ class Review(TitledTimestampedBaseModel):
     class Meta:
         verbose_name = _('Review')
         verbose_name_plural = _('Reviews')
+
+
+class ChangeEvent(models.Model):
+    """
+    Outbox row appended in the same transaction as a change to a booking,
+    booking customer, payment or QR code. ``data`` is a compact snapshot of
+    the object after the change. ``sequence`` is the feed cursor: it is
+    numbered by ``outbox.sequence_events`` once the row has committed, so
+    it follows commit order, which ``id`` does not.
+    """
+    class Action(models.TextChoices):
+        CREATED = 'created', _('Created')
+        UPDATED = 'updated', _('Updated')
+        DELETED = 'deleted', _('Deleted')
+        ARCHIVED = 'archived', _('Archived')
+
+    id = models.BigAutoField(primary_key=True)
+    entity = models.CharField(
+        verbose_name=_('Entity'),
+        max_length=30,
+    )
+    object_id = models.BigIntegerField(
+        verbose_name=_('Object id'),
+    )
+    action = models.CharField(
+        verbose_name=_('Action'),
+        max_length=10,
+        choices=Action,
+    )
+    data = models.JSONField(
+        verbose_name=_('Data'),
+        encoder=DjangoJSONEncoder,
+        null=True,
+        blank=True,
+    )
+    created_at = models.DateTimeField(
+        verbose_name=_('Created at'),
+        auto_now_add=True,
+    )
+    sequence = models.BigIntegerField(
+        verbose_name=_('Sequence'),
+        unique=True,
+        null=True,
+        editable=False,
+    )
+
+    def __str__(self):
+        return f'{self.entity} {self.object_id} {self.action}'
+
+    class Meta:
+        verbose_name = _('Change event')
+        verbose_name_plural = _('Change events')
+        indexes = [
+            models.Index(
+                fields=['entity', 'object_id', 'id'],
+                name='change_event_object_idx',
+            ),
+            models.Index(
+                fields=['created_at'],
+                name='change_event_created_at_idx',
+            ),
+            models.Index(
+                fields=['id'],
+                name='change_event_unsequenced_idx',
+                condition=models.Q(sequence__isnull=True),
+            ),
+        ]
+
+
+class ChangeSequence(models.Model):
+    """
+    Single row holding the last ``ChangeEvent.sequence`` handed out. It is
+    locked while events are numbered, so numbering runs one at a time.
+    """
+    last = models.BigIntegerField(
+        verbose_name=_('Last sequence'),
+        default=0,
+    )
+
+    class Meta:
+        verbose_name = _('Change sequence')
+        verbose_name_plural = _('Change sequence')
+
+
+class ArchivedBooking(models.Model):
+    """
+    Closed booking moved out of the hot ``Booking`` table by the archival job.
+    Archived rows keep their original ids.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    check_in = models.DateTimeField(
+        verbose_name=_('Check-in'),
+    )
+    check_out = models.DateTimeField(
+        verbose_name=_('Check-out'),
+    )
+    total_price = models.DecimalField(
+        verbose_name=_('Total price'),
+        max_digits=10,
+        decimal_places=2,
+    )
+    status = models.CharField(
+        verbose_name=_('Booking status'),
+        max_length=20,
+        choices=Booking.BookingStatus,
+    )
+    room = models.ForeignKey(
+        Room,
+        on_delete=models.CASCADE,
+        related_name='archived_bookings',
+        verbose_name=_('Room'),
+    )
+    customers = models.ManyToManyField(
+        get_user_model(),
+        through='ArchivedBookingCustomer',
+        related_name='archived_bookings',
+        verbose_name=_('Customers'),
+    )
+    created_at = models.DateTimeField(
+        verbose_name=_('Created at'),
+    )
+    updated_at = models.DateTimeField(
+        verbose_name=_('Updated at'),
+    )
+    archived_at = models.DateTimeField(
+        verbose_name=_('Archived at'),
+        auto_now_add=True,
+    )
+
+    def __str__(self):
+        return f'Archived booking for {self.room.title} from {self.check_in} to {self.check_out}'
+
+    class Meta:
+        verbose_name = _('Archived booking')
+        verbose_name_plural = _('Archived bookings')
+        ordering = ['-created_at']
+
+
+class ArchivedBookingCustomer(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    customer = models.ForeignKey(
+        get_user_model(),
+        on_delete=models.CASCADE,
+        related_name='archived_booking_customers',
+        verbose_name=_('Customer'),
+        db_index=False,  # covered by archived_booking_customer_idx (customer, booking)
+    )
+    booking = models.ForeignKey(
+        ArchivedBooking,
+        on_delete=models.CASCADE,
+        related_name='booking_customers',
+        verbose_name=_('Booking'),
+    )
+    is_owner = models.BooleanField(
+        verbose_name=_('Is owner'),
+        default=False,
+    )
+    check_in = models.DateTimeField(
+        verbose_name=_('Check-in'),
+    )
+
+    def __str__(self):
+        return f'{self.customer.email} - {self.booking.room.title}'
+
+    class Meta:
+        verbose_name = _('Archived booking customer')
+        verbose_name_plural = _('Archived booking customers')
+        indexes = [
+            models.Index(
+                fields=['customer', 'booking'],
+                name='archived_booking_customer_idx',
+            ),
+            models.Index(
+                fields=['customer', 'check_in', 'booking'],
+                name='archived_customer_history_idx',
+            ),
+        ]
+
+
+class ArchivedBookingPayment(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    amount = models.DecimalField(
+        verbose_name=_('Amount'),
+        max_digits=10,
+        decimal_places=2,
+    )
+    status = models.CharField(
+        verbose_name=_('Payment status'),
+        max_length=20,
+        choices=BookingPayment.PaymentStatus,
+    )
+    booking = models.ForeignKey(
+        ArchivedBooking,
+        on_delete=models.CASCADE,
+        related_name='payments',
+        verbose_name=_('Booking'),
+    )
+    provider = models.CharField(
+        verbose_name=_('Payment provider'),
+        max_length=50,
+        blank=True,
+    )
+    provider_reference = models.CharField(
+        verbose_name=_('Provider reference'),
+        max_length=255,
+        blank=True,
+    )
+    created_at = models.DateTimeField(
+        verbose_name=_('Created at'),
+    )
+    settled_at = models.DateTimeField(
+        verbose_name=_('Settled at'),
+        null=True,
+        blank=True,
+    )
+
+    def __str__(self):
+        return f'Archived payment for booking {self.booking_id} - {self.amount}'
+
+    class Meta:
+        verbose_name = _('Archived booking payment')
+        verbose_name_plural = _('Archived booking payments')
+
+
+class ArchivedQRCode(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    qr_code = models.CharField(
+        verbose_name=_('QR Code'),
+        max_length=100,
+        blank=True,
+    )
+    booking_customer = models.ForeignKey(
+        ArchivedBookingCustomer,
+        on_delete=models.CASCADE,
+        related_name='qr_codes',
+        verbose_name=_('Booking customer'),
+    )
+    status = models.CharField(
+        verbose_name=_('Status'),
+        max_length=20,
+        choices=QRCode.QRStatus,
+    )
+    created_at = models.DateTimeField(
+        verbose_name=_('Created at'),
+    )
+
+    def __str__(self):
+        return f'Archived QR code {self.qr_code}'
+
+    class Meta:
+        verbose_name = _('Archived QR code')
+        verbose_name_plural = _('Archived QR codes')
+
+
+class ArchivedReview(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    title = models.CharField(
+        verbose_name=_('Title'),
+        max_length=254,
+    )
+    rating = models.PositiveIntegerField(
+        verbose_name=_('Rating'),
+    )
+    content = models.TextField(
+        verbose_name=_('Content'),
+        null=True,
+    )
+    booking_customer = models.OneToOneField(
+        ArchivedBookingCustomer,
+        on_delete=models.CASCADE,
+        related_name='review',
+        verbose_name=_('Booking customer'),
+    )
+    created_at = models.DateTimeField(
+        verbose_name=_('Created at'),
+    )
+    updated_at = models.DateTimeField(
+        verbose_name=_('Updated at'),
+    )
+
+    def __str__(self):
+        return f'Archived review - {self.title}'
+
+    class Meta:
+        verbose_name = _('Archived review')
+        verbose_name_plural = _('Archived reviews')
@@ -0,0 +1,152 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import router, transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from src.apps.hotel.models import Booking, BookingCustomer, BookingPayment, ChangeEvent, ChangeSequence, QRCode
+
+# entity name and the fields kept in each event's snapshot
+TRACKED_MODELS = {
+    Booking: ('booking', ['room_id', 'status', 'check_in', 'check_out', 'total_price']),
+    BookingCustomer: ('booking_customer', ['booking_id', 'customer_id', 'is_owner']),
+    BookingPayment: ('booking_payment', ['booking_id', 'status', 'amount', 'settled_at']),
+    QRCode: ('qr_code', ['booking_customer_id', 'status']),
+}
+
+
+# set while a writer records its own events with ``record_changes``
+_suppressed = ContextVar('outbox_suppressed', default=False)
+
+
+@contextmanager
+def suppressed():
+    """Skip the per-object events of the signal handlers inside the block."""
+    token = _suppressed.set(True)
+    try:
+        yield
+    finally:
+        _suppressed.reset(token)
+
+
+def snapshot(instance):
+    _, fields = TRACKED_MODELS[type(instance)]
+    return {field: getattr(instance, field) for field in fields}
+
+
+def record(instance, action):
+    """Append the event for a single saved or deleted object."""
+    if _suppressed.get():
+        return
+    entity, _ = TRACKED_MODELS[type(instance)]
+    ChangeEvent.objects.create(
+        entity=entity,
+        object_id=instance.pk,
+        action=action,
+        data=None if action == ChangeEvent.Action.DELETED else snapshot(instance),
+    )
+    sequence_on_commit()
+
+
+def record_changes(model, ids, action=ChangeEvent.Action.UPDATED):
+    """
+    Append events for rows written by ``bulk_create``, ``bulk_update`` or
+    ``update()``, which bypass the signal handlers. Call it inside the same
+    transaction as the write; snapshots are read back with one query per
+    batch.
+    """
+    entity, fields = TRACKED_MODELS[model]
+    ids = list(ids)
+    for start in range(0, len(ids), settings.OUTBOX_BATCH_SIZE):
+        rows = model.objects.filter(pk__in=ids[start:start + settings.OUTBOX_BATCH_SIZE]).values('pk', *fields)
+        ChangeEvent.objects.bulk_create([
+            ChangeEvent(
+                entity=entity,
+                object_id=row.pop('pk'),
+                action=action,
+                data=row,
+            )
+            for row in rows.order_by('pk')
+        ])
+    sequence_on_commit()
+
+
+def sequence_on_commit():
+    """
+    Number the current transaction's events right after it commits, once per
+    transaction. A failure is logged rather than raised, since the write has
+    already committed; ``sequence_change_events`` numbers whatever is left.
+    """
+    using = router.db_for_write(ChangeEvent)
+    connection = transaction.get_connection(using)
+    if any(func is sequence_events for _, func, _ in connection.run_on_commit):
+        return
+    transaction.on_commit(sequence_events, using=using, robust=True)
+
+
+def sequence_events(batch_size=None):
+    """
+    Number the committed events that have no ``sequence`` yet, in id order,
+    after every number already handed out, and return how many there were.
+
+    Events only become visible here once their transaction has committed, and
+    numbering holds the ``ChangeSequence`` row lock, so a transaction that
+    commits late gets a higher number than everything consumers have already
+    read, however long it was open. Each batch commits on its own.
+    """
+    batch_size = batch_size or settings.OUTBOX_BATCH_SIZE
+    numbered = 0
+    while True:
+        with transaction.atomic():
+            counter, _ = ChangeSequence.objects.select_for_update().get_or_create(pk=1)
+            ids = list(
+                ChangeEvent.objects.filter(sequence__isnull=True).order_by('pk').values_list('pk', flat=True)[:batch_size]
+            )
+            if not ids:
+                return numbered
+            ChangeEvent.objects.bulk_update(
+                [ChangeEvent(pk=pk, sequence=counter.last + position) for position, pk in enumerate(ids, 1)],
+                ['sequence'],
+            )
+            counter.last += len(ids)
+            counter.save(update_fields=['last'])
+        numbered += len(ids)
+
+
+def visible_events(since=0):
+    """Numbered events after cursor ``since``, in sequence order; see ``sequence_events``."""
+    return ChangeEvent.objects.filter(sequence__gt=since).order_by('sequence')
+
+
+def compact(now=None, batch_size=None):
+    """
+    Apply the retention policy. Events older than ``OUTBOX_RETENTION`` are
+    dropped when a newer event exists for the same object, so a consumer
+    reading from the start still sees the latest state of everything.
+    Deletion and archival events are dropped entirely after
+    ``OUTBOX_TOMBSTONE_RETENTION``. Returns how many events were removed.
+    """
+    now = now or timezone.now()
+    batch_size = batch_size or settings.OUTBOX_BATCH_SIZE
+    newer = ChangeEvent.objects.filter(
+        entity=OuterRef('entity'),
+        object_id=OuterRef('object_id'),
+        pk__gt=OuterRef('pk'),
+    )
+    superseded = ChangeEvent.objects.filter(Exists(newer), created_at__lt=now - settings.OUTBOX_RETENTION)
+    tombstones = ChangeEvent.objects.filter(
+        action__in=[ChangeEvent.Action.DELETED, ChangeEvent.Action.ARCHIVED],
+        created_at__lt=now - settings.OUTBOX_TOMBSTONE_RETENTION,
+    )
+
+    removed = 0
+    for queryset in (superseded, tombstones):
+        while True:
+            with transaction.atomic():
+                ids = list(queryset.values_list('pk', flat=True)[:batch_size])
+                if not ids:
+                    break
+                removed += ChangeEvent.objects.filter(pk__in=ids).delete()[0]
+    return removed
@@ -0,0 +1,232 @@
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from src.apps.hotel import outbox
+from src.apps.hotel.models import Booking, BookingPayment
+
+
+class PaymentProviderError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class ProviderPayment:
+    """What a provider needs to know to register a payment."""
+    id: int
+    amount: Decimal
+    booking_id: int
+
+
+class PaymentProvider:
+    """
+    Interface of a payment provider backend.
+
+    ``register`` creates the payment on the provider side and returns its
+    reference. ``fetch_statuses`` maps up to ``max_batch_size`` references to
+    a ``BookingPayment.PaymentStatus`` value in one round trip; references
+    the provider does not know yet may be left out.
+    """
+    name: str = None
+    max_batch_size: int = 100
+
+    def register(self, payment: ProviderPayment) -> str:
+        raise NotImplementedError
+
+    def fetch_statuses(self, references) -> dict:
+        raise NotImplementedError
+
+
+class FakePaymentProvider(PaymentProvider):
+    """
+    Local stand-in for a real provider. References encode the registration
+    time; a payment settles ``FAKE_PAYMENT_SETTLE_AFTER`` later and a stable,
+    hash-chosen ``FAKE_PAYMENT_FAILURE_RATE`` share of them is canceled.
+    """
+    name = 'fake'
+    max_batch_size = 500
+
+    def register(self, payment):
+        return f'fake_{payment.id}_{int(timezone.now().timestamp())}'
+
+    def fetch_statuses(self, references):
+        now = timezone.now()
+        statuses = {}
+        for reference in references:
+            try:
+                _, _, registered = reference.rsplit('_', 2)
+                registered = datetime.fromtimestamp(int(registered), dt_timezone.utc)
+            except ValueError:
+                continue
+            if now - registered < settings.FAKE_PAYMENT_SETTLE_AFTER:
+                statuses[reference] = BookingPayment.PaymentStatus.PENDING
+            elif self.fails(reference):
+                statuses[reference] = BookingPayment.PaymentStatus.CANCELED
+            else:
+                statuses[reference] = BookingPayment.PaymentStatus.COMPLETED
+        return statuses
+
+    @staticmethod
+    def fails(reference):
+        digest = hashlib.blake2b(reference.encode(), digest_size=8).digest()
+        return int.from_bytes(digest, 'big') / 2 ** 64 < settings.FAKE_PAYMENT_FAILURE_RATE
+
+
+@lru_cache
+def get_provider(name=None) -> PaymentProvider:
+    name = name or settings.PAYMENT_PROVIDER
+    if not name:
+        raise ImproperlyConfigured('PAYMENT_PROVIDER is not set; payments cannot be registered or settled.')
+    try:
+        path = settings.PAYMENT_PROVIDERS[name]
+    except KeyError:
+        raise PaymentProviderError(f'Unknown payment provider {name!r}.')
+    return import_string(path)()
+
+
+def create_payment(booking):
+    """
+    Add a pending payment for ``booking`` and register it with the provider
+    once the surrounding transaction commits, so no provider call is made for
+    a booking that is rolled back. Registration left undone is retried by
+    ``reconcile_payments``.
+    """
+    get_provider()  # no payment is taken without a configured provider
+    payment = BookingPayment.objects.create(
+        booking=booking,
+        amount=booking.total_price,
+        provider=settings.PAYMENT_PROVIDER,
+    )
+    transaction.on_commit(lambda: register_payments([payment]))
+    return payment
+
+
+def register_payments(payments):
+    """Register payments without a provider reference; returns how many were registered."""
+    registered = []
+    for payment in payments:
+        try:
+            payment.provider_reference = get_provider(payment.provider).register(
+                ProviderPayment(id=payment.pk, amount=payment.amount, booking_id=payment.booking_id)
+            )
+        except PaymentProviderError:
+            continue
+        registered.append(payment)
+
+    BookingPayment.objects.bulk_update(registered, ['provider_reference'])
+    return len(registered)
+
+
+def reconcile_payments(batch_size=None, concurrency=None, now=None):
+    """
+    Settle every pending payment in one pass.
+
+    Pending payments are walked in primary key order, ``batch_size`` at a
+    time. Each batch is grouped by provider and split into chunks of the
+    provider's ``max_batch_size``, fetched by up to ``concurrency`` threads.
+    The answers are applied with one UPDATE per resulting status, to the
+    rows locked while still ``pending``, so a concurrent run cannot settle a
+    payment twice.
+    Bookings still waiting for check-in whose payments all failed are then
+    canceled with one more UPDATE.
+    """
+    get_provider()  # refuse to run, rather than settle payments against nothing
+    batch_size = batch_size or settings.PAYMENT_RECONCILE_BATCH_SIZE
+    concurrency = concurrency or settings.PAYMENT_RECONCILE_CONCURRENCY
+    now = now or timezone.now()
+    result = {'registered': 0, 'completed': 0, 'canceled': 0, 'bookings_canceled': 0}
+
+    pending = BookingPayment.objects.filter(status=BookingPayment.PaymentStatus.PENDING)
+    last_id = 0
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        while True:
+            batch = list(
+                pending.filter(pk__gt=last_id)
+                .order_by('pk')
+                .only('pk', 'amount', 'booking_id', 'provider', 'provider_reference')[:batch_size]
+            )
+            if not batch:
+                break
+            last_id = batch[-1].pk
+
+            unregistered = [payment for payment in batch if not payment.provider_reference]
+            result['registered'] += register_payments(unregistered)
+            statuses = fetch_statuses(executor, [payment for payment in batch if payment.provider_reference])
+            apply_statuses(statuses, now, result)
+
+    return result
+
+
+def fetch_statuses(executor, payments):
+    """Return ``{payment id: status}`` for ``payments``, asking each provider in parallel chunks."""
+    by_provider = {}
+    for payment in payments:
+        by_provider.setdefault(payment.provider, []).append(payment)
+
+    futures = []
+    for name, group in by_provider.items():
+        try:
+            provider = get_provider(name)
+        except PaymentProviderError:
+            continue
+        for start in range(0, len(group), provider.max_batch_size):
+            chunk = group[start:start + provider.max_batch_size]
+            references = [payment.provider_reference for payment in chunk]
+            futures.append((chunk, executor.submit(provider.fetch_statuses, references)))
+
+    statuses = {}
+    for chunk, future in futures:
+        try:
+            answer = future.result()
+        except PaymentProviderError:
+            continue  # left pending, the next run asks again
+        for payment in chunk:
+            status = answer.get(payment.provider_reference)
+            if status is not None:
+                statuses[payment.pk] = status
+    return statuses
+
+
+def apply_statuses(statuses, now, result):
+    settled = {
+        status: [pk for pk, value in statuses.items() if value == status]
+        for status in (BookingPayment.PaymentStatus.COMPLETED, BookingPayment.PaymentStatus.CANCELED)
+    }
+
+    with transaction.atomic():
+        for status, ids in settled.items():
+            if ids:
+                # only the rows still pending are settled and announced; a concurrent run may have taken the rest
+                ids = list(BookingPayment.objects.select_for_update().filter(
+                    pk__in=ids,
+                    status=BookingPayment.PaymentStatus.PENDING,
+                ).values_list('pk', flat=True))
+                result[status] += BookingPayment.objects.filter(pk__in=ids).update(status=status, settled_at=now)
+                outbox.record_changes(BookingPayment, ids)
+                settled[status] = ids
+
+        failed = settled[BookingPayment.PaymentStatus.CANCELED]
+        if failed:
+            payable = BookingPayment.objects.filter(
+                Q(status=BookingPayment.PaymentStatus.PENDING) | Q(status=BookingPayment.PaymentStatus.COMPLETED),
+                booking=OuterRef('pk'),
+            )
+            unpaid = set(Booking.objects.select_for_update().filter(
+                ~Exists(payable),
+                payments__pk__in=failed,
+                status=Booking.BookingStatus.CREATED,
+            ).values_list('pk', flat=True))
+            result['bookings_canceled'] += Booking.objects.filter(
+                pk__in=unpaid,
+            ).update(status=Booking.BookingStatus.CANCELED, updated_at=now)
+            outbox.record_changes(Booking, unpaid)
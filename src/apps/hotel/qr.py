@@ -0,0 +1,122 @@
+import base64
+import io
+from dataclasses import dataclass
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.crypto import constant_time_compare, salted_hmac
+from django.utils.http import base36_to_int, int_to_base36
+
+
+QR_TOKEN_VERSION = 'q1'
+QR_TOKEN_SALT = 'src.apps.hotel.qr.QRToken'
+QR_TOKEN_SIGNATURE_BYTES = 16
+
+
+class QRTokenError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class QRToken:
+    """
+    Payload of a signed QR code: ``q1.<qr>.<booking>.<customer>.<nbf>.<exp>.<sig>``
+    with every number in base36 and ``sig`` a truncated HMAC-SHA256 of the rest.
+    """
+    qr_code_id: int
+    booking_id: int
+    customer_id: int
+    not_before: int
+    expires_at: int
+
+    @property
+    def valid_from(self) -> datetime:
+        return datetime.fromtimestamp(self.not_before, tz=dt_timezone.utc)
+
+    @property
+    def valid_until(self) -> datetime:
+        return datetime.fromtimestamp(self.expires_at, tz=dt_timezone.utc)
+
+    def payload(self) -> str:
+        return '.'.join([
+            QR_TOKEN_VERSION,
+            *map(int_to_base36, [
+                self.qr_code_id,
+                self.booking_id,
+                self.customer_id,
+                self.not_before,
+                self.expires_at,
+            ]),
+        ])
+
+
+def get_signing_key() -> str:
+    return settings.QR_CODE_SIGNING_KEY or settings.SECRET_KEY
+
+
+def sign(payload: str) -> str:
+    digest = salted_hmac(QR_TOKEN_SALT, payload, secret=get_signing_key(), algorithm='sha256').digest()
+    return base64.urlsafe_b64encode(digest[:QR_TOKEN_SIGNATURE_BYTES]).rstrip(b'=').decode()
+
+
+def make_qr_token(qr_code) -> str:
+    booking_customer = qr_code.booking_customer
+    booking = booking_customer.booking
+    token = QRToken(
+        qr_code_id=qr_code.id,
+        booking_id=booking.id,
+        customer_id=booking_customer.customer_id,
+        not_before=int(booking.check_in.timestamp()),
+        expires_at=int((booking.check_out + settings.QR_CODE_VALIDITY_LEEWAY).timestamp()),
+    )
+    payload = token.payload()
+    return f'{payload}.{sign(payload)}'
+
+
+def parse_qr_token(value: str, now: datetime = None) -> QRToken:
+    """
+    Check the signature and validity window of a QR token without touching the
+    database. Revocation is checked separately by the caller.
+    """
+    payload, _, signature = value.strip().rpartition('.')
+    if not constant_time_compare(signature, sign(payload)):
+        raise QRTokenError('Invalid QR code signature.')
+
+    version, *fields = payload.split('.')
+    if version != QR_TOKEN_VERSION or len(fields) != 5:
+        raise QRTokenError('Unsupported QR code format.')
+
+    try:
+        token = QRToken(*map(base36_to_int, fields))
+    except ValueError:
+        raise QRTokenError('Malformed QR code.')
+
+    timestamp = int((now or timezone.now()).timestamp())
+    if timestamp < token.not_before:
+        raise QRTokenError('QR code is not valid yet.')
+    if timestamp >= token.expires_at:
+        raise QRTokenError('QR code has expired.')
+
+    return token
+
+
+def render_qr_image(data: str) -> bytes:
+    # qrcode pulls in Pillow; only booking activation renders images, so workers load them on first use
+    import qrcode
+    from qrcode.main import QRCode as QRCodeFactory
+
+    qr = QRCodeFactory(
+        version=3,
+        box_size=10,
+        border=5,
+        error_correction=qrcode.constants.ERROR_CORRECT_H
+    )
+    qr.add_data(data)
+    qr.make(fit=True)
+
+    img = qr.make_image(fill_color='black', back_color='white')
+
+    buffer = io.BytesIO()
+    img.save(buffer, format='PNG')
+    return buffer.getvalue()
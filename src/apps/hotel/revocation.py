@@ -0,0 +1,120 @@
+import logging
+import os
+import threading
+import time
+
+from django.conf import settings
+from django.db import connection, transaction
+
+from src.apps.hotel import outbox
+from src.apps.hotel.models import QRCode
+
+logger = logging.getLogger(__name__)
+
+
+class QRRevocationSet:
+    """
+    Process-local set of blacklisted QR code ids.
+
+    Loaded from the partial ``qrcode_blacklisted_idx`` index on first use, then
+    reloaded every ``QR_REVOCATION_REFRESH_INTERVAL`` by a daemon thread of the
+    process, so a request never pays for the reload. Codes blacklisted or
+    restored by this process are applied once their transaction commits, and
+    changes applied while a reload is running are replayed onto the fresh
+    snapshot, which may have been read before they committed. Changes made by
+    other workers are seen within one interval.
+    """
+
+    def __init__(self):
+        self._revoked = None
+        self._pending = None  # changes applied while a reload runs, id -> revoked
+        self._pid = None
+        self._lock = threading.Lock()
+        self._start_lock = threading.Lock()
+
+    def load(self):
+        with self._lock:
+            self._pending = {}
+        try:
+            revoked = set(
+                QRCode.objects
+                .filter(status=QRCode.QRStatus.BLACKLISTED)
+                .values_list('id', flat=True)
+                .iterator(chunk_size=10000)
+            )
+        except BaseException:
+            with self._lock:
+                self._pending = None
+            raise
+        with self._lock:
+            for qr_code_id, is_revoked in self._pending.items():
+                if is_revoked:
+                    revoked.add(qr_code_id)
+                else:
+                    revoked.discard(qr_code_id)
+            self._revoked = revoked
+            self._pending = None
+
+    def start(self):
+        # once per process: a forked worker inherits the set but not the thread
+        if self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._pid != os.getpid():
+                self.load()
+                threading.Thread(target=self.refresh, name='qr-revocation-refresh', daemon=True).start()
+                self._pid = os.getpid()
+
+    def refresh(self):
+        interval = settings.QR_REVOCATION_REFRESH_INTERVAL.total_seconds()
+        while True:
+            time.sleep(interval)
+            try:
+                self.load()
+            except Exception:
+                logger.exception('Reloading the QR revocation set failed')
+            finally:
+                connection.close()
+
+    def set_revoked(self, qr_code_id, is_revoked):
+        with self._lock:
+            if self._pending is not None:
+                self._pending[qr_code_id] = is_revoked
+            if self._revoked is not None:
+                if is_revoked:
+                    self._revoked.add(qr_code_id)
+                else:
+                    self._revoked.discard(qr_code_id)
+
+    def add(self, qr_code_id):
+        """Mark ``qr_code_id`` revoked once the current transaction commits."""
+        transaction.on_commit(lambda: self.set_revoked(qr_code_id, True))
+
+    def discard(self, qr_code_id):
+        """Mark ``qr_code_id`` valid again once the current transaction commits."""
+        transaction.on_commit(lambda: self.set_revoked(qr_code_id, False))
+
+    def __contains__(self, qr_code_id):
+        self.start()
+        return qr_code_id in self._revoked
+
+    def __len__(self):
+        self.start()
+        return len(self._revoked)
+
+
+revoked_qr_codes = QRRevocationSet()
+
+
+def blacklist_qr_codes(queryset):
+    """
+    Blacklist every QR code in ``queryset`` with a single UPDATE and record the
+    ids in the revocation set, since ``update()`` bypasses the signal handlers.
+    """
+    with transaction.atomic():
+        ids = list(queryset.exclude(status=QRCode.QRStatus.BLACKLISTED).values_list('id', flat=True))
+        updated = QRCode.objects.filter(id__in=ids).update(status=QRCode.QRStatus.BLACKLISTED)
+        outbox.record_changes(QRCode, ids)
+        for qr_code_id in ids:
+            revoked_qr_codes.add(qr_code_id)
+    return updated
@@ -0,0 +1,137 @@
+import re
+
+from django.db import connection, connections
+from django.db.models import FloatField, Q
+from django.db.models.expressions import RawSQL
+
+from src.apps.hotel.models import Room
+
+SQLITE_TABLE = 'hotel_room_fts'
+POSTGRES_TABLE = 'hotel_room_search'
+
+# FTS5 column weights for bm25(), in column order: title, category, amenities, description
+SQLITE_WEIGHTS = (10.0, 5.0, 3.0, 1.0)
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def tokens(query):
+    return TOKEN_RE.findall(query.lower())
+
+
+def documents(room_ids):
+    """Yield ``(room id, title, category, amenities, description)`` for the given rooms."""
+    amenities = {}
+    rooms = Room.objects.filter(pk__in=room_ids)
+    for room_id, name in rooms.filter(amenities__isnull=False).values_list('pk', 'amenities__name'):
+        amenities.setdefault(room_id, []).append(name)
+
+    for room_id, title, category, description in rooms.values_list('pk', 'title', 'category__name', 'description'):
+        yield room_id, title, category, ' '.join(amenities.get(room_id, ())), description or ''
+
+
+def index_rooms(room_ids, batch_size=500):
+    """
+    Rewrite the search documents of ``room_ids``; rooms that no longer exist
+    are removed from the index. Call it inside the transaction that changed
+    the rooms, their category or their amenities.
+    """
+    room_ids = list(room_ids)
+    for start in range(0, len(room_ids), batch_size):
+        batch = room_ids[start:start + batch_size]
+        remove_rooms(batch)
+        rows = list(documents(batch))
+        if not rows:
+            continue
+        with connection.cursor() as cursor:
+            if connection.vendor == 'sqlite':
+                cursor.executemany(
+                    f'INSERT INTO {SQLITE_TABLE} (rowid, title, category, amenities, description) '
+                    f'VALUES (%s, %s, %s, %s, %s)',
+                    rows,
+                )
+            elif connection.vendor == 'postgresql':
+                cursor.executemany(
+                    f'INSERT INTO {POSTGRES_TABLE} (room_id, document) VALUES (%s, '
+                    f"setweight(to_tsvector('simple', %s), 'A') || setweight(to_tsvector('simple', %s), 'B') || "
+                    f"setweight(to_tsvector('simple', %s), 'C') || setweight(to_tsvector('simple', %s), 'D'))",
+                    rows,
+                )
+
+
+def remove_rooms(room_ids):
+    room_ids = list(room_ids)
+    if not room_ids or connection.vendor not in ('sqlite', 'postgresql'):
+        return
+    column = 'rowid' if connection.vendor == 'sqlite' else 'room_id'
+    table = SQLITE_TABLE if connection.vendor == 'sqlite' else POSTGRES_TABLE
+    placeholders = ', '.join(['%s'] * len(room_ids))
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {table} WHERE {column} IN ({placeholders})', room_ids)
+
+
+def rebuild(batch_size=500):
+    """Reindex every room; returns how many were indexed."""
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            cursor.execute(f'DELETE FROM {SQLITE_TABLE}')
+        elif connection.vendor == 'postgresql':
+            cursor.execute(f'TRUNCATE {POSTGRES_TABLE}')
+    room_ids = list(Room.objects.order_by('pk').values_list('pk', flat=True))
+    index_rooms(room_ids, batch_size=batch_size)
+    return len(room_ids)
+
+
+def search_rooms(queryset, query):
+    """
+    Narrow ``queryset`` to rooms matching every word of ``query`` as a
+    prefix, in the title, category, amenities or description, and annotate
+    ``search_rank`` (higher is better). The match runs against the full-text
+    index, so only the matching rooms are read; databases without one fall
+    back to ``icontains`` with a constant rank.
+    """
+    words = tokens(query)
+    if not words:
+        return queryset.none()
+
+    table = Room._meta.db_table
+    vendor = connections[queryset.db].vendor
+    if vendor == 'sqlite':
+        match = ' AND '.join(f'"{word}"*' for word in words)
+        weights = ', '.join(str(weight) for weight in SQLITE_WEIGHTS)
+        return queryset.filter(
+            pk__in=RawSQL(f'SELECT rowid FROM {SQLITE_TABLE} WHERE {SQLITE_TABLE} MATCH %s', (match,)),
+        ).annotate(
+            # bm25() is lower for better matches
+            search_rank=RawSQL(
+                f'SELECT -bm25({SQLITE_TABLE}, {weights}) FROM {SQLITE_TABLE} '
+                f'WHERE {SQLITE_TABLE} MATCH %s AND rowid = "{table}"."id"',
+                (match,),
+                output_field=FloatField(),
+            ),
+        )
+
+    if vendor == 'postgresql':
+        match = ' & '.join(f'{word}:*' for word in words)
+        return queryset.filter(
+            pk__in=RawSQL(
+                f"SELECT room_id FROM {POSTGRES_TABLE} WHERE document @@ to_tsquery('simple', %s)", (match,),
+            ),
+        ).annotate(
+            search_rank=RawSQL(
+                f"SELECT ts_rank(document, to_tsquery('simple', %s)) FROM {POSTGRES_TABLE} "
+                f'WHERE room_id = "{table}"."id"',
+                (match,),
+                output_field=FloatField(),
+            ),
+        )
+
+    matching = Room.objects.all()
+    for word in words:
+        # one filter() per word, so each word may match a different amenity
+        matching = matching.filter(
+            Q(title__icontains=word) | Q(description__icontains=word)
+            | Q(category__name__icontains=word) | Q(amenities__name__icontains=word)
+        )
+    matching = matching.values('pk')
+    return queryset.filter(pk__in=matching).annotate(search_rank=RawSQL('0', (), output_field=FloatField()))
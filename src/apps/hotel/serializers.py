@@ -1,10 +1,16 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 from django.db import transaction
-from src.apps.hotel.models import Booking, Room, BookingCustomer, Category, Amenity, QRCode
+from django.urls import reverse
+from src.apps.common.serializers import DynamicFieldsMixin
+from src.apps.hotel import outbox
+from src.apps.hotel.models import (
+    ArchivedBooking, Booking, Room, BookingCustomer, ChangeEvent, Category, Amenity, QRCode
+)
+from src.apps.hotel.payments import create_payment
 
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Category
         fields = [
@@ -17,7 +23,7 @@ class CategorySerializer(serializers.ModelSerializer):
         }
 
 
-class AmenitySerializer(serializers.ModelSerializer):
+class AmenitySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Amenity
         fields = [
@@ -31,7 +37,9 @@ class AmenitySerializer(serializers.ModelSerializer):
         }
 
 
-class RoomSerializer(serializers.ModelSerializer):
+class RoomSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    status = serializers.CharField(source='occupancy_status', read_only=True)
+
     class Meta:
         model = Room
         fields = [
@@ -46,9 +54,13 @@ class RoomSerializer(serializers.ModelSerializer):
         ]
         depth = 1
         extra_kwargs = {
-            'status': {'read_only': True},
             'amenities': {'required': False},
         }
+        expandable_fields = {
+            'category': {'select_related': ['category']},
+            'amenities': {'many': True, 'prefetch_related': ['amenities']},
+            'images': {'many': True, 'prefetch_related': ['images']},
+        }
 
 
 class BookingCustomerSerializer(serializers.ModelSerializer):
@@ -72,7 +84,7 @@ class BookingCustomerSerializer(serializers.ModelSerializer):
         ]
 
 
-class BookingSerializer(serializers.ModelSerializer):
+class BookingSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     customers = BookingCustomerSerializer(source='booking_customers', many=True, read_only=True)
     additional_customer_ids = serializers.PrimaryKeyRelatedField(queryset=get_user_model().objects.all(), many=True, write_only=True, required=False)
     room_id = serializers.PrimaryKeyRelatedField(source='room', queryset=Room.objects.all(), write_only=True)
@@ -95,6 +107,13 @@ class BookingSerializer(serializers.ModelSerializer):
             'total_price': {'read_only': True},
             'status': {'read_only': True},
         }
+        expandable_fields = {
+            'room': {'select_related': ['room'], 'prefetch_related': ['room__amenities']},
+            # booking customer ids either way, the same ids the expanded form shows
+            'customers': {
+                'source': 'booking_customers', 'many': True, 'prefetch_related': ['booking_customers__customer'],
+            },
+        }
 
     @transaction.atomic
     def create(self, validated_data):
@@ -124,6 +143,8 @@ class BookingSerializer(serializers.ModelSerializer):
                 is_owner=False
             )
 
+        create_payment(booking)
+
         return booking
 
     @transaction.atomic
@@ -144,22 +165,68 @@ class BookingSerializer(serializers.ModelSerializer):
         instance.save()
 
         if additional_customers is not None:
-            owner_relationship = instance.booking_customers.filter(is_owner=True).first()
+            self.update_additional_customers(instance, additional_customers)
 
-            instance.booking_customers.filter(is_owner=False).delete()
+        return instance
 
-            for customer in additional_customers:
-                BookingCustomer.objects.create(
-                    booking=instance,
-                    customer=customer,
-                    is_owner=False
-                )
+    @staticmethod
+    def update_additional_customers(instance, additional_customers):
+        """
+        Bring the non-owner customers in line with ``additional_customers``,
+        touching only the rows that change so customers who stay keep their
+        QR codes and reviews.
+        """
+        current = dict(instance.booking_customers.values_list('customer_id', 'is_owner'))
+        owners = {customer_id for customer_id, is_owner in current.items() if is_owner}
+        wanted = {customer.pk for customer in additional_customers} - owners
+        existing = set(current) - owners
+
+        removed = existing - wanted
+        if removed:
+            instance.booking_customers.filter(is_owner=False, customer_id__in=removed).delete()
+
+        added = BookingCustomer.objects.bulk_create([
+            BookingCustomer(booking=instance, customer_id=customer_id, is_owner=False, check_in=instance.check_in)
+            for customer_id in wanted - existing
+        ])
+        outbox.record_changes(BookingCustomer, [customer.pk for customer in added], ChangeEvent.Action.CREATED)
+
+
+class ArchivedBookingSerializer(serializers.ModelSerializer):
+    """Read-only twin of ``BookingSerializer`` for bookings moved to the archive."""
+    customers = BookingCustomerSerializer(source='booking_customers', many=True, read_only=True)
+
+    class Meta:
+        model = ArchivedBooking
+        fields = [
+            'id',
+            'check_in',
+            'check_out',
+            'total_price',
+            'status',
+            'room',
+            'customers',
+        ]
+        read_only_fields = fields
+        depth = 1
 
-        return instance
 
+class QRCodeSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    qr_code = serializers.SerializerMethodField()
 
-class QRCodeSerializer(serializers.ModelSerializer):
     class Meta:
         model = QRCode
         fields = '__all__'
         depth = 1
+        expandable_fields = {
+            'booking_customer': {'select_related': ['booking_customer']},
+        }
+
+    def get_qr_code(self, obj):
+        url = reverse('qr_code_image', kwargs={'pk': obj.pk})
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request else url
+
+
+class QRCodeVerifySerializer(serializers.Serializer):
+    token = serializers.CharField(max_length=255, trim_whitespace=True)
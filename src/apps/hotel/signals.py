@@ -0,0 +1,97 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from src.apps.hotel import facets, outbox, search
+from src.apps.hotel.models import Amenity, Booking, BookingCustomer, Category, ChangeEvent, QRCode, Room, RoomAmenity
+from src.apps.hotel.revocation import revoked_qr_codes
+
+
+@receiver(post_save, sender=QRCode)
+def sync_qr_code_revocation(sender, instance, **kwargs):
+    if instance.status == QRCode.QRStatus.BLACKLISTED:
+        revoked_qr_codes.add(instance.id)
+    else:
+        revoked_qr_codes.discard(instance.id)
+
+
+@receiver(post_delete, sender=QRCode)
+def forget_qr_code_revocation(sender, instance, **kwargs):
+    revoked_qr_codes.discard(instance.id)
+
+
+@receiver(pre_save, sender=BookingCustomer)
+def copy_booking_check_in(sender, instance, raw=False, **kwargs):
+    if not raw or instance.check_in is None:
+        instance.check_in = instance.booking.check_in
+
+
+@receiver(post_save, sender=Booking)
+def sync_customer_check_in(sender, instance, created, update_fields=None, **kwargs):
+    if created or (update_fields is not None and 'check_in' not in update_fields):
+        return
+    instance.booking_customers.exclude(check_in=instance.check_in).update(check_in=instance.check_in)
+
+
+def append_change_event(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return  # fixture loading
+    outbox.record(instance, ChangeEvent.Action.CREATED if created else ChangeEvent.Action.UPDATED)
+
+
+def append_deletion_event(sender, instance, **kwargs):
+    outbox.record(instance, ChangeEvent.Action.DELETED)
+
+
+for model in outbox.TRACKED_MODELS:
+    post_save.connect(append_change_event, sender=model, dispatch_uid=f'outbox_save_{model.__name__}')
+    post_delete.connect(append_deletion_event, sender=model, dispatch_uid=f'outbox_delete_{model.__name__}')
+
+
+def room_amenities_changed(room_ids):
+    room_ids = list(room_ids)
+    search.index_rooms(room_ids)
+    facets.refresh_amenity_masks(room_ids)
+
+
+@receiver(post_save, sender=Room)
+def index_room(sender, instance, **kwargs):
+    # the mask is rebuilt too, so saving a stale instance cannot overwrite it
+    room_amenities_changed([instance.pk])
+
+
+@receiver(post_delete, sender=Room)
+def unindex_room(sender, instance, **kwargs):
+    search.remove_rooms([instance.pk])
+
+
+@receiver(pre_save, sender=Amenity)
+def assign_amenity_bit(sender, instance, **kwargs):
+    if instance._state.adding and instance.bit is None:
+        instance.bit = facets.free_bit()
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=Amenity)
+def index_named_rooms(sender, instance, created, **kwargs):
+    if not created:
+        search.index_rooms(instance.rooms.values_list('pk', flat=True))
+
+
+@receiver(post_save, sender=RoomAmenity)
+@receiver(post_delete, sender=RoomAmenity)
+def index_amenity_room(sender, instance, **kwargs):
+    room_amenities_changed([instance.room_id])
+
+
+@receiver(m2m_changed, sender=RoomAmenity)
+def index_amenity_rooms(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            room_amenities_changed([instance.pk])
+    elif action == 'pre_clear':
+        # clear() reports no pks, so remember which rooms are about to lose the amenity
+        instance._cleared_room_ids = list(instance.rooms.values_list('pk', flat=True))
+    elif action == 'post_clear':
+        room_amenities_changed(instance.__dict__.pop('_cleared_room_ids', ()))
+    elif action in ('post_add', 'post_remove'):
+        room_amenities_changed(pk_set)
@@ -0,0 +1,167 @@
+import heapq
+import math
+from collections import Counter
+from itertools import chain
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from src.apps.hotel.models import (
+    ArchivedBookingCustomer, BookingCustomer, Room, RoomAmenity, SimilarRoom, SimilarityRun,
+)
+
+
+class RoomFeatures:
+    """
+    Everything the score needs, loaded once per run.
+
+    Amenity sets are Python ints used as bit sets (bit ``i`` for the ``i``-th
+    amenity id), so overlap is a popcount of ``&`` and ``|`` rather than a
+    set intersection. Co-booking is kept sparse: the customers of each room
+    and the rooms of each customer, hot and archived bookings alike.
+    """
+
+    def __init__(self):
+        self.rooms = {
+            pk: (category_id, float(price))
+            for pk, category_id, price in Room.objects.values_list('pk', 'category_id', 'price_per_night')
+        }
+
+        positions = {}
+        self.masks = dict.fromkeys(self.rooms, 0)
+        for room_id, amenity_id in RoomAmenity.objects.values_list('room_id', 'amenity_id').order_by('amenity_id'):
+            bit = positions.setdefault(amenity_id, len(positions))
+            self.masks[room_id] |= 1 << bit
+
+        self.customers = {}
+        self.rooms_of = {}
+        links = chain(
+            BookingCustomer.objects.order_by().values_list('booking__room_id', 'customer_id').distinct(),
+            ArchivedBookingCustomer.objects.order_by().values_list('booking__room_id', 'customer_id').distinct(),
+        )
+        for room_id, customer_id in links:
+            self.customers.setdefault(room_id, set()).add(customer_id)
+            self.rooms_of.setdefault(customer_id, set()).add(room_id)
+
+    def co_bookings(self, room_id):
+        """Customers shared with every co-booked room: one sparse row of the co-booking matrix."""
+        counts = Counter()
+        for customer_id in self.customers.get(room_id, ()):
+            counts.update(self.rooms_of[customer_id])
+        counts.pop(room_id, None)
+        return counts
+
+    def scores(self, room_id, candidates):
+        """Yield ``(score, candidate id)`` of ``room_id`` against each of ``candidates``."""
+        weights = settings.SIMILAR_ROOMS_WEIGHTS
+        band = settings.SIMILAR_ROOMS_PRICE_BAND
+        category_id, price = self.rooms[room_id]
+        mask = self.masks[room_id]
+        co_bookings = self.co_bookings(room_id)
+        customers = len(self.customers.get(room_id, ()))
+
+        for other_id in candidates:
+            if other_id == room_id:
+                continue
+            other_category_id, other_price = self.rooms[other_id]
+            other_mask = self.masks[other_id]
+
+            union = (mask | other_mask).bit_count()
+            amenities = (mask & other_mask).bit_count() / union if union else 0.0
+            top = max(price, other_price)
+            closeness = max(0.0, 1 - abs(price - other_price) / (band * top)) if top else 1.0
+            shared = co_bookings.get(other_id, 0)
+            co_booking = shared / math.sqrt(customers * len(self.customers[other_id])) if shared else 0.0
+
+            yield (
+                weights['amenities'] * amenities
+                + weights['category'] * (category_id == other_category_id)
+                + weights['price'] * closeness
+                + weights['co_booking'] * co_booking,
+                other_id,
+            )
+
+
+def top_k(scores, k):
+    # ties go to the lower room id, so reruns store the same lists
+    return heapq.nsmallest(k, scores, key=lambda item: (-item[0], item[1]))
+
+
+def refresh_similar_rooms(full=False, top_k_size=None, batch_size=None):
+    """
+    Recompute the stored similar-room lists and return the run.
+
+    A full run scores every pair of rooms. An incremental run only rescores
+    rooms whose inputs changed since the last run: saved rooms (price,
+    category or amenities, which bump ``updated_at``) and rooms with new
+    booking customers. Every other room is merged: its stored list is kept
+    and only its scores against the changed rooms are recomputed, unless a
+    changed room was on its list or the list is short, which calls for a full
+    rescore of that room. Changing the weights needs a full run.
+    """
+    k = top_k_size or settings.SIMILAR_ROOMS_TOP_K
+    batch_size = batch_size or settings.SIMILAR_ROOMS_BATCH_SIZE
+    previous = SimilarityRun.objects.order_by('-started_at', '-pk').first()
+    full = full or previous is None
+
+    run = SimilarityRun(started_at=timezone.now(), full=full)
+    run.last_booking_customer_id = max(
+        BookingCustomer.objects.aggregate(last=Max('pk'))['last'] or 0,
+        ArchivedBookingCustomer.objects.aggregate(last=Max('pk'))['last'] or 0,
+    )
+    features = RoomFeatures()
+    room_ids = sorted(features.rooms)
+    expected = min(k, len(room_ids) - 1)
+
+    if full:
+        changed = rescore = set(room_ids)
+        merge = {}
+    else:
+        changed = set(Room.objects.filter(updated_at__gt=previous.started_at).values_list('pk', flat=True))
+        for model in (BookingCustomer, ArchivedBookingCustomer):
+            changed.update(
+                model.objects.filter(pk__gt=previous.last_booking_customer_id).values_list('booking__room_id', flat=True)
+            )
+        changed &= set(room_ids)
+
+        stored = {}
+        for room_id, similar_id, score in SimilarRoom.objects.order_by('room_id', 'rank').values_list(
+            'room_id', 'similar_id', 'score',
+        ):
+            stored.setdefault(room_id, []).append((score, similar_id))
+
+        rescore, merge = set(changed), {}
+        for room_id in room_ids:
+            entries = stored.get(room_id, [])
+            if room_id in changed:
+                continue
+            if len(entries) < expected or any(similar_id in changed for _, similar_id in entries):
+                rescore.add(room_id)
+            elif changed:
+                merge[room_id] = entries
+
+    lists = {}
+    for room_id in sorted(rescore):
+        lists[room_id] = top_k(features.scores(room_id, room_ids), k)
+    changed_ids = sorted(changed)
+    for room_id, entries in merge.items():
+        merged = top_k(chain(entries, features.scores(room_id, changed_ids)), k)
+        if merged != entries:
+            lists[room_id] = merged
+
+    ids = list(lists)
+    for start in range(0, len(ids), batch_size):
+        batch = ids[start:start + batch_size]
+        with transaction.atomic():
+            SimilarRoom.objects.filter(room_id__in=batch).delete()
+            SimilarRoom.objects.bulk_create([
+                SimilarRoom(room_id=room_id, similar_id=similar_id, rank=rank, score=score)
+                for room_id in batch
+                for rank, (score, similar_id) in enumerate(lists[room_id], 1)
+            ])
+
+    run.rooms_refreshed = len(lists)
+    run.save()
+    return run
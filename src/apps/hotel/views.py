@@ -1,39 +1,75 @@
 import json
-import io
 
-import qrcode
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
 from django.utils import timezone
 from django.core.files.base import ContentFile
-from qrcode.main import QRCode as QRCodeFactory
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
 from rest_framework.decorators import action
-from rest_framework.exceptions import ValidationError
+from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.throttling import ScopedRateThrottle
+from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet, ReadOnlyModelViewSet
 
-from src.apps.hotel.models import Booking, Room, QRCode, Category, Amenity
-from src.apps.hotel.serializers import QRCodeSerializer, BookingSerializer, RoomSerializer, CategorySerializer, AmenitySerializer
+from src.apps.common.media import protected_file_response
+from src.apps.common.views import SparseFieldsetMixin
+from src.apps.hotel import outbox
+from src.apps.hotel.filters import RoomFilterBackend
+from src.apps.hotel.models import Booking, BookingCustomer, ChangeEvent, Room, QRCode, Category, Amenity
+from src.apps.hotel.qr import QRTokenError, make_qr_token, parse_qr_token, render_qr_image
+from src.apps.hotel.revocation import revoked_qr_codes
+from src.apps.hotel.serializers import (
+    QRCodeSerializer, QRCodeVerifySerializer, BookingSerializer, RoomSerializer, CategorySerializer, AmenitySerializer
+)
 
 
-class CategoryViewSet(ReadOnlyModelViewSet):
+class CategoryViewSet(SparseFieldsetMixin, ReadOnlyModelViewSet):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
 
 
-class AmenityViewSet(ReadOnlyModelViewSet):
+class AmenityViewSet(SparseFieldsetMixin, ReadOnlyModelViewSet):
     queryset = Amenity.objects.all()
     serializer_class = AmenitySerializer
 
 
-class RoomViewSet(ReadOnlyModelViewSet):
+class RoomViewSet(SparseFieldsetMixin, ReadOnlyModelViewSet):
     queryset = Room.objects.all()
     serializer_class = RoomSerializer
+    filter_backends = [RoomFilterBackend]
 
+    def get_queryset(self):
+        return super().get_queryset().with_occupancy()
 
-class BookingViewSet(ModelViewSet):
+    def list(self, request, *args, **kwargs):
+        """With ``?facets=true`` the rooms come as ``results`` next to their ``facets`` counts."""
+        if request.query_params.get('facets') not in ('true', '1'):
+            return super().list(request, *args, **kwargs)
+
+        queryset, facets = RoomFilterBackend().filter_with_facets(request, self.get_queryset())
+        serializer = self.get_serializer(queryset, many=True)
+        return Response({'results': serializer.data, 'facets': facets})
+
+    @action(detail=True, methods=['get'], filter_backends=[])
+    def similar(self, request, pk=None):
+        """Rooms most similar to this one, as precomputed by ``refresh_similar_rooms``."""
+        rooms = self.get_queryset().filter(similar_to__room_id=pk).order_by('similar_to__rank')
+        serializer = self.get_serializer(rooms, many=True)
+        if not serializer.data and not Room.objects.filter(pk=pk).exists():
+            raise NotFound()
+        return Response(serializer.data)
+
+
+class BookingViewSet(SparseFieldsetMixin, ModelViewSet):
     queryset = Booking.objects.all()
     serializer_class = BookingSerializer
 
     @action(detail=True, methods=['post'])
+    @transaction.atomic
     def activate(self, request, pk=None):
         booking = self.get_object()
         booking_customers = booking.booking_customers
@@ -49,38 +85,26 @@ class BookingViewSet(ModelViewSet):
         booking.status = Booking.BookingStatus.ACTIVE
         booking.save()
 
-        qr_codes = []
-        for booking_customer in booking_customers.all():
-            data = json.dumps({
-                'user_id': booking_customer.customer.id,
-                'booking_id': booking_customer.booking.id
-            })
-
-            qr = QRCodeFactory(
-                version=3,
-                box_size=10,
-                border=5,
-                error_correction=qrcode.constants.ERROR_CORRECT_H
-            )
-            qr.add_data(data)
-            qr.make(fit=True)
-
-            img = qr.make_image(fill_color='black', back_color='white')
+        # rows are inserted first so every signed token can carry its QR code id
+        qr_codes = QRCode.objects.bulk_create([
+            QRCode(booking_customer=booking_customer)
+            for booking_customer in booking_customers.select_related('booking')
+        ])
 
-            buffer = io.BytesIO()
-            img.save(buffer, format='PNG')
-            buffer.seek(0)
+        # rendered inside the transaction, so a failure rolls the activation back and the client can retry
+        self.store_qr_images(qr_codes)
+        outbox.record_changes(QRCode, [qr_code.pk for qr_code in qr_codes], ChangeEvent.Action.CREATED)
+        return Response(status=201)
 
-            qr_code = QRCode(booking_customer=booking_customer)
+    @staticmethod
+    def store_qr_images(qr_codes):
+        for qr_code in qr_codes:
             qr_code.qr_code.save(
-                f'qr_code_{booking_customer.id}.png',
-                ContentFile(buffer.getvalue()),
+                f'qr_code_{qr_code.booking_customer_id}.png',
+                ContentFile(render_qr_image(make_qr_token(qr_code))),
                 save=False
             )
-            qr_codes.append(qr_code)
-
-        QRCode.objects.bulk_create(qr_codes)
-        return Response(status=201)
+        QRCode.objects.bulk_update(qr_codes, ['qr_code'])
 
     @action(detail=True)
     def qr_code(self, request, pk=None):
@@ -101,7 +125,115 @@ class BookingViewSet(ModelViewSet):
         except QRCode.DoesNotExist:
             raise ValidationError('QR code not found.')
 
-        serializer = QRCodeSerializer(qr)
+        serializer = QRCodeSerializer(qr, context={'request': request})
 
         return Response(serializer.data, status=200)
 
+
+class QRCodeVerifyView(APIView):
+    """
+    Gate check for a scanned QR code. Accepts or rejects the code from its
+    signature, validity window and the in-memory revocation set only, so it
+    needs neither authentication nor a database round trip per scan. Since it
+    is open, it is throttled per address and only tells whether the code is
+    valid, not whose booking it belongs to. A code blacklisted through
+    another worker is still accepted here for up to
+    ``QR_REVOCATION_REFRESH_INTERVAL``.
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = 'qr_verify'
+
+    def post(self, request):
+        serializer = QRCodeVerifySerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            token = parse_qr_token(serializer.validated_data['token'])
+        except QRTokenError as exc:
+            return Response({'valid': False, 'detail': str(exc)}, status=403)
+
+        if token.qr_code_id in revoked_qr_codes:
+            return Response({'valid': False, 'detail': 'QR code has been revoked.'}, status=403)
+
+        return Response({
+            'valid': True,
+            'qr_code_id': token.qr_code_id,
+            'valid_until': token.valid_until,
+        }, status=200)
+
+
+class QRCodeImageView(APIView):
+    """
+    QR code image for customers of its booking and staff. The file itself is
+    sent by the front web server, see ``protected_file_response``.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, pk):
+        qr_code = get_object_or_404(
+            QRCode.objects.select_related('booking_customer').only('qr_code', 'booking_customer__booking_id'),
+            pk=pk,
+        )
+
+        if not request.user.is_staff and not BookingCustomer.objects.filter(
+            booking_id=qr_code.booking_customer.booking_id,
+            customer=request.user,
+        ).exists():
+            raise PermissionDenied('You are not a customer of this booking.')
+
+        if not qr_code.qr_code:
+            raise NotFound('QR code image not found.')
+
+        return protected_file_response(qr_code.qr_code)
+
+
+class ChangeFeedView(APIView):
+    """
+    Outbox feed for downstream systems: events after ``?since=<cursor>`` in
+    order, streamed as NDJSON, at most ``?limit=`` of them. Consumers store
+    the ``cursor`` of the last line they processed and pass it back.
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        since = self.get_int_param(request, 'since', 0)
+        limit = min(
+            self.get_int_param(request, 'limit', settings.CHANGE_FEED_MAX_LIMIT),
+            settings.CHANGE_FEED_MAX_LIMIT,
+        )
+        events = outbox.visible_events(since)
+
+        def lines():
+            cursor, remaining = since, limit
+            while remaining > 0:
+                batch = list(events.filter(sequence__gt=cursor)[:min(remaining, settings.OUTBOX_BATCH_SIZE)])
+                if not batch:
+                    return
+                for event in batch:
+                    yield json.dumps({
+                        'cursor': event.sequence,
+                        'entity': event.entity,
+                        'id': event.object_id,
+                        'action': event.action,
+                        'data': event.data,
+                        'at': event.created_at,
+                    }, cls=DjangoJSONEncoder, separators=(',', ':')) + '\n'
+                cursor = batch[-1].sequence
+                remaining -= len(batch)
+
+        return StreamingHttpResponse(lines(), content_type='application/x-ndjson')
+
+    @staticmethod
+    def get_int_param(request, name, default):
+        value = request.query_params.get(name)
+        if value is None:
+            return default
+        try:
+            value = int(value)
+        except ValueError:
+            raise ValidationError({name: 'Must be an integer.'})
+        if value < 0:
+            raise ValidationError({name: 'Must not be negative.'})
+        return value
@@ -0,0 +1,36 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+from src.apps.users import passwords
+
+UserModel = get_user_model()
+
+
+class PooledPasswordBackend(ModelBackend):
+    """
+    ``ModelBackend`` whose async path checks the password on the bounded
+    hashing pool, so the event loop keeps serving other requests meanwhile.
+    A hash made by an old hasher or with old parameters is replaced on
+    success, and a full pool raises ``PasswordHashingBusy``. The sync path is
+    ``ModelBackend``'s.
+    """
+
+    async def aauthenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        try:
+            user = await UserModel._default_manager.aget_by_natural_key(username)
+        except UserModel.DoesNotExist:
+            # spend the same time as a wrong password, so unknown usernames do not stand out
+            await passwords.ahash_password(password)
+            return None
+
+        is_correct, rehashed = await passwords.averify_password(password, user.password)
+        if not is_correct:
+            return None
+        if rehashed:
+            user.password = rehashed
+            await user.asave(update_fields=['password'])
+        return user if self.user_can_authenticate(user) else None
@@ -0,0 +1,98 @@
+from django.db.models import F, Q
+from django.db.models.functions import Lower
+from django.db.models.lookups import GreaterThanOrEqual, LessThan
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+
+def prefix_range(value):
+    """
+    Return the half-open ``[value, upper)`` range covering every string that
+    starts with ``value``, so prefix lookups can use a plain B-tree index.
+    """
+    return value, value[:-1] + chr(ord(value[-1]) + 1)
+
+
+class UserFilterBackend(BaseFilterBackend):
+    """
+    Filtering, prefix search and ordering for the user list.
+
+    Every lookup is expressed against the same expressions as the partial
+    indexes declared on ``User.Meta``, so the query planner can answer it from
+    an index instead of scanning the table.
+    """
+    search_param = 'search'
+    ordering_param = 'ordering'
+
+    # predicate of the partial indexes; repeated inside every prefix branch so
+    # the planner can pick an index per branch of an OR (multi-index OR)
+    index_condition = Q(is_active=True)
+
+    # query parameter -> indexed expression used for prefix matching
+    prefix_fields = {
+        'email': Lower('email'),
+        'phone_number': F('phone_number'),
+        'last_name': Lower('last_name'),
+    }
+    case_insensitive_fields = {'email', 'last_name'}
+    ordering_fields = {
+        'email': F('email'),
+        'phone_number': F('phone_number'),
+        'last_name': Lower('last_name'),
+    }
+
+    def filter_queryset(self, request, queryset, view):
+        params = request.query_params
+
+        if 'is_employee' in params:
+            queryset = queryset.filter(is_employee=self.parse_bool('is_employee', params['is_employee']))
+
+        for name in self.prefix_fields:
+            value = params.get(name, '').strip()
+            if value:
+                queryset = queryset.filter(self.prefix_q(name, value))
+
+        term = params.get(self.search_param, '').strip()
+        if term:
+            condition = Q()
+            for name in self.prefix_fields:
+                condition |= self.prefix_q(name, term)
+            queryset = queryset.filter(condition)
+
+        ordering = params.get(self.ordering_param, '').strip()
+        if ordering:
+            queryset = queryset.order_by(*self.get_ordering(ordering))
+
+        return queryset
+
+    def prefix_q(self, name, value):
+        if name in self.case_insensitive_fields:
+            value = value.lower()
+        lower, upper = prefix_range(value)
+        expression = self.prefix_fields[name]
+        return (
+            self.index_condition
+            & Q(GreaterThanOrEqual(expression, lower))
+            & Q(LessThan(expression, upper))
+        )
+
+    def get_ordering(self, ordering):
+        result = []
+        for field in ordering.split(','):
+            field = field.strip()
+            descending = field.startswith('-')
+            expression = self.ordering_fields.get(field.lstrip('-'))
+            if expression is None:
+                raise ValidationError({self.ordering_param: f'Cannot order by "{field}".'})
+            result.append(expression.desc() if descending else expression.asc())
+        result.append(F('id').asc())
+        return result
+
+    @staticmethod
+    def parse_bool(name, value):
+        value = value.lower()
+        if value in ('1', 'true', 'yes'):
+            return True
+        if value in ('0', 'false', 'no'):
+            return False
+        raise ValidationError({name: 'Expected a boolean.'})
@@ -0,0 +1,42 @@
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory
+from rest_framework.request import Request
+
+from src.apps.common.query_plans import hot_query
+from src.apps.users.filters import UserFilterBackend
+
+
+def filtered_users(query_string):
+    request = Request(RequestFactory().get(f'/?{query_string}'))
+    queryset = get_user_model().objects.filter(is_active=True)
+    return UserFilterBackend().filter_queryset(request, queryset, None)
+
+
+@hot_query('users.list')
+def user_list():
+    return filtered_users('')
+
+
+@hot_query('users.email_prefix')
+def user_email_prefix():
+    return filtered_users('email=john')
+
+
+@hot_query('users.phone_prefix')
+def user_phone_prefix():
+    return filtered_users('phone_number=%2B380')
+
+
+@hot_query('users.last_name_prefix')
+def user_last_name_prefix():
+    return filtered_users('last_name=smi')
+
+
+@hot_query('users.employees')
+def user_employees():
+    return filtered_users('is_employee=true')
+
+
+@hot_query('users.search')
+def user_search():
+    return filtered_users('search=smi')
@@ -0,0 +1,88 @@
+import asyncio
+import json
+import statistics
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.test import AsyncRequestFactory, RequestFactory
+from rest_framework_simplejwt import views as simplejwt_views
+
+from src.apps.users.views import TokenObtainPairView
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure login throughput under concurrency: the simplejwt view hashing on '
+        'the request thread against the async view awaiting the hashing pool. '
+        'Throttles are off; a temporary user is created and removed. In production '
+        'the async view only frees workers when served over ASGI.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--logins', type=int, default=40, help='Logins per mode.')
+        parser.add_argument('--concurrency', type=int, default=8, help='Logins in flight at once.')
+        parser.add_argument('--wrong-share', type=float, default=0.25, help='Share of logins with a wrong password.')
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        password = uuid.uuid4().hex
+        user = User(email=f'benchmark.{uuid.uuid4().hex[:12]}@example.com', phone_number='+380501234567')
+        user.set_password(password)
+        user.save()
+        try:
+            logins = options['logins']
+            bodies = [
+                json.dumps({
+                    'email': user.email,
+                    'password': password if index >= logins * options['wrong_share'] else 'wrong',
+                })
+                for index in range(logins)
+            ]
+            self.report('request thread', *self.run_sync(bodies, options['concurrency']))
+            self.report('hashing pool', *asyncio.run(self.run_async(bodies, options['concurrency'])))
+        finally:
+            user.delete()
+
+    def run_sync(self, bodies, concurrency):
+        view = simplejwt_views.TokenObtainPairView.as_view(throttle_classes=[])
+        factory = RequestFactory()
+
+        def login(body):
+            started = time.perf_counter()
+            response = view(factory.post('/', body, content_type='application/json'))
+            return time.perf_counter() - started, response.status_code
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(login, bodies))
+        return time.perf_counter() - started, results
+
+    async def run_async(self, bodies, concurrency):
+        view = TokenObtainPairView.as_view(throttle_classes=[])
+        factory = AsyncRequestFactory()
+        limit = asyncio.Semaphore(concurrency)
+
+        async def login(body):
+            async with limit:
+                started = time.perf_counter()
+                response = await view(factory.post('/', body, content_type='application/json'))
+                return time.perf_counter() - started, response.status_code
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(login(body) for body in bodies))
+        return time.perf_counter() - started, results
+
+    def report(self, label, elapsed, results):
+        latencies = sorted(latency for latency, _ in results)
+        statuses = {}
+        for _, status in results:
+            statuses[status] = statuses.get(status, 0) + 1
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        self.stdout.write(
+            f'{label:>15}: {len(results) / elapsed:>7.2f} logins/s, '
+            f'p50 {statistics.median(latencies) * 1000:>7.1f} ms, p95 {p95 * 1000:>7.1f} ms, '
+            f'statuses {dict(sorted(statuses.items()))}'
+        )
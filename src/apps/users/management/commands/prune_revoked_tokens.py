@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from src.apps.users.revocation import revoked_tokens
+
+
+class Command(BaseCommand):
+    help = (
+        'Delete revoked refresh token ids whose tokens have expired, so the '
+        'JWT_REVOCATION_STORE file only holds tokens that could still be used.'
+    )
+
+    def handle(self, *args, **options):
+        removed = revoked_tokens.prune()
+        self.stdout.write(f'Removed {removed} expired token ids, {len(revoked_tokens)} remain.')
@@ -1,5 +1,6 @@
 from django.contrib.auth.models import PermissionsMixin
 from django.db import models
+from django.db.models.functions import Lower
 from django.contrib.auth.base_user import AbstractBaseUser
 from django.utils.translation import gettext_lazy as _
 
@@ -70,6 +71,28 @@ class User(AbstractBaseUser, PermissionsMixin):
         verbose_name = _('User')
         verbose_name_plural = _('Users')
         ordering = ['email']
+        indexes = [
+            models.Index(
+                Lower('email'),
+                name='user_active_email_lower_idx',
+                condition=models.Q(is_active=True),
+            ),
+            models.Index(
+                fields=['phone_number'],
+                name='user_active_phone_idx',
+                condition=models.Q(is_active=True),
+            ),
+            models.Index(
+                Lower('last_name'),
+                name='user_active_last_name_idx',
+                condition=models.Q(is_active=True),
+            ),
+            models.Index(
+                fields=['email'],
+                name='user_active_employee_idx',
+                condition=models.Q(is_active=True, is_employee=True),
+            ),
+        ]
 
     def __str__(self):
         return self.email
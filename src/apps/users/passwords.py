@@ -0,0 +1,82 @@
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+
+import django
+from django.conf import settings
+from django.contrib.auth import hashers
+from django.contrib.auth.hashers import make_password
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class PasswordHashingBusy(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = 'Too many password checks at once, try again shortly.'
+    default_code = 'password_hashing_busy'
+
+
+def _hash(raw_password):
+    return make_password(raw_password)
+
+
+def _verify(raw_password, encoded):
+    """
+    ``check_password`` that returns ``(is_correct, new_encoded)`` instead of
+    calling a setter, so it can run in another process. ``new_encoded`` is set
+    when the hash was made by another hasher or with outdated parameters.
+    """
+    is_correct, must_update = hashers.verify_password(raw_password, encoded)
+    if is_correct and must_update:
+        return True, make_password(raw_password)
+    return is_correct, None
+
+
+@lru_cache
+def get_pool():
+    """
+    The per-process hashing pool and the semaphore bounding the work it
+    accepts: ``PASSWORD_HASHING_WORKERS`` running plus ``PASSWORD_HASHING_QUEUE``
+    waiting. Request handlers use it; management commands and migrations keep
+    ``user.set_password``, so they are never turned away.
+    """
+    workers = settings.PASSWORD_HASHING_WORKERS
+    if settings.PASSWORD_HASHING_EXECUTOR == 'process':
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=django.setup)
+    else:
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='password-hashing')
+    return executor, threading.BoundedSemaphore(workers + settings.PASSWORD_HASHING_QUEUE)
+
+
+def submit(fn, *args):
+    """Queue ``fn`` on the pool, or raise ``PasswordHashingBusy`` when it is full."""
+    executor, slots = get_pool()
+    if not slots.acquire(blocking=False):
+        raise PasswordHashingBusy()
+    try:
+        future = executor.submit(fn, *args)
+    except BaseException:
+        slots.release()
+        raise
+    future.add_done_callback(lambda _: slots.release())
+    return future
+
+
+async def ahash_password(raw_password):
+    return await asyncio.wrap_future(submit(_hash, raw_password))
+
+
+async def averify_password(raw_password, encoded):
+    return await asyncio.wrap_future(submit(_verify, raw_password, encoded))
+
+
+
+def set_password(user, raw_password):
+    """
+    ``user.set_password`` bounded by the pool: the calling thread waits for
+    the hash, but a full pool raises ``PasswordHashingBusy`` (503) instead of
+    adding one more PBKDF2 run to a saturated worker.
+    """
+    user.password = submit(_hash, raw_password).result()
+    user._password = raw_password  # lets save() notify the password validators, as set_password does
@@ -0,0 +1,109 @@
+import os
+import sqlite3
+import threading
+import time
+
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt import tokens
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+
+
+class RevokedTokenStore:
+    """
+    Revoked refresh token ids (``jti``) with their expiry, in a small SQLite
+    file of its own that every worker on the host opens.
+
+    Ids are stored as 16 raw bytes (simplejwt's ``jti`` is a uuid4 hex) in a
+    ``WITHOUT ROWID`` table keyed by ``jti``, so a membership check is one
+    primary key probe that never touches the main database. A revoked id only
+    matters until its token expires: rows past ``expires_at`` are deleted every
+    ``JWT_REVOCATION_PRUNE_EVERY`` revocations and by ``prune_revoked_tokens``,
+    which keeps the file as small as the set of live revoked tokens.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._revocations = 0
+        self._lock = threading.Lock()
+
+    def connection(self):
+        # one connection per thread, reopened after a fork
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(
+                settings.JWT_REVOCATION_STORE, timeout=5, isolation_level=None, check_same_thread=False,
+            )
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS revoked_token ('
+                'jti BLOB PRIMARY KEY, expires_at INTEGER NOT NULL) WITHOUT ROWID'
+            )
+            connection.execute('CREATE INDEX IF NOT EXISTS revoked_token_expires_at ON revoked_token (expires_at)')
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    @staticmethod
+    def key(jti):
+        try:
+            return bytes.fromhex(jti) if len(jti) == 32 else jti.encode()
+        except ValueError:
+            return jti.encode()
+
+    def revoke(self, jti, expires_at):
+        """
+        Record ``jti`` as revoked until ``expires_at`` (a timestamp). Returns
+        ``False`` if it already was, which is how a refresh token used twice
+        is caught even when two workers race.
+        """
+        cursor = self.connection().execute(
+            'INSERT OR IGNORE INTO revoked_token (jti, expires_at) VALUES (?, ?)', (self.key(jti), int(expires_at)),
+        )
+        with self._lock:
+            self._revocations += 1
+            prune = self._revocations % settings.JWT_REVOCATION_PRUNE_EVERY == 0
+        if prune:
+            self.prune()
+        return cursor.rowcount == 1
+
+    def is_revoked(self, jti):
+        row = self.connection().execute(
+            'SELECT 1 FROM revoked_token WHERE jti = ?', (self.key(jti),),
+        ).fetchone()
+        return row is not None
+
+    def prune(self, now=None):
+        """Forget ids of tokens that have expired anyway; returns how many were removed."""
+        now = int(now if now is not None else time.time())
+        return self.connection().execute('DELETE FROM revoked_token WHERE expires_at <= ?', (now,)).rowcount
+
+    def __len__(self):
+        return self.connection().execute('SELECT COUNT(*) FROM revoked_token').fetchone()[0]
+
+
+revoked_tokens = RevokedTokenStore()
+
+
+class RefreshToken(tokens.RefreshToken):
+    """
+    Refresh token checked against ``revoked_tokens`` instead of simplejwt's
+    blacklist tables. ``blacklist`` is what ``TokenRefreshSerializer`` calls on
+    the old token when ``BLACKLIST_AFTER_ROTATION`` is on; it fails for a token
+    that is already revoked, so a refresh token is only ever rotated once.
+    """
+
+    def verify(self):
+        super().verify()
+        if revoked_tokens.is_revoked(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_('Token is blacklisted'))
+
+    def blacklist(self):
+        if not revoked_tokens.revoke(self.payload[api_settings.JTI_CLAIM], self.payload['exp']):
+            raise TokenError(_('Token is blacklisted'))
+
+    def outstand(self):
+        # only revoked ids are kept, not every issued token
+        return None
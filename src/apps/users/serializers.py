@@ -1,8 +1,14 @@
 from django.contrib.auth import get_user_model
+from django.urls import reverse
 from rest_framework import serializers
+from rest_framework_simplejwt import serializers as jwt_serializers
 
+from src.apps.common.serializers import DynamicFieldsMixin
+from src.apps.users import passwords
+from src.apps.users.revocation import RefreshToken
 
-class UserSerializer(serializers.ModelSerializer):
+
+class UserSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = get_user_model()
         fields = [
@@ -25,17 +31,34 @@ class UserSerializer(serializers.ModelSerializer):
             'is_staff': {'read_only': True},
         }
 
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        if data.get('photo'):
+            # photos are private media, served through the permission-checked view
+            url = reverse('user-photo', kwargs={'pk': instance.pk})
+            request = self.context.get('request')
+            data['photo'] = request.build_absolute_uri(url) if request else url
+        return data
+
     def create(self, validated_data):
         user = self.Meta.model(**validated_data)
-        user.set_password(validated_data['password'])
+        passwords.set_password(user, validated_data['password'])
         user.save()
         return user
 
     def update(self, instance, validated_data):
         for attr, value in validated_data.items():
             if attr == 'password':
-                instance.set_password(value)
+                passwords.set_password(instance, value)
             else:
                 setattr(instance, attr, value)
         instance.save()
-        return instance
\ No newline at end of file
+        return instance
+
+
+class TokenRefreshSerializer(jwt_serializers.TokenRefreshSerializer):
+    token_class = RefreshToken
+
+
+class TokenRevokeSerializer(jwt_serializers.TokenBlacklistSerializer):
+    token_class = RefreshToken
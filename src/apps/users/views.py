@@ -1,16 +1,32 @@
-from django.contrib.auth import get_user_model
+from asgiref.sync import sync_to_async
+from django.contrib.auth import aauthenticate, get_user_model
+from django.contrib.auth.models import update_last_login
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
 from rest_framework.decorators import action
+from rest_framework.exceptions import AuthenticationFailed, NotFound, PermissionDenied
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 from rest_framework.viewsets import ModelViewSet
+from rest_framework_simplejwt import views as simplejwt_views
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
 
-from apps.hotel.serializers import BookingSerializer
+from apps.hotel.history import booking_history, encode_cursor, history_params
+from apps.hotel.serializers import ArchivedBookingSerializer, BookingSerializer
+from src.apps.common.media import protected_file_response
+from src.apps.common.views import SparseFieldsetMixin
+from src.apps.hotel.models import ArchivedBooking
+from src.apps.users import passwords
+from src.apps.users.filters import UserFilterBackend
 from src.apps.users.serializers import UserSerializer
 
 
-class UserViewSet(ModelViewSet):
+class UserViewSet(SparseFieldsetMixin, ModelViewSet):
     queryset = get_user_model().objects.all()
     serializer_class = UserSerializer
+    filter_backends = [UserFilterBackend]
 
     def get_permissions(self):
         if self.action == 'create':
@@ -26,7 +42,7 @@ class UserViewSet(ModelViewSet):
         return Response(serializer.data, status=201)
 
     def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset().filter(is_active=True)
+        queryset = self.filter_queryset(self.get_queryset().filter(is_active=True))
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
 
@@ -56,7 +72,87 @@ class UserViewSet(ModelViewSet):
 
     @action(detail=True)
     def bookings(self, request, pk=None):
+        """
+        The user's bookings, hot and archived, a page at a time; filters and
+        order are described in ``history_params`` and ``booking_history``.
+        """
         instance = self.get_object()
-        bookings = instance.bookings.all()
-        serializer = BookingSerializer(bookings, many=True)
-        return Response(serializer.data)
+        if instance != request.user and not request.user.is_staff:
+            raise PermissionDenied('You can only view your own bookings.')
+
+        bookings, next_key = booking_history(instance, **history_params(request.query_params))
+        next_url = None
+        if next_key is not None:
+            next_url = replace_query_param(request.build_absolute_uri(), 'cursor', encode_cursor(*next_key))
+        return Response({
+            'next': next_url,
+            'results': [
+                (ArchivedBookingSerializer if isinstance(booking, ArchivedBooking) else BookingSerializer)(booking).data
+                for booking in bookings
+            ],
+        })
+
+    @action(detail=True)
+    def photo(self, request, pk=None):
+        instance = self.get_object()
+        if instance != request.user and not request.user.is_staff:
+            raise PermissionDenied('You can only view your own photo.')
+
+        if not instance.photo:
+            raise NotFound('Photo not found.')
+
+        return protected_file_response(instance.photo)
+
+
+
+class TokenObtainPairView(View):
+    """
+    Drop-in replacement for simplejwt's ``TokenObtainPairView`` that awaits
+    ``aauthenticate()``, whose backend checks the password on the bounded
+    hashing pool; a full pool answers 503 instead of queueing more work.
+    Parsing, throttles, errors and rendering are left to simplejwt's own
+    view, so responses are the same as its. The worker is only freed while
+    the hash runs when served over ASGI (``src.config.asgi``); under WSGI
+    the request thread waits for it as before.
+    """
+    throttle_classes = None
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def post(self, request, *args, **kwargs):
+        view = self.get_api_view(request, *args, **kwargs)
+        try:
+            await sync_to_async(view.check_throttles)(view.request)
+            response = Response(await self.obtain(view.request))
+        except Exception as exc:
+            response = view.handle_exception(exc)
+            if isinstance(exc, passwords.PasswordHashingBusy):
+                response['Retry-After'] = '1'
+        return view.finalize_response(view.request, response, *args, **kwargs)
+
+    def get_api_view(self, request, *args, **kwargs):
+        """simplejwt's view, set up as its ``dispatch`` would be for ``request``."""
+        initkwargs = {} if self.throttle_classes is None else {'throttle_classes': self.throttle_classes}
+        view = simplejwt_views.TokenObtainPairView(**initkwargs)
+        view.setup(request, *args, **kwargs)
+        view.headers = view.default_response_headers
+        view.request = view.initialize_request(request, *args, **kwargs)
+        view.format_kwarg = view.get_format_suffix(**kwargs)
+        return view
+
+    async def obtain(self, request):
+        # the serializer's field validation only; its validate() would check the password synchronously
+        credentials = TokenObtainPairSerializer().to_internal_value(request.data)
+        user = await aauthenticate(request, **credentials)
+        if user is None or not jwt_settings.USER_AUTHENTICATION_RULE(user):
+            raise AuthenticationFailed(
+                TokenObtainPairSerializer.default_error_messages['no_active_account'], 'no_active_account',
+            )
+
+        if jwt_settings.UPDATE_LAST_LOGIN:
+            await sync_to_async(update_last_login)(None, user)
+
+        refresh = await sync_to_async(TokenObtainPairSerializer.get_token)(user)
+        return {'refresh': str(refresh), 'access': str(refresh.access_token)}
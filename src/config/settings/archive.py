@@ -0,0 +1,5 @@
+from datetime import timedelta
+
+BOOKING_ARCHIVE_AFTER: timedelta = timedelta(days=365) # closed bookings that checked out longer ago move to the archive tables
+
+BOOKING_ARCHIVE_BATCH_SIZE: int = 1000 # bookings moved per transaction
@@ -0,0 +1,26 @@
+from typing import Dict, List
+
+COMPRESSION_ENCODINGS: List[str] = ['zstd', 'br', 'gzip'] # server preference, codecs whose package is missing are skipped
+
+COMPRESSION_LEVELS: Dict[str, int] = {
+    'zstd': 3,
+    'br': 4,
+    'gzip': 6,
+}
+
+COMPRESSION_MIN_SIZE: int = 1024 # bytes, smaller bodies are not worth the CPU
+
+COMPRESSION_STREAM_FLUSH_SIZE: int = 16 * 1024 # input bytes buffered per flushed block of a streaming response
+
+COMPRESSION_CONTENT_TYPES: List[str] = [ # prefixes end with '/', images, archives and video are never compressed
+    'text/',
+    'application/json',
+    'application/x-ndjson',
+    'application/javascript',
+    'application/xml',
+    'image/svg+xml',
+]
+
+COMPRESSION_EXCLUDED_PATHS: List[str] = [ # responses carrying credentials are sent uncompressed (BREACH)
+    '/api/v1/auth/',
+]
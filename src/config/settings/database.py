@@ -0,0 +1,10 @@
+from datetime import timedelta
+from typing import List
+
+DATABASE_ROUTERS: List[str] = ['src.apps.common.routers.PrimaryReplicaRouter']
+
+DATABASE_STICKY_PRIMARY_WINDOW: timedelta = timedelta(seconds=10) # reads stay on the primary this long after a client writes, covering replication lag
+
+DATABASE_STICKY_PRIMARY_COOKIE: str = 'primary_until'
+
+DATABASE_STICKY_PRIMARY_CACHE: str = 'default' # holds the per-user windows; must be shared by all workers (e.g. Redis) when replicas are used
@@ -0,0 +1,3 @@
+BOOKING_HISTORY_PAGE_SIZE: int = 20 # bookings per page of a user's booking history
+
+BOOKING_HISTORY_MAX_PAGE_SIZE: int = 100 # upper bound for the page_size query parameter
@@ -0,0 +1,13 @@
+from datetime import timedelta
+from typing import List, Set
+
+IDEMPOTENCY_KEY_HEADER: str = 'Idempotency-Key'
+
+IDEMPOTENCY_KEY_TTL: timedelta = timedelta(hours=24) # stored responses are replayed for this long, then pruned
+
+IDEMPOTENCY_LOCK_TIMEOUT: timedelta = timedelta(seconds=60) # an unfinished request older than this is considered crashed and may be retried
+
+IDEMPOTENCY_METHODS: List[str] = ['POST', 'PUT', 'PATCH', 'DELETE']
+
+
+IDEMPOTENCY_RETRYABLE_STATUS_CODES: Set[int] = {408, 409, 429} # like server errors, these release the key instead of being replayed
\ No newline at end of file
@@ -1,13 +1,13 @@
 from datetime import timedelta
 
-from src.config.env import env
+from src.config.env import BASE_DIR, env
 
 
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=30),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
-    'ROTATE_REFRESH_TOKENS': False,
-    'BLACKLIST_AFTER_ROTATION': False,
+    'ROTATE_REFRESH_TOKENS': True,
+    'BLACKLIST_AFTER_ROTATION': True, # revokes the rotated token in JWT_REVOCATION_STORE
     'UPDATE_LAST_LOGIN': False,
 
     'ALGORITHM': 'HS256',
@@ -35,8 +35,13 @@ SIMPLE_JWT = {
     'SLIDING_TOKEN_REFRESH_LIFETIME': timedelta(days=1),
 
     'TOKEN_OBTAIN_SERIALIZER': 'rest_framework_simplejwt.serializers.TokenObtainPairSerializer',
-    'TOKEN_REFRESH_SERIALIZER': 'rest_framework_simplejwt.serializers.TokenRefreshSerializer',
+    'TOKEN_REFRESH_SERIALIZER': 'src.apps.users.serializers.TokenRefreshSerializer',
     'TOKEN_VERIFY_SERIALIZER': 'rest_framework_simplejwt.serializers.TokenVerifySerializer',
     'SLIDING_TOKEN_OBTAIN_SERIALIZER': 'rest_framework_simplejwt.serializers.TokenObtainSlidingSerializer',
     'SLIDING_TOKEN_REFRESH_SERIALIZER': 'rest_framework_simplejwt.serializers.TokenRefreshSlidingSerializer',
-}
\ No newline at end of file
+    'TOKEN_BLACKLIST_SERIALIZER': 'src.apps.users.serializers.TokenRevokeSerializer',
+}
+
+JWT_REVOCATION_STORE: str = env.str('JWT_REVOCATION_STORE', default='') or str(BASE_DIR / 'jwt_revocation.sqlite3') # SQLite file shared by the workers of a host
+
+JWT_REVOCATION_PRUNE_EVERY: int = 1000 # revocations between deletes of expired entries
\ No newline at end of file
@@ -0,0 +1 @@
+BOOKING_CANCEL_NO_SHOWS: bool = False # cancel bookings never activated by their check-out; changes what customers see, so opt-in
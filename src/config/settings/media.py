@@ -0,0 +1,12 @@
+from typing import List
+
+from src.config.env import env
+
+
+PUBLIC_MEDIA_PREFIXES: List[str] = ['amenities/', 'room_images/'] # everything else under MEDIA_ROOT is served only through permission-checked views
+
+PROTECTED_MEDIA_SERVER: str = env.str('DJANGO_PROTECTED_MEDIA_SERVER', default='') # 'nginx' (X-Accel-Redirect), 'apache' (X-Sendfile) or '' to stream from Django
+
+PROTECTED_MEDIA_INTERNAL_URL: str = env.str('DJANGO_PROTECTED_MEDIA_INTERNAL_URL', default='/protected-media/') # nginx `internal` location aliased to MEDIA_ROOT
+
+PROTECTED_MEDIA_MAX_AGE: int = 300 # seconds, private browser caching only
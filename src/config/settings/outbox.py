@@ -0,0 +1,9 @@
+from datetime import timedelta
+
+OUTBOX_RETENTION: timedelta = timedelta(days=7) # older events are compacted to the latest one per object
+
+OUTBOX_TOMBSTONE_RETENTION: timedelta = timedelta(days=30) # deletion and archival events are kept this long, then dropped
+
+OUTBOX_BATCH_SIZE: int = 1000
+
+CHANGE_FEED_MAX_LIMIT: int = 10000 # events per feed response
@@ -0,0 +1,36 @@
+import os
+from typing import Dict, List
+
+from src.config.env import env
+
+
+PASSWORD_HASHER: str = env.str('DJANGO_PASSWORD_HASHER', default='pbkdf2') # hasher for new hashes; argon2 needs argon2-cffi
+
+PASSWORD_HASHER_PATHS: Dict[str, str] = {
+    'pbkdf2': 'src.apps.users.hashers.PBKDF2PasswordHasher',
+    'argon2': 'src.apps.users.hashers.Argon2PasswordHasher',
+    'scrypt': 'django.contrib.auth.hashers.ScryptPasswordHasher',
+}
+
+# the preferred hasher first; the others still verify older hashes, which are rehashed on login
+PASSWORD_HASHERS: List[str] = [
+    PASSWORD_HASHER_PATHS[PASSWORD_HASHER],
+    *(path for name, path in PASSWORD_HASHER_PATHS.items() if name != PASSWORD_HASHER),
+]
+
+PASSWORD_PBKDF2_ITERATIONS: int = env.int('DJANGO_PASSWORD_PBKDF2_ITERATIONS', default=1_000_000)
+
+PASSWORD_ARGON2_TIME_COST: int = env.int('DJANGO_PASSWORD_ARGON2_TIME_COST', default=2)
+
+PASSWORD_ARGON2_MEMORY_COST: int = env.int('DJANGO_PASSWORD_ARGON2_MEMORY_COST', default=102400) # KiB
+
+PASSWORD_ARGON2_PARALLELISM: int = env.int('DJANGO_PASSWORD_ARGON2_PARALLELISM', default=8)
+
+# aauthenticate() verifies on the hashing pool; authenticate() is ModelBackend's
+AUTHENTICATION_BACKENDS: List[str] = ['src.apps.users.backends.PooledPasswordBackend']
+
+PASSWORD_HASHING_EXECUTOR: str = env.str('DJANGO_PASSWORD_HASHING_EXECUTOR', default='thread') # thread or process; both hashers release the GIL
+
+PASSWORD_HASHING_WORKERS: int = env.int('DJANGO_PASSWORD_HASHING_WORKERS', default=os.cpu_count() or 1) # hashes computed at once per server process
+
+PASSWORD_HASHING_QUEUE: int = 32 # hashes allowed to wait for a worker before requests are turned away with 503
@@ -0,0 +1,19 @@
+from datetime import timedelta
+from typing import Dict
+
+from src.config.env import env
+
+
+PAYMENT_PROVIDER: str = env.str('DJANGO_PAYMENT_PROVIDER', default='') # provider new payments are registered with; required, 'fake' is for local testing only
+
+PAYMENT_PROVIDERS: Dict[str, str] = {
+    'fake': 'src.apps.hotel.payments.FakePaymentProvider',
+}
+
+PAYMENT_RECONCILE_BATCH_SIZE: int = 1000 # pending payments loaded and updated per pass
+
+PAYMENT_RECONCILE_CONCURRENCY: int = 4 # status requests in flight per provider at once
+
+FAKE_PAYMENT_SETTLE_AFTER: timedelta = timedelta(seconds=30) # the fake provider settles payments this long after registration
+
+FAKE_PAYMENT_FAILURE_RATE: float = 0.05 # share of fake payments that end up canceled
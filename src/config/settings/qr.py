@@ -0,0 +1,10 @@
+from datetime import timedelta
+
+from src.config.env import env
+
+
+QR_CODE_SIGNING_KEY: str = env.str('QR_CODE_SIGNING_KEY', default='') # falls back to SECRET_KEY when empty
+
+QR_CODE_VALIDITY_LEEWAY: timedelta = timedelta(hours=2) # codes stay valid this long after check-out
+
+QR_REVOCATION_REFRESH_INTERVAL: timedelta = timedelta(seconds=10) # other workers accept a code blacklisted elsewhere for up to this long
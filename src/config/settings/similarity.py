@@ -0,0 +1,12 @@
+SIMILAR_ROOMS_TOP_K: int = 10 # similar rooms stored per room
+
+SIMILAR_ROOMS_WEIGHTS: dict = { # share of each signal in the similarity score; run refresh_similar_rooms --full after changing
+    'amenities': 0.4,
+    'category': 0.2,
+    'price': 0.2,
+    'co_booking': 0.2,
+}
+
+SIMILAR_ROOMS_PRICE_BAND: float = 0.5 # relative price difference at which rooms stop counting as priced alike
+
+SIMILAR_ROOMS_BATCH_SIZE: int = 500 # rooms whose lists are rewritten per transaction
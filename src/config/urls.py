@@ -6,4 +6,8 @@ from django.conf.urls.static import static
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/', include('src.apps.core.urls')),
-] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+]
+
+# private media (QR codes, user photos) is only reachable through the API
+for prefix in settings.PUBLIC_MEDIA_PREFIXES:
+    urlpatterns += static(settings.MEDIA_URL + prefix, document_root=settings.MEDIA_ROOT / prefix)